@@ -11,12 +11,12 @@ Strategy:
 import sqlite3
 import time
 import random
-import requests
 from bs4 import BeautifulSoup
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 
-from config.keyword_settings import USER_AGENTS
+from scraper.core.http_client import get_default_client
+from scraper.core.retry_policy import RetryPolicy, fetch_with_retry
 
 DB_PATH = Path(__file__).resolve().parent / 'data' / 'database' / 'jobs_master.db'
 
@@ -25,20 +25,8 @@ MAX_DELAY = 10
 BATCH_SIZE = 15
 BATCH_PAUSE = 90  # seconds — going slow, no hurry
 
-
-def get_headers():
-    return {
-        'User-Agent': random.choice(USER_AGENTS),
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Sec-Fetch-User': '?1',
-    }
+# Shared across companies so a host's circuit breaker sees every failure
+RETRY_POLICY = RetryPolicy()
 
 
 def is_job_expired(soup):
@@ -107,23 +95,17 @@ def normalize_url(url):
     return urlunparse(parsed._replace(netloc='www.linkedin.com'))
 
 
-def scrape_with_retry(job_url, max_retries=3):
+def scrape_with_retry(job_url, policy=None):
     job_url = normalize_url(job_url)
-    for attempt in range(max_retries):
-        try:
-            resp = requests.get(job_url, headers=get_headers(), timeout=15)
-            if resp.status_code == 429:
-                wait = 60 * (attempt + 1)
-                print(f"  ⚠️  Rate limited. Waiting {wait}s...")
-                time.sleep(wait)
-                continue
-            resp.raise_for_status()
-            return BeautifulSoup(resp.content, 'html.parser')
-        except requests.RequestException as e:
-            print(f"  ❌ Request error (attempt {attempt + 1}): {e}")
-            if attempt < max_retries - 1:
-                time.sleep(15)
-    return None
+
+    def on_retry(attempt, delay, response, error):
+        reason = error or f"HTTP {response.status_code}"
+        print(f"  ⚠️  {reason}. Retry {attempt} in {delay:.0f}s...")
+
+    resp = fetch_with_retry(get_default_client(), job_url, policy or RETRY_POLICY, on_retry=on_retry)
+    if resp is None:
+        return None
+    return BeautifulSoup(resp.content, 'html.parser')
 
 
 def main():
@@ -0,0 +1,181 @@
+"""End-to-end benchmark of main.py's pipeline against the local replay server.
+
+Usage (from the project root):
+    python -m benchmarks.pipeline_benchmark
+    python -m benchmarks.pipeline_benchmark --latency-ms 80 200 --rate-limit-ratio 0.02
+    python -m benchmarks.pipeline_benchmark --archive   # replay recorded pages
+
+Runs multiple_search() and analyze_keywords() on a throwaway database and
+reports jobs/sec, requests/sec and time per stage. No request leaves the
+machine.
+"""
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+import main
+from benchmarks.replay_server import ReplayServer, ArchiveSource, SyntheticSource
+from scraper.core.detail_scraper import DetailScraper
+from scraper.core.egress import EgressPool, EgressRoute
+from scraper.core.http_client import HttpClient, set_default_client
+from scraper.core.parse_pool import ParsePool
+from scraper.core.rate_limiter import HostRateLimiter
+
+
+def run_benchmark(source=None, latency=(0.0, 0.0), rate_limit_ratio=0.0, timeout_ratio=0.0,
+                  search_rps=50.0, detail_rps=50.0, detail_concurrency=8, search_workers=None,
+                  read_timeout=5, parse_workers=None, egress_routes=0, egress_rps=5.0,
+                  seed=1, quiet=True):
+    """
+    Run the full search + analysis pipeline against a ReplayServer.
+
+    With parse_workers set, pages are parsed in a ParsePool of that many
+    processes (0 = CPU count) instead of the fetching threads.
+
+    With egress_routes > 0, that many replay servers act as stand-in HTTP
+    proxies, each reached through an EgressRoute limited to egress_rps, and
+    the server counters are summed over them.
+
+    Returns:
+        dict with per-stage timings, job counts and server request counters
+    """
+    servers = [
+        ReplayServer(
+            source=source,
+            latency=latency,
+            rate_limit_ratio=rate_limit_ratio,
+            timeout_ratio=timeout_ratio,
+            timeout_delay=read_timeout + 1,
+            seed=seed + i,
+        )
+        for i in range(max(1, egress_routes))
+    ]
+    if egress_routes:
+        pool = EgressPool([
+            EgressRoute(f"proxy-{i}", proxy=server.url, rate=egress_rps, burst=1)
+            for i, server in enumerate(servers)
+        ])
+        # Plain http so the stand-in proxies get absolute-form requests, not CONNECT
+        client = HttpClient(origin="http://www.linkedin.com", read_timeout=read_timeout, egress_pool=pool)
+    else:
+        client = HttpClient(origin=servers[0].url, read_timeout=read_timeout)
+    previous_client = set_default_client(client)
+    output = io.StringIO() if quiet else None
+    parse_pool = None
+
+    try:
+        parse_pool = ParsePool(workers=parse_workers) if parse_workers is not None else None
+        with tempfile.TemporaryDirectory() as tmp, contextlib.ExitStack() as stack:
+            for server in servers:
+                stack.enter_context(server)
+            db_file = Path(tmp) / 'bench.db'
+            redirect = contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext()
+
+            with redirect:
+                start = time.perf_counter()
+                search_results = main.multiple_search(
+                    max_workers=search_workers,
+                    db_file=db_file,
+                    rate_limiter=HostRateLimiter(search_rps, burst=1),
+                    parse_pool=parse_pool,
+                )
+                search_time = time.perf_counter() - start
+
+                detail_scraper = DetailScraper(
+                    concurrency=detail_concurrency,
+                    requests_per_second=detail_rps,
+                    parse_pool=parse_pool,
+                )
+                start = time.perf_counter()
+                analysis_results = main.analyze_keywords(db_file=db_file, detail_scraper=detail_scraper, top_n=0)
+                analysis_time = time.perf_counter() - start
+    finally:
+        # Later code in the same process must not keep talking to the stand-in servers
+        set_default_client(previous_client)
+        client.close()
+        if parse_pool:
+            parse_pool.close()
+
+    counts = {}
+    for server in servers:
+        for key, value in server.counts.items():
+            counts[key] = counts.get(key, 0) + value
+    total_requests = counts.get('search_requests', 0) + counts.get('detail_requests', 0)
+    total_time = search_time + analysis_time
+    jobs_found = sum(len(r.jobs) for r in search_results)
+
+    return {
+        'search_time': search_time,
+        'analysis_time': analysis_time,
+        'total_time': total_time,
+        'jobs_found': jobs_found,
+        'jobs_analyzed': len(analysis_results),
+        'requests': total_requests,
+        'jobs_per_second': len(analysis_results) / analysis_time if analysis_time else 0.0,
+        'requests_per_second': total_requests / total_time if total_time else 0.0,
+        'server_counts': counts,
+    }
+
+
+def print_report(report):
+    """Print a benchmark report."""
+    counts = report['server_counts']
+    print("=" * 50)
+    print("PIPELINE BENCHMARK")
+    print("=" * 50)
+    print(f"Search stage:   {report['search_time']:8.2f}s  ({report['jobs_found']} listings, "
+          f"{counts.get('search_requests', 0)} requests)")
+    print(f"Analysis stage: {report['analysis_time']:8.2f}s  ({report['jobs_analyzed']} jobs, "
+          f"{counts.get('detail_requests', 0)} requests)")
+    print(f"Total:          {report['total_time']:8.2f}s")
+    print("-" * 50)
+    print(f"Jobs/sec (analysis): {report['jobs_per_second']:.2f}")
+    print(f"Requests/sec:        {report['requests_per_second']:.2f}")
+    print(f"Responses: 200={counts.get('status_200', 0)} 429={counts.get('status_429', 0)} "
+          f"404={counts.get('status_404', 0)} timeouts={counts.get('timeouts', 0)}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline end-to-end pipeline benchmark")
+    parser.add_argument("--archive", action="store_true",
+                        help="Replay pages recorded in data/archive instead of synthetic ones")
+    parser.add_argument("--jobs-per-query", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, nargs=2, default=(50, 150), metavar=("MIN", "MAX"))
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0)
+    parser.add_argument("--timeout-ratio", type=float, default=0.0)
+    parser.add_argument("--search-rps", type=float, default=50.0)
+    parser.add_argument("--detail-rps", type=float, default=50.0)
+    parser.add_argument("--detail-concurrency", type=int, default=8)
+    parser.add_argument("--search-workers", type=int, default=None)
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Parse in this many processes (0 = CPU count; default: inline)")
+    parser.add_argument("--egress-routes", type=int, default=0,
+                        help="Send traffic through this many stand-in proxies")
+    parser.add_argument("--egress-rps", type=float, default=5.0, help="Requests/sec per egress route")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline output")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    source = ArchiveSource() if args.archive else SyntheticSource(jobs_per_query=args.jobs_per_query)
+    report = run_benchmark(
+        source=source,
+        latency=(args.latency_ms[0] / 1000, args.latency_ms[1] / 1000),
+        rate_limit_ratio=args.rate_limit_ratio,
+        timeout_ratio=args.timeout_ratio,
+        search_rps=args.search_rps,
+        detail_rps=args.detail_rps,
+        detail_concurrency=args.detail_concurrency,
+        search_workers=args.search_workers,
+        parse_workers=args.parse_workers,
+        egress_routes=args.egress_routes,
+        egress_rps=args.egress_rps,
+        seed=args.seed,
+        quiet=not args.verbose,
+    )
+    print_report(report)
@@ -0,0 +1,234 @@
+"""Local stand-in for LinkedIn that replays recorded or synthetic pages.
+
+Point the scraper at it with HttpClient(origin=server.url). Search and
+detail pages come from the raw page archive (data/archive, recorded with
+HTML_ARCHIVE_ENABLED) or are generated deterministically. Latency, 429
+responses and timeouts can be injected to exercise scheduling code.
+"""
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from utils.html_archive import HtmlArchive
+
+JOB_ID_RE = re.compile(r'/jobs/view/[^/]*?(\d{5,})')
+
+SYNTHETIC_DESCRIPTION = (
+    "We are looking for a Backend developer with Java and Spring Boot experience. "
+    "You will build microservices with PostgreSQL, Docker and Git, write JUnit and "
+    "Mockito tests and work in an Agile Scrum team. Python and SQL are a plus. "
+    "Semi Senior / Ssr profiles are welcome."
+)
+
+
+class ArchiveSource:
+    """Serves the latest archived body for every recorded URL."""
+
+    def __init__(self, archive=None):
+        self.archive = archive or HtmlArchive()
+        self.search_pages = {}
+        self.detail_pages = {}
+        for entry in self.archive.get_latest_fetches():
+            parts = urlsplit(entry['url'])
+            if entry['kind'] == 'detail':
+                match = JOB_ID_RE.search(parts.path)
+                if match:
+                    self.detail_pages[match.group(1)] = entry['sha256']
+            else:
+                self.search_pages[f"{parts.path}?{parts.query}"] = entry['sha256']
+
+    def search_page(self, path, query):
+        sha256 = self.search_pages.get(f"{path}?{query}")
+        # Unknown offsets behave like LinkedIn past the last page: an empty fragment
+        return self.archive.load(sha256) if sha256 else b""
+
+    def detail_page(self, job_id):
+        sha256 = self.detail_pages.get(job_id)
+        return self.archive.load(sha256) if sha256 else None
+
+
+class SyntheticSource:
+    """Generates deterministic search fragments and detail pages.
+
+    Job IDs depend on the keywords, and queries for the same keywords in
+    different locations share half their postings, like the real templates.
+    """
+
+    def __init__(self, jobs_per_query=40, page_size=10):
+        self.jobs_per_query = jobs_per_query
+        self.page_size = page_size
+
+    def _job_ids(self, params):
+        keywords = params.get('keywords', [''])[0]
+        location = params.get('location', [''])[0]
+        base = 3_000_000_000 + (zlib.crc32(keywords.encode()) % 100_000) * 1_000
+        offset = (zlib.crc32(location.encode()) % 2) * (self.jobs_per_query // 2)
+        return [str(base + offset + i) for i in range(self.jobs_per_query)]
+
+    def search_page(self, path, query):
+        params = parse_qs(query)
+        start = int(params.get('start', ['0'])[0])
+        job_ids = self._job_ids(params)
+        if params.get('sortBy') == ['DD']:
+            job_ids = job_ids[::-1]
+        page_ids = job_ids[start:start + self.page_size]
+        keywords = params.get('keywords', ['Developer'])[0]
+        cards = "".join(
+            f'<li><div class="base-card base-search-card job-search-card">'
+            f'<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/job-{job_id}"></a>'
+            f'<h3 class="base-search-card__title">{keywords} Developer {job_id[-3:]}</h3>'
+            f'<h4 class="base-search-card__subtitle">'
+            f'<a href="https://www.linkedin.com/company/company-{int(job_id) % 37}">Company {int(job_id) % 37}</a></h4>'
+            f'<span class="job-search-card__location">Buenos Aires, Argentina</span>'
+            f'<time class="job-search-card__listdate" datetime="2026-10-17">1 hour ago</time>'
+            f'</div></li>'
+            for job_id in page_ids
+        )
+        return cards.encode('utf-8')
+
+    def detail_page(self, job_id):
+        applicants = int(job_id) % 250
+        return (
+            f'<html><body><section class="top-card-layout">'
+            f'<figcaption class="num-applicants__caption">{applicants} applicants</figcaption></section>'
+            f'<div class="show-more-less-html__markup"><p>{SYNTHETIC_DESCRIPTION}</p></div>'
+            f'<ul><li class="description__job-criteria-item">'
+            f'<h3 class="description__job-criteria-subheader">Seniority level</h3>'
+            f'<span class="description__job-criteria-text">Entry level</span></li></ul>'
+            f'</body></html>'
+        ).encode('utf-8')
+
+
+class ReplayServer:
+    """Threaded HTTP server answering search and detail requests from a page source."""
+
+    def __init__(self, source=None, host='127.0.0.1', port=0,
+                 latency=(0.0, 0.0), rate_limit_ratio=0.0, timeout_ratio=0.0,
+                 timeout_delay=30.0, retry_after=1, seed=None):
+        """
+        Initialize the server.
+
+        Args:
+            source: ArchiveSource or SyntheticSource (default: SyntheticSource())
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            latency: (min, max) seconds added before every response
+            rate_limit_ratio: Fraction of requests answered with 429
+            timeout_ratio: Fraction of requests that stall for timeout_delay
+            timeout_delay: Seconds a stalled request hangs before answering
+            retry_after: Retry-After header value sent with 429 responses
+            seed: Random seed for reproducible fault injection
+        """
+        self.source = source or SyntheticSource()
+        self.latency = latency
+        self.rate_limit_ratio = rate_limit_ratio
+        self.timeout_ratio = timeout_ratio
+        self.timeout_delay = timeout_delay
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.counts = Counter()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _count(self, key):
+        with self._lock:
+            self.counts[key] += 1
+
+    def _roll_fault(self):
+        """Decide this request's fate: (delay, fault) with fault in {None, '429', 'timeout'}."""
+        with self._lock:
+            delay = self.random.uniform(*self.latency)
+            roll = self.random.random()
+        if roll < self.rate_limit_ratio:
+            return delay, '429'
+        if roll < self.rate_limit_ratio + self.timeout_ratio:
+            return delay + self.timeout_delay, 'timeout'
+        return delay, None
+
+    def respond(self, path, query):
+        """Return (status, headers, body) for a request; also used by the handler."""
+        if '/jobs/view/' in path:
+            kind = 'detail'
+        elif '/jobs' in path and 'search' in path:
+            kind = 'search'
+        else:
+            kind = 'other'
+        self._count(f"{kind}_requests")
+
+        delay, fault = self._roll_fault()
+        if delay:
+            time.sleep(delay)
+
+        if fault == '429':
+            self._count('status_429')
+            return 429, {'Retry-After': str(self.retry_after)}, b""
+        if fault == 'timeout':
+            self._count('timeouts')
+
+        body = None
+        if kind == 'search':
+            body = self.source.search_page(path, query)
+        elif kind == 'detail':
+            match = JOB_ID_RE.search(path)
+            body = self.source.detail_page(match.group(1)) if match else None
+
+        if body is None:
+            self._count('status_404')
+            return 404, {}, b""
+        self._count('status_200')
+        return 200, {'Content-Type': 'text/html; charset=utf-8'}, body
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                # Proxy-form requests carry an absolute URL
+                parts = urlsplit(self.path)
+                status, headers, body = server.respond(parts.path, parts.query)
+                try:
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client gave up (timeout injection)
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
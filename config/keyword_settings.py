@@ -5,8 +5,50 @@ SCRAPE_MIN_DELAY = 2      # seconds minimum delay between requests
 SCRAPE_MAX_DELAY = 4      # seconds maximum delay (avg = 3s)
 BATCH_SIZE = 50           # jobs per batch before pause
 BATCH_PAUSE = 30          # seconds pause between batches
-RETRY_DELAY = 60          # seconds wait on 429 error
-MAX_RETRIES = 3           # max retries per job on rate limit
+
+# Retry policy shared by all fetchers (scraper/core/retry_policy.py)
+MAX_RETRIES = 3                   # retries per URL after 429, 5xx or network errors
+RETRY_BASE_DELAY = 5              # seconds before the first retry (doubles per attempt, with jitter)
+RETRY_MAX_DELAY = 300             # backoff ceiling (Retry-After is honored as sent)
+CIRCUIT_BREAKER_THRESHOLD = 5     # consecutive failures that open a host's circuit
+CIRCUIT_BREAKER_COOLDOWN = 120    # seconds a host is left alone before a trial request
+
+# Concurrent detail fetching (replaces the per-request delays above)
+DETAIL_ASYNC = True               # fetch detail pages with the asyncio pipeline
+DETAIL_CONCURRENCY = 4            # max detail requests in flight
+DETAIL_REQUESTS_PER_SECOND = 1.0  # global ceiling across all in-flight requests
+DETAIL_STOP_CHECK_EVERY = 20      # jobs fetched between shutdown checks when a stop flag is given (daemon)
+
+# Durable detail work queue (python main.py work): leased batches, retried with backoff
+DETAIL_QUEUE_WORKERS = 2              # worker processes per host
+DETAIL_QUEUE_BATCH_SIZE = 20          # jobs claimed per lease
+DETAIL_QUEUE_LEASE_SECONDS = 600      # unacked claims return to the queue after this
+DETAIL_QUEUE_MAX_ATTEMPTS = 3         # fetch attempts before a job is recorded as failed
+DETAIL_QUEUE_RETRY_DELAY = 60         # seconds before the first retry (doubles per attempt)
+
+# Pre-fetch filter: jobs dropped before any detail request (blacklisted companies always are)
+PREFETCH_FILTER_ENABLED = True
+TITLE_INCLUDE_PATTERNS = []           # title regexes of which one must match (empty = any title)
+TITLE_EXCLUDE_PATTERNS = []           # title regexes never worth a request, e.g. r"\bsales\b" (case-insensitive)
+
+# Detail fetch order: listings are pre-scored from title/company/location, best first
+FETCH_PRIORITY_ENABLED = True         # fetch in predicted-score order instead of job ID order
+FETCH_PRIORITY_AGING_PER_HOUR = 1.0   # priority gained per hour of waiting, so nothing starves
+
+# Offline re-scoring of stored descriptions (python main.py rescore)
+RESCORE_BATCH_SIZE = 500              # descriptions per worker task and per write transaction
+RESCORE_ON_ANALYZE = True             # bring older jobs' scores up to date after each analysis run
+
+# Near-duplicate detection (scraper/core/near_duplicates.py): reposts inherit their cluster's analysis
+DEDUP_ENABLED = True                  # fingerprint analyzed jobs and skip fetching confirmed reposts
+DEDUP_SIMILARITY = 0.8                # estimated description Jaccard similarity of a repost
+DEDUP_NUM_PERM = 64                   # MinHash signature length
+DEDUP_BANDS = 16                      # LSH bands of 4 rows: ~100% recall at 0.8, candidates are then verified
+DEDUP_SHINGLE_SIZE = 5                # words per shingle
+DEDUP_MIN_CLUSTER_SIZE = 2            # postings a cluster needs before its title/company is trusted (inherited reposts count)
+
+# 'partial' builds only the description/applicants/criteria subtrees, 'full' the whole DOM
+DETAIL_PARSE_MODE = 'partial'
 
 # User agent rotation pool
 USER_AGENTS = [
@@ -2,16 +2,33 @@
 Main entry point for the Job Scraper application
 """
 
+import argparse
 import logging
 import os
 import time
-import random
+from concurrent.futures import ProcessPoolExecutor
 from logging.handlers import RotatingFileHandler
 
-from scraper import JobScraper, SearchConfig
+from scraper import JobScraper
 from scraper.models.keyword_config import KeywordConfig
 from scraper.core.keyword_matcher import KeywordMatcher
+from scraper.core.batch_search import BatchSearchEngine
+from scraper.core.known_job_index import KnownJobIndex
+from scraper.core.near_duplicates import NearDuplicateIndex
+from scraper.core.fetch_priority import FetchPriority
+from scraper.core.prefetch_filter import PrefetchFilter
+from scraper.core.detail_scraper import DetailScraper
+from scraper.core.parse_pool import ParsePool
+from scraper.core.search_plan import SearchPlan
+from scraper.core.template_scheduler import TemplateScheduler
+from scraper.core.reextract import reextract_archive
+from scraper.core.rescore import rescore_job_posts
+from scraper.analyzers.term_matrix import TermMatrix
+from scraper.core.rate_limiter import HostRateLimiter
+from scraper.core.http_client import get_default_client
 from utils.sqlite_storage import SQLiteStorage
+from utils.daemon import ScraperDaemon
+from utils.work_queue import DetailWorkQueue, default_owner
 
 
 def setup_logging():
@@ -42,36 +59,63 @@ def setup_logging():
     return logger
 
 
-def multiple_search():
-    """Run multiple predefined searches"""
-    from config.settings import SEARCH_TEMPLATES
+def multiple_search(max_workers=None, db_file=None, rate_limiter=None, parse_pool=None,
+                    use_schedule=None, storage=None, known_ids=None):
+    """Run multiple predefined searches concurrently (parsing in parse_pool, if given)
 
-    logger = logging.getLogger()
-    scraper = JobScraper()
-    total_jobs_found = 0
+    With use_schedule (default: SEARCH_SCHEDULER_ENABLED) only the queries
+    due by their yield-adaptive schedule run. A long-running caller passes
+    its open storage and known_ids so they are not rebuilt every run.
+    """
+    from config.settings import SEARCH_TEMPLATES, SEARCH_DEDUP_KNOWN_IDS, SEARCH_SCHEDULER_ENABLED
 
-    logger.info("STARTING BATCH SEARCH")
-    print("="*50)
+    if use_schedule is None:
+        use_schedule = SEARCH_SCHEDULER_ENABLED
 
-    for i, template in enumerate(SEARCH_TEMPLATES, 1):
-        search_name = template.pop("name", f"Search {i}")
-        logger.info(f"Search {i}/{len(SEARCH_TEMPLATES)}: {search_name}")
-        print("-" * 40)
+    logger = logging.getLogger()
+    storage = storage or SQLiteStorage(db_file)
+
+    if known_ids is None and SEARCH_DEDUP_KNOWN_IDS:
+        known_ids = KnownJobIndex.from_storage(storage)
+        logger.info(f"Loaded known job index: {known_ids}")
+
+    engine = BatchSearchEngine(
+        scraper=JobScraper(sqlite_storage=storage, parse_pool=parse_pool),
+        max_workers=max_workers,
+        rate_limiter=rate_limiter,
+        known_ids=known_ids,
+        scheduler=TemplateScheduler(storage) if use_schedule else None,
+    )
+    scraper = engine.scraper
+    plan = engine.plan(SEARCH_TEMPLATES)
 
-        search_config = SearchConfig(**template)
-        jobs = scraper.search_jobs(search_config, save_results=True)
-        total_jobs_found += len(jobs)
+    logger.info(
+        f"STARTING BATCH SEARCH ({len(plan.templates)} templates -> {len(plan)} queries, "
+        f"up to {plan.expected_requests(engine.paginate)} requests, {engine.max_workers} workers)"
+    )
+    print("="*50)
 
-        logger.info(f"Found {len(jobs)} jobs in search '{search_name}'")
+    start = time.perf_counter()
+    results = engine.run(plan, save_results=True)
+    elapsed = time.perf_counter() - start
 
-        # Random delay between searches to avoid rate limiting
-        if i < len(SEARCH_TEMPLATES):
-            delay = random.uniform(2, 4)
-            logger.info(f"Waiting {delay:.1f}s before next search...")
-            time.sleep(delay)
+    total_jobs_found = 0
+    for i, result in enumerate(results, 1):
+        total_jobs_found += len(result.jobs)
+        if result.ok:
+            logger.info(
+                f"Search {i}/{len(results)}: '{result.name}' found {len(result.jobs)} jobs "
+                f"in {result.elapsed:.1f}s"
+                + (f" (shared with {', '.join(result.shared_with)})" if result.shared_with else "")
+            )
+        else:
+            logger.warning(f"Search {i}/{len(results)}: '{result.name}' failed: {result.error}")
+
+    if engine.scheduler:
+        engine.scheduler.print_report()
 
     # Show final statistics
-    logger.info(f"BATCH SEARCH COMPLETE - Total jobs found: {total_jobs_found}")
+    logger.info(f"BATCH SEARCH COMPLETE - Total jobs found: {total_jobs_found} in {elapsed:.1f}s")
 
     # Show DB statistics
     stats = scraper.sqlite_storage.get_stats()
@@ -82,8 +126,12 @@ def multiple_search():
             f"Locations: {stats['unique_locations']}"
         )
 
+    return results
+
 
-def analyze_keywords(keywords=None, weights=None, skip_analyzed=True, top_n=20):
+def analyze_keywords(keywords=None, weights=None, skip_analyzed=True, top_n=20,
+                     db_file=None, detail_scraper=None, analyzed_ids=None, parse_pool=None,
+                     storage=None, near_duplicates=None, should_stop=None):
     """
     Analyze stored jobs for keyword matches.
 
@@ -92,8 +140,19 @@ def analyze_keywords(keywords=None, weights=None, skip_analyzed=True, top_n=20):
         weights: Optional dict of keyword weights
         skip_analyzed: Skip jobs already analyzed with these keywords
         top_n: Number of top results to display
+        db_file: SQLite database path (default: data/database/jobs_master.db)
+        detail_scraper: DetailScraper to fetch pages with (default: a new one)
+        analyzed_ids: KnownJobIndex of analyzed jobs to skip before fetching
+        parse_pool: ParsePool for the default detail scraper to parse pages in
+        storage: Open SQLiteStorage to use instead of opening db_file
+        near_duplicates: NearDuplicateIndex to reuse (default: loaded if DEDUP_ENABLED)
+        should_stop: Callable returning True once shutdown was requested; analysis
+            then stops after the current batch of detail fetches and skips rescoring
     """
-    from config.keyword_settings import DEFAULT_KEYWORDS, WEIGHTED_KEYWORDS
+    from config.keyword_settings import (
+        DEFAULT_KEYWORDS, WEIGHTED_KEYWORDS, RESCORE_ON_ANALYZE, DEDUP_ENABLED, FETCH_PRIORITY_ENABLED,
+        PREFETCH_FILTER_ENABLED,
+    )
 
     logger = logging.getLogger()
 
@@ -113,12 +172,28 @@ def analyze_keywords(keywords=None, weights=None, skip_analyzed=True, top_n=20):
     )
 
     # Initialize storage and matcher
-    storage = SQLiteStorage()
-    matcher = KeywordMatcher(storage, keyword_config)
+    storage = storage or SQLiteStorage(db_file)
+    if detail_scraper is None and parse_pool is not None:
+        detail_scraper = DetailScraper(parse_pool=parse_pool)
+    if near_duplicates is None and DEDUP_ENABLED:
+        near_duplicates = NearDuplicateIndex(storage)
+    matcher = KeywordMatcher(
+        storage, keyword_config,
+        detail_scraper=detail_scraper,
+        analyzed_ids=analyzed_ids,
+        near_duplicates=near_duplicates,
+        priority=FetchPriority(keyword_config) if FETCH_PRIORITY_ENABLED else None,
+        prefetch_filter=PrefetchFilter() if PREFETCH_FILTER_ENABLED else None,
+        should_stop=should_stop,
+    )
 
     # Run analysis
     results = matcher.analyze_jobs(skip_analyzed=skip_analyzed)
 
+    # Jobs analyzed under other keywords/weights: count only the missing keywords
+    if RESCORE_ON_ANALYZE and not (should_stop and should_stop()):
+        rescore_job_posts(storage, keyword_config)
+
     # Display results
     if results:
         matcher.display_results(results, top_n=top_n)
@@ -136,16 +211,396 @@ def analyze_keywords(keywords=None, weights=None, skip_analyzed=True, top_n=20):
     return results
 
 
+def _queue_worker(db_file, requests_per_second):
+    """Worker process body for work(): drain the detail queue."""
+    from config.keyword_settings import DEFAULT_KEYWORDS, WEIGHTED_KEYWORDS, DEDUP_ENABLED
+
+    storage = SQLiteStorage(db_file)
+    matcher = KeywordMatcher(
+        storage,
+        KeywordConfig(keywords=DEFAULT_KEYWORDS, weights=WEIGHTED_KEYWORDS),
+        detail_scraper=DetailScraper(requests_per_second=requests_per_second),
+        near_duplicates=NearDuplicateIndex(storage, backfill=False) if DEDUP_ENABLED else None,
+    )
+    return matcher.drain_queue(DetailWorkQueue(storage), default_owner())
+
+
+def work(workers=None, db_file=None):
+    """
+    Queue the analysis backlog and drain it with worker processes.
+
+    Workers lease batches from the detail_queue table, so the command can
+    also run on several hosts sharing the database, and a crashed run is
+    resumed by the next one (expired leases are claimed again).
+
+    Args:
+        workers: Worker processes on this host (default: DETAIL_QUEUE_WORKERS)
+        db_file: SQLite database path (default: data/database/jobs_master.db)
+    """
+    from config.keyword_settings import (
+        DEFAULT_KEYWORDS, WEIGHTED_KEYWORDS, DETAIL_QUEUE_WORKERS, DETAIL_REQUESTS_PER_SECOND,
+        FETCH_PRIORITY_ENABLED, PREFETCH_FILTER_ENABLED, DEDUP_ENABLED,
+    )
+
+    logger = logging.getLogger()
+    workers = workers or DETAIL_QUEUE_WORKERS
+
+    storage = SQLiteStorage(db_file)
+    if DEDUP_ENABLED:
+        # Fingerprint older jobs once here; the workers only load fingerprints
+        NearDuplicateIndex(storage)
+    queue = DetailWorkQueue(storage)
+    priority = None
+    if FETCH_PRIORITY_ENABLED:
+        priority = FetchPriority(KeywordConfig(keywords=DEFAULT_KEYWORDS, weights=WEIGHTED_KEYWORDS))
+    added = queue.enqueue_backlog(
+        priority=priority,
+        prefetch_filter=PrefetchFilter() if PREFETCH_FILTER_ENABLED else None,
+    )
+    logger.info(f"DETAIL QUEUE - {added} jobs added, {queue.get_stats()}, {workers} workers")
+
+    # The request ceiling is per host and egress route: split it between the worker processes
+    requests_per_second = DETAIL_REQUESTS_PER_SECOND * get_default_client().route_count / workers
+    processed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_queue_worker, str(storage.db_file), requests_per_second)
+            for _ in range(workers)
+        ]
+        for future in futures:
+            try:
+                processed += future.result()
+            except Exception as e:
+                logger.warning(f"Queue worker failed (its leases will expire and be retried): {e}")
+
+    stats = queue.get_stats()
+    logger.info(f"DETAIL QUEUE DONE - {processed} jobs processed, {stats}")
+    return stats
+
+
+def daemon(interval=None, status_port=None, parse_pool=None, db_file=None):
+    """
+    Run search + analysis cycles in one long-lived process (replaces cron + lockfile).
+
+    The HTTP connection pool, rate limiter, known-ID indexes and database
+    connection stay warm across cycles. SIGTERM/SIGINT finish the current
+    step and exit. Health and status are served over HTTP.
+
+    Args:
+        interval: Minutes between cycle starts (default: DAEMON_INTERVAL)
+        status_port: Port for /health and /status (default: DAEMON_STATUS_PORT, 0 disables)
+        parse_pool: ParsePool shared by all cycles
+        db_file: SQLite database path (default: data/database/jobs_master.db)
+    """
+    from config.keyword_settings import DEDUP_ENABLED
+    from config.settings import (
+        DAEMON_INTERVAL,
+        DAEMON_STATUS_HOST,
+        DAEMON_STATUS_PORT,
+        SEARCH_DEDUP_KNOWN_IDS,
+        SEARCH_REQUESTS_PER_SECOND,
+        SEARCH_BURST,
+    )
+
+    logger = logging.getLogger()
+    interval = interval or DAEMON_INTERVAL
+    status_port = DAEMON_STATUS_PORT if status_port is None else status_port
+
+    storage = SQLiteStorage(db_file, persistent=True)
+    known_ids = KnownJobIndex.from_storage(storage) if SEARCH_DEDUP_KNOWN_IDS else None
+    analyzed_ids = KnownJobIndex.from_storage(storage, analyzed=True)
+    near_duplicates = NearDuplicateIndex(storage) if DEDUP_ENABLED else None
+    client = get_default_client()
+    routes = client.route_count
+    rate_limiter = HostRateLimiter(SEARCH_REQUESTS_PER_SECOND * routes, SEARCH_BURST * routes)
+    detail_scraper = DetailScraper(parse_pool=parse_pool)
+    logger.info(f"DAEMON STARTING - every {interval} min, known: {known_ids}, analyzed: {analyzed_ids}")
+
+    def cycle():
+        results = multiple_search(
+            rate_limiter=rate_limiter,
+            parse_pool=parse_pool,
+            storage=storage,
+            known_ids=known_ids,
+        )
+        analyzed = []
+        if not runner.stopping:
+            analyzed = analyze_keywords(
+                storage=storage,
+                detail_scraper=detail_scraper,
+                analyzed_ids=analyzed_ids,
+                near_duplicates=near_duplicates,
+                should_stop=lambda: runner.stopping,
+            )
+        return {
+            'searches': len(results),
+            'jobs_found': sum(len(result.jobs) for result in results),
+            'jobs_analyzed': len(analyzed),
+        }
+
+    def status_extra():
+        return {
+            'known_ids': len(known_ids) if known_ids is not None else None,
+            'analyzed_ids': len(analyzed_ids),
+            'detail_requests': detail_scraper.request_count,
+            'near_duplicates': near_duplicates.get_stats() if near_duplicates is not None else None,
+            'egress': client.egress_pool.get_stats() if client.egress_pool else None,
+        }
+
+    runner = ScraperDaemon(
+        cycle,
+        interval * 60,
+        status_host=DAEMON_STATUS_HOST,
+        status_port=status_port,
+        status_extra=status_extra,
+    )
+    try:
+        runner.run_forever()
+    finally:
+        storage.close()
+
+
+def rank_jobs(weights=None, top_n=20, rebuild=False, db_file=None):
+    """
+    Re-rank every analyzed job for the current weights from the term matrix.
+
+    The matrix (data/term_matrix) is updated with jobs analyzed since the
+    last call, then scored in one matrix-vector product; no page is fetched.
+
+    Args:
+        weights: Keyword weights (default: WEIGHTED_KEYWORDS)
+        top_n: Number of top jobs to display
+        rebuild: Recount all stored descriptions instead of updating
+        db_file: SQLite database path (default: data/database/jobs_master.db)
+    """
+    from config.keyword_settings import DEFAULT_KEYWORDS, WEIGHTED_KEYWORDS
+
+    logger = logging.getLogger()
+    keyword_config = KeywordConfig(keywords=DEFAULT_KEYWORDS, weights=weights or WEIGHTED_KEYWORDS)
+    storage = SQLiteStorage(db_file)
+
+    start = time.perf_counter()
+    if rebuild:
+        matrix = TermMatrix.build(storage, keyword_config)
+        matrix.save()
+    else:
+        matrix = TermMatrix.refresh(storage, keyword_config)
+    loaded = time.perf_counter()
+    ranked = matrix.rank(keyword_config.weights, top_n=top_n)
+    scored = time.perf_counter()
+    logger.info(
+        f"RANK - {len(matrix)} jobs x {len(matrix.columns)} keywords, "
+        f"matrix ready in {loaded - start:.2f}s, scored in {(scored - loaded) * 1000:.1f}ms"
+    )
+
+    cards = storage.get_job_cards(job['linkedin_job_id'] for job in ranked)
+    for job in ranked:
+        card = cards.get(job['linkedin_job_id'], {})
+        job.update({key: value for key, value in card.items() if value is not None})
+    KeywordMatcher(storage, keyword_config).display_results(ranked, top_n=top_n)
+    return ranked
+
+
+def show_plan():
+    """Print the compiled search plan without sending any request."""
+    from config.settings import SEARCH_TEMPLATES, SEARCH_PAGINATE
+
+    plan = SearchPlan(SEARCH_TEMPLATES)
+    plan.print_report(paginate=SEARCH_PAGINATE)
+    return plan
+
+
+def reextract(workers=None):
+    """Rebuild job_searches / job_posts fields from the raw page archive (no network)."""
+    logger = logging.getLogger()
+
+    logger.info("RE-EXTRACTING FROM ARCHIVE")
+    stats = reextract_archive(SQLiteStorage(), workers=workers)
+    logger.info(
+        f"Re-extract stats - Pages: {stats['pages']}, "
+        f"job_posts updated: {stats['job_posts_updated']}, "
+        f"job_searches updated: {stats['job_searches_updated']}, "
+        f"Time: {stats['elapsed']:.1f}s"
+    )
+    return stats
+
+
+def rescore(workers=None, batch_size=None, full=False, db_file=None):
+    """
+    Bring stored scores up to date with the current keywords and weights (no network).
+
+    Only keywords without stored counts are searched in the descriptions;
+    scores are derived from the stored counts.
+
+    Args:
+        workers: Counting processes (default: CPU count)
+        batch_size: Job posts per batch (default: RESCORE_BATCH_SIZE)
+        full: Recount every keyword of every job
+        db_file: SQLite database path (default: data/database/jobs_master.db)
+    """
+    from config.keyword_settings import DEFAULT_KEYWORDS, WEIGHTED_KEYWORDS
+
+    logger = logging.getLogger()
+
+    logger.info("RE-SCORING STORED DESCRIPTIONS")
+    keyword_config = KeywordConfig(keywords=DEFAULT_KEYWORDS, weights=WEIGHTED_KEYWORDS)
+    stats = rescore_job_posts(
+        SQLiteStorage(db_file), keyword_config,
+        workers=workers, batch_size=batch_size, full=full,
+    )
+    logger.info(
+        f"Rescore stats - Counted: {stats['counted_jobs']} jobs / {stats['counted_terms']} keyword-job pairs, "
+        f"Scored: {stats['scored_jobs']}, Time: {stats['elapsed']:.1f}s, "
+        f"Throughput: {stats['jobs_per_second']:.0f} jobs/s"
+    )
+    return stats
+
+
+def _megabytes(size):
+    return f"{size / 1024 / 1024:.1f} MB"
+
+
+def compress(report_only=False, db_file=None):
+    """
+    Compress stored job descriptions with a freshly trained dictionary.
+
+    Args:
+        report_only: Only show how much space descriptions take
+        db_file: SQLite database path (default: data/database/jobs_master.db)
+
+    Returns:
+        dict: Size report
+    """
+    logger = logging.getLogger()
+    storage = SQLiteStorage(db_file)
+
+    if report_only:
+        stats = storage.get_description_size_stats()
+        logger.info(
+            f"Description storage - Rows: {stats['rows']} ({stats['compressed_rows']} compressed), "
+            f"Column: {_megabytes(stats['stored_bytes'])}, Dictionaries: {stats['dictionaries']}, "
+            f"DB file: {_megabytes(stats['file_bytes'])}"
+        )
+        return stats
+
+    logger.info("COMPRESSING STORED DESCRIPTIONS")
+    report = storage.compress_descriptions()
+    ratio = report['text_bytes'] / report['stored_after'] if report['stored_after'] else 0
+    logger.info(
+        f"Compression report - Rows: {report['rows']}, Dictionary: {report['dict_id'] or 'none'}, "
+        f"Text: {_megabytes(report['text_bytes'])}, Column: {_megabytes(report['stored_before'])} -> "
+        f"{_megabytes(report['stored_after'])} ({ratio:.1f}x), "
+        f"DB file: {_megabytes(report['file_before'])} -> {_megabytes(report['file_after'])}"
+    )
+    return report
+
+
+def parse_args():
+    """Parse command line arguments (no command = search + analyze)."""
+    parser = argparse.ArgumentParser(description="LinkedIn job scraper")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Parse pages in this many worker processes (0 = CPU count)")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("run", help="Run batch search, then keyword analysis (default)")
+    search_parser = subparsers.add_parser("search", help="Run batch search only")
+    search_parser.add_argument("--all", action="store_true",
+                               help="Run every query, ignoring the adaptive schedule")
+    subparsers.add_parser("analyze", help="Run keyword analysis only")
+    subparsers.add_parser("plan", help="Show the compiled search plan and expected requests")
+    rank_parser = subparsers.add_parser(
+        "rank", help="Re-rank analyzed jobs for the current weights (no fetching)"
+    )
+    rank_parser.add_argument("--top", type=int, default=20, help="Jobs to display")
+    rank_parser.add_argument("--rebuild", action="store_true",
+                             help="Recount all stored descriptions")
+
+    work_parser = subparsers.add_parser(
+        "work", help="Analyze the backlog through the durable detail queue"
+    )
+    work_parser.add_argument("--workers", type=int, default=None,
+                             help="Worker processes (default: DETAIL_QUEUE_WORKERS)")
+
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="Run search + analysis cycles in one long-lived process"
+    )
+    daemon_parser.add_argument("--interval", type=float, default=None,
+                               help="Minutes between cycles (default: DAEMON_INTERVAL)")
+    daemon_parser.add_argument("--status-port", type=int, default=None,
+                               help="Port for /health and /status (0 disables)")
+
+    rescore_parser = subparsers.add_parser(
+        "rescore", help="Re-score stored descriptions for the current keywords (no fetching)"
+    )
+    rescore_parser.add_argument("--workers", type=int, default=None,
+                                help="Analyzer processes (default: CPU count)")
+    rescore_parser.add_argument("--batch-size", type=int, default=None,
+                                help="Descriptions per batch (default: RESCORE_BATCH_SIZE)")
+    rescore_parser.add_argument("--full", action="store_true",
+                                help="Recount every keyword instead of only missing ones")
+
+    compress_parser = subparsers.add_parser(
+        "compress", help="Train a dictionary and compress stored descriptions"
+    )
+    compress_parser.add_argument("--report", action="store_true",
+                                 help="Only report description storage size")
+
+    reextract_parser = subparsers.add_parser(
+        "reextract", help="Rebuild stored fields from the raw page archive"
+    )
+    reextract_parser.add_argument("--workers", type=int, default=None,
+                                  help="Parse processes (default: CPU count)")
+
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
     setup_logging()
     logger = logging.getLogger()
 
     try:
-        # Run batch job search
-        multiple_search()
-
-        # Analyze existing jobs for keywords
-        analyze_keywords()
+        if args.command == "reextract":
+            reextract(workers=args.workers)
+        elif args.command == "rescore":
+            rescore(workers=args.workers, batch_size=args.batch_size, full=args.full)
+        elif args.command == "compress":
+            compress(report_only=args.report)
+        elif args.command == "plan":
+            show_plan()
+        elif args.command == "rank":
+            rank_jobs(top_n=args.top, rebuild=args.rebuild)
+        elif args.command == "work":
+            work(workers=args.workers)
+        else:
+            from config.settings import PARSE_POOL_ENABLED
+
+            parse_pool = None
+            if args.parse_workers is not None or PARSE_POOL_ENABLED:
+                parse_pool = ParsePool(workers=args.parse_workers)
+                logger.info(f"Parsing pages in {parse_pool.workers} worker processes")
+
+            try:
+                if args.command == "daemon":
+                    daemon(
+                        interval=args.interval,
+                        status_port=args.status_port,
+                        parse_pool=parse_pool,
+                    )
+
+                if args.command in (None, "run", "search"):
+                    # Run batch job search
+                    multiple_search(
+                        parse_pool=parse_pool,
+                        use_schedule=False if getattr(args, "all", False) else None,
+                    )
+
+                if args.command in (None, "run", "analyze"):
+                    # Analyze existing jobs for keywords
+                    analyze_keywords(parse_pool=parse_pool)
+            finally:
+                if parse_pool:
+                    parse_pool.close()
     except Exception:
         logger.exception("Scraper failed with an error")
         raise
@@ -9,6 +9,7 @@ __version__ = "1.1.0"
 __author__ = "Eduardo"
 
 from .core.scraper import JobScraper
+from .core.batch_search import BatchSearchEngine
 from .core.detail_scraper import DetailScraper
 from .core.keyword_matcher import KeywordMatcher
 from .models.search_config import SearchConfig
@@ -19,6 +20,7 @@ from .analyzers.keyword_analyzer import KeywordAnalyzer
 
 __all__ = [
     'JobScraper',
+    'BatchSearchEngine',
     'DetailScraper',
     'KeywordMatcher',
     'SearchConfig',
@@ -1,4 +1,5 @@
 """Analyzers package for keyword matching."""
 from .keyword_analyzer import KeywordAnalyzer
+from .term_matrix import TermMatrix
 
-__all__ = ['KeywordAnalyzer']
+__all__ = ['KeywordAnalyzer', 'TermMatrix']
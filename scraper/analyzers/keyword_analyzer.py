@@ -1,5 +1,109 @@
 """Keyword analyzer for matching keywords in job descriptions."""
 import re
+from functools import lru_cache
+
+
+class CompiledKeywords:
+    """All keywords of a config compiled into one regex, matched in a single pass.
+
+    The regex is a trie of the keywords inside a lookahead, so it reports
+    every position where some keyword matches (the longest one) without
+    consuming text. Keywords that can match at the same position (one is
+    a prefix of the other, like "Spring" and "Spring Boot") are checked
+    with their own pattern only there. Counts are the same as running
+    re.findall(r'\bkeyword\b') once per keyword: each keyword's matches
+    are counted without overlapping itself, but may overlap other keywords.
+    """
+
+    def __init__(self, keywords, case_sensitive=False):
+        """
+        Compile the keywords.
+
+        Args:
+            keywords: List of keywords (phrases and duplicates allowed)
+            case_sensitive: Whether matching is case-sensitive
+        """
+        self.keywords = list(keywords)
+        self.case_sensitive = case_sensitive
+        self.flags = 0 if case_sensitive else re.IGNORECASE
+
+        # Distinct search forms ("Java" and "java" share one when case-insensitive)
+        self.forms = list(dict.fromkeys(self._form(kw) for kw in self.keywords))
+        self.patterns = [re.compile(r'\b' + re.escape(form) + r'\b', self.flags) for form in self.forms]
+
+        searchable = [i for i, form in enumerate(self.forms) if form]
+        # Keywords that can match where keyword i matches: same-position prefixes either way
+        self.overlaps = {
+            i: [j for j in searchable if j != i and self._prefix_of(i, j)]
+            for i in searchable
+        }
+        self.scanner = self._build_scanner(searchable)
+
+    def _form(self, keyword):
+        return keyword if self.case_sensitive else keyword.lower()
+
+    def _prefix_of(self, i, j):
+        shorter, longer = sorted((self.forms[i], self.forms[j]), key=len)
+        return re.fullmatch(re.escape(shorter), longer[:len(shorter)], self.flags) is not None
+
+    def _build_scanner(self, searchable):
+        """Lookahead trie regex whose empty marker group tells which keyword matched."""
+        trie = {}
+        for i in searchable:
+            node = trie
+            for char in self.forms[i]:
+                node = node.setdefault(char, {})
+            node[''] = i
+        # Marker groups are numbered in the order they appear in the regex
+        self.group_forms = {}
+
+        def branch(node):
+            # Longer keywords first, so the longest match is reported
+            alternatives = [re.escape(char) + branch(child) for char, child in node.items() if char]
+            if '' in node:
+                self.group_forms[len(self.group_forms) + 1] = node['']
+                alternatives.append(r'\b()')
+            if len(alternatives) == 1:
+                return alternatives[0]
+            return '(?:' + '|'.join(alternatives) + ')'
+
+        if not trie:
+            return None
+        return re.compile(r'(?=\b' + branch(trie) + ')', self.flags)
+
+    def count(self, text):
+        """
+        Count each keyword in an already prepared (lowercased if needed) text.
+
+        Returns:
+            dict: {keyword: match_count}
+        """
+        counts = [0] * len(self.forms)
+        if self.scanner is not None:
+            ends = [0] * len(self.forms)
+            for match in self.scanner.finditer(text):
+                start = match.start()
+                found = self.group_forms[match.lastindex]
+                hits = [found]
+                hits.extend(j for j in self.overlaps[found] if self.patterns[j].match(text, start))
+                for i in hits:
+                    # Like findall, a keyword's next match starts after its previous one
+                    if start >= ends[i]:
+                        counts[i] += 1
+                        ends[i] = start + len(self.forms[i])
+
+        for i, form in enumerate(self.forms):
+            if not form:
+                counts[i] = len(self.patterns[i].findall(text))
+
+        by_form = dict(zip(self.forms, counts))
+        return {kw: by_form[self._form(kw)] for kw in self.keywords}
+
+
+@lru_cache(maxsize=32)
+def compile_keywords(keywords, case_sensitive=False):
+    """CompiledKeywords for a tuple of keywords, built once and reused."""
+    return CompiledKeywords(keywords, case_sensitive)
 
 
 class KeywordAnalyzer:
@@ -30,20 +134,12 @@ class KeywordAnalyzer:
         # Prepare text based on case sensitivity setting
         text = description if self.keyword_config.case_sensitive else description.lower()
 
-        matches = {}
-        for keyword in self.keyword_config.keywords:
-            search_kw = keyword if self.keyword_config.case_sensitive else keyword.lower()
-
-            # Use word boundary matching for accurate counts
-            # Handles phrases like "REST API" and single words like "Python"
-            # Escape special regex characters in the keyword
-            pattern = r'\b' + re.escape(search_kw) + r'\b'
-
-            flags = 0 if self.keyword_config.case_sensitive else re.IGNORECASE
-            count = len(re.findall(pattern, text, flags))
-            matches[keyword] = count
+        return self.compiled.count(text)
 
-        return matches
+    @property
+    def compiled(self):
+        """The config's keywords compiled into one matcher (rebuilt if the list changes)."""
+        return compile_keywords(tuple(self.keyword_config.keywords), self.keyword_config.case_sensitive)
 
     def analyze_batch(self, descriptions):
         """
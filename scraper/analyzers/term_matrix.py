@@ -0,0 +1,208 @@
+"""Persisted job x keyword count matrix for re-scoring without re-analysis."""
+import json
+from pathlib import Path
+
+import numpy as np
+
+
+class TermMatrix:
+    """Keyword counts of every analyzed job, one row per job and one column per keyword.
+
+    Scores for any weights are then a matrix-vector product over the whole
+    database. The matrix is saved as .npy files and loaded memory-mapped,
+    so opening it costs nothing until rows are read.
+    """
+
+    def __init__(self, keywords, case_sensitive, job_ids, counts, counts_seq=0):
+        """
+        Initialize the matrix.
+
+        Args:
+            keywords: Keyword list the counts were taken for (as in KeywordConfig)
+            case_sensitive: Whether the counts are case-sensitive
+            job_ids: int64 array of linkedin_job_ids, one per row
+            counts: float64 array (jobs x distinct keywords) of match counts
+            counts_seq: Highest job_posts.counts_seq the rows include
+        """
+        self.keywords = list(keywords)
+        self.case_sensitive = case_sensitive
+        # Duplicate keywords share a column, like the {keyword: count} dicts
+        self.columns = list(dict.fromkeys(self.keywords))
+        self.job_ids = job_ids
+        self.counts = counts
+        self.counts_seq = counts_seq
+        self._totals = None
+        self._matched = None
+
+    @staticmethod
+    def default_root():
+        project_root = Path(__file__).resolve().parent.parent.parent
+        return project_root / 'data' / 'term_matrix'
+
+    @classmethod
+    def build(cls, storage, keyword_config, base=None):
+        """
+        Build the matrix from the stored keyword counts of all analyzed jobs.
+
+        Keywords a job has no stored count for are counted first (see
+        count_missing_terms), so only new or changed descriptions are scanned.
+
+        Args:
+            storage: SQLiteStorage with job_posts
+            keyword_config: KeywordConfig to count
+            base: TermMatrix for the same keywords whose rows are reused;
+                only jobs whose counts changed since it was built are read,
+                replacing their old row
+
+        Returns:
+            TermMatrix
+        """
+        # Imported here: scraper.core.rescore imports this package
+        from ..core.rescore import count_missing_terms
+
+        keywords = list(keyword_config.keywords)
+        case_sensitive = keyword_config.case_sensitive
+        columns = list(dict.fromkeys(keywords))
+        count_missing_terms(storage, keyword_config)
+
+        after_seq = base.counts_seq if base is not None else 0
+        changed = {}
+        counts_seq = after_seq
+        for batch, counts_seq in storage.iter_changed_keyword_counts(keyword_config, after_seq):
+            for job_id, term_counts in batch:
+                changed[job_id] = [term_counts[keyword_config.term(kw)] for kw in columns]
+        if base is not None and not changed:
+            return base
+
+        job_ids = base.job_ids if base is not None else np.zeros(0, dtype=np.int64)
+        counts = np.array(base.counts) if base is not None else np.zeros((0, len(columns)), dtype=np.float64)
+        rows = {job_id: row for row, job_id in enumerate(job_ids.tolist())}
+        new_ids = []
+        for job_id, values in changed.items():
+            if job_id in rows:
+                counts[rows[job_id]] = values
+            else:
+                new_ids.append(job_id)
+        if new_ids:
+            job_ids = np.concatenate([job_ids, np.array(new_ids, dtype=np.int64)])
+            counts = np.concatenate([counts, np.array([changed[job_id] for job_id in new_ids], dtype=np.float64)])
+        return cls(keywords, case_sensitive, job_ids, counts, counts_seq)
+
+    @classmethod
+    def load(cls, root=None, mmap=True):
+        """
+        Load a saved matrix (memory-mapped by default).
+
+        Returns:
+            TermMatrix, or None if nothing is saved under root
+        """
+        root = Path(root or cls.default_root())
+        meta_file = root / 'meta.json'
+        if not meta_file.exists():
+            return None
+        meta = json.loads(meta_file.read_text(encoding='utf-8'))
+        mode = 'r' if mmap else None
+        return cls(
+            meta['keywords'],
+            meta['case_sensitive'],
+            np.load(root / 'job_ids.npy', mmap_mode=mode),
+            np.load(root / 'counts.npy', mmap_mode=mode),
+            meta.get('counts_seq', 0),
+        )
+
+    def save(self, root=None):
+        """Write the matrix under root (default data/term_matrix)."""
+        root = Path(root or self.default_root())
+        root.mkdir(parents=True, exist_ok=True)
+        # Write to temporary names first so a crash never leaves a half-written matrix
+        for name, array in (('job_ids', self.job_ids), ('counts', self.counts)):
+            tmp = root / f'{name}.tmp.npy'
+            np.save(tmp, np.ascontiguousarray(array))
+            tmp.replace(root / f'{name}.npy')
+        meta = {'keywords': self.keywords, 'case_sensitive': self.case_sensitive, 'counts_seq': self.counts_seq}
+        (root / 'meta.json').write_text(json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+
+    @classmethod
+    def refresh(cls, storage, keyword_config, root=None):
+        """
+        Load the saved matrix, apply jobs counted since, and save it back.
+
+        The matrix is rebuilt from scratch if it was counted for other keywords.
+
+        Returns:
+            TermMatrix
+        """
+        saved = cls.load(root)
+        if saved is not None and not saved.counted_for(keyword_config):
+            print("🔁 Keyword list changed, rebuilding the term matrix")
+            saved = None
+        matrix = cls.build(storage, keyword_config, base=saved)
+        if matrix is not saved:
+            matrix.save(root)
+        return matrix
+
+    def counted_for(self, keyword_config):
+        """True if the counts were taken for this config's keywords."""
+        return (self.keywords == list(keyword_config.keywords)
+                and self.case_sensitive == keyword_config.case_sensitive)
+
+    def score(self, weights):
+        """
+        Score every job for a weights dict (keywords missing from it weigh 1.0).
+
+        Same values as MatchResult.calculate_score, for all rows at once.
+
+        Returns:
+            dict of arrays: weighted_score, total_matches, match_percentage
+        """
+        vector = np.array([weights.get(kw, 1.0) for kw in self.columns], dtype=np.float64)
+        if self._totals is None:
+            # Weight-independent, so computed once per load
+            self._totals = self.counts.sum(axis=1)
+            self._matched = np.count_nonzero(self.counts, axis=1)
+        percentage = (
+            self._matched / len(self.keywords) * 100 if self.keywords
+            else np.zeros(len(self), dtype=np.float64)
+        )
+        return {
+            'weighted_score': self.counts @ vector,
+            'total_matches': self._totals,
+            'match_percentage': percentage,
+        }
+
+    def rank(self, weights, top_n=None):
+        """
+        Jobs ordered by weighted score for a weights dict.
+
+        Args:
+            weights: {keyword: weight}
+            top_n: Only return the best top_n jobs
+
+        Returns:
+            list[dict] with linkedin_job_id, weighted_score, total_matches,
+            match_percentage and matched_keywords
+        """
+        scores = self.score(weights)
+        weighted = scores['weighted_score']
+        if top_n is not None and top_n < len(weighted):
+            top = np.argpartition(-weighted, top_n)[:top_n]
+            order = top[np.argsort(-weighted[top], kind='stable')]
+        else:
+            order = np.argsort(-weighted, kind='stable')
+
+        return [
+            {
+                'linkedin_job_id': str(self.job_ids[row]),
+                'weighted_score': float(weighted[row]),
+                'total_matches': int(scores['total_matches'][row]),
+                'match_percentage': float(scores['match_percentage'][row]),
+                'matched_keywords': [kw for kw, count in zip(self.columns, self.counts[row]) if count > 0],
+            }
+            for row in order
+        ]
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def __repr__(self):
+        return f"TermMatrix(jobs={len(self)}, keywords={len(self.columns)})"
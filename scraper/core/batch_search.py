@@ -0,0 +1,146 @@
+"""Concurrent execution of search templates on top of JobScraper."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .scraper import JobScraper
+from .rate_limiter import HostRateLimiter
+from .search_plan import SearchPlan
+from config.settings import (
+    SEARCH_WORKERS,
+    SEARCH_REQUESTS_PER_SECOND,
+    SEARCH_BURST,
+    SEARCH_PAGINATE,
+    SEARCH_INCREMENTAL,
+)
+
+
+class TemplateResult:
+    """Outcome of running a single search template."""
+
+    def __init__(self, name, search_config):
+        self.name = name
+        self.search_config = search_config
+        self.jobs = []
+        self.elapsed = 0.0
+        self.error = None
+        # Other templates whose results came from the same request
+        self.shared_with = []
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def to_dict(self):
+        """Convert result to dictionary format."""
+        return {
+            'name': self.name,
+            'search_config': self.search_config.to_dict(),
+            'job_count': len(self.jobs),
+            'elapsed': self.elapsed,
+            'error': self.error,
+            'shared_with': self.shared_with,
+        }
+
+    def __repr__(self):
+        return f"TemplateResult(name='{self.name}', jobs={len(self.jobs)}, elapsed={self.elapsed:.2f}s)"
+
+
+class BatchSearchEngine:
+    """Runs search templates concurrently behind a shared per-host rate limiter."""
+
+    def __init__(self, scraper=None, max_workers=None, rate_limiter=None, paginate=None,
+                 incremental=None, known_ids=None, scheduler=None):
+        """
+        Initialize the engine.
+
+        Args:
+            scraper: JobScraper to use (a new one is created if None)
+            max_workers: Number of templates searched at once (default from config)
+            rate_limiter: HostRateLimiter shared by all workers (default from config)
+            paginate: Walk result pages up to max_results (default from config)
+            incremental: Only fetch postings newer than each search's watermark
+                (default from config)
+            known_ids: KnownJobIndex shared by all workers; jobs already stored
+                (or found by another template this run) are dropped
+            scheduler: TemplateScheduler; only due queries run and each run's
+                yield adapts the query's polling interval
+        """
+        self.scraper = scraper or JobScraper()
+        # The configured rate is per egress route
+        routes = self.scraper.http_client.route_count
+        self.max_workers = max_workers or SEARCH_WORKERS * routes
+        self.rate_limiter = rate_limiter or HostRateLimiter(
+            SEARCH_REQUESTS_PER_SECOND * routes, SEARCH_BURST * routes
+        )
+        self.paginate = SEARCH_PAGINATE if paginate is None else paginate
+        self.incremental = SEARCH_INCREMENTAL if incremental is None else incremental
+        # Politeness is enforced by the limiter, not by sleeping between searches
+        self.scraper.rate_limiter = self.rate_limiter
+        if known_ids is not None:
+            self.scraper.known_ids = known_ids
+        self.scheduler = scheduler
+
+    def plan(self, templates):
+        """Compile templates into a SearchPlan (grid expansion and query dedup)."""
+        return SearchPlan(templates)
+
+    def run(self, templates, save_results=True):
+        """
+        Run all templates and collect per-template results.
+
+        Each distinct query of the plan is requested once; templates that
+        share it all receive its jobs (up to their own max_results). With a
+        scheduler, queries that are not due are skipped and their templates
+        left out of the results.
+
+        Args:
+            templates: List of template dicts (see config.settings.SEARCH_TEMPLATES)
+                or a SearchPlan compiled from them
+            save_results: Save found jobs to the SQLite database
+
+        Returns:
+            list[TemplateResult]: One result per expanded template, in template order
+        """
+        plan = templates if isinstance(templates, SearchPlan) else self.plan(templates)
+        queries = self.scheduler.select(plan) if self.scheduler else plan.queries
+        query_results = {
+            query: TemplateResult(", ".join(query.template_names), query.search_config)
+            for query in queries
+        }
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda r: self._run_one(r, save_results), query_results.values()))
+
+        if self.scheduler:
+            for query, result in query_results.items():
+                self.scheduler.record(query, result)
+
+        results = []
+        for name, search_config, query in plan.templates:
+            shared = query_results.get(query)
+            if shared is None:
+                continue
+            result = TemplateResult(name, search_config)
+            result.jobs = shared.jobs[:search_config.max_results]
+            result.elapsed = shared.elapsed
+            result.error = shared.error
+            result.shared_with = [other for other in query.template_names if other != name]
+            results.append(result)
+
+        return results
+
+    def _run_one(self, result, save_results):
+        """Run one template, recording jobs, timing and errors on `result`."""
+        start = time.perf_counter()
+        try:
+            result.jobs = self.scraper.search_jobs(
+                result.search_config,
+                save_results=save_results,
+                paginate=self.paginate,
+                incremental=self.incremental,
+            )
+        except Exception as e:
+            result.error = str(e)
+            print(f"❌ Search '{result.name}' failed: {e}")
+        result.elapsed = time.perf_counter() - start
+        return result
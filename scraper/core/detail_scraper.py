@@ -1,25 +1,157 @@
 """Scraper for LinkedIn job detail pages with anti-detection measures."""
+import asyncio
+from collections import deque
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import random
 import re
 
+from .http_client import get_default_client
+from .rate_limiter import AsyncRateLimiter
+from .retry_policy import RetryPolicy, RetryQueue
+from config.settings import HTML_ARCHIVE_ENABLED
+from utils.html_archive import HtmlArchive
 from config.keyword_settings import (
-    USER_AGENTS,
     SCRAPE_MIN_DELAY,
     SCRAPE_MAX_DELAY,
     BATCH_SIZE,
     BATCH_PAUSE,
-    RETRY_DELAY,
-    MAX_RETRIES,
+    DETAIL_CONCURRENCY,
+    DETAIL_REQUESTS_PER_SECOND,
+    DETAIL_PARSE_MODE,
 )
 
+# The only regions of a detail page we read
+DETAIL_REGION_CLASSES = frozenset({
+    'show-more-less-html__markup',
+    'num-applicants__caption',
+    'description__job-criteria-item',
+})
+
+
+def _is_detail_region(class_value):
+    """SoupStrainer predicate: bs4 passes the raw class attribute string."""
+    return bool(class_value) and not DETAIL_REGION_CLASSES.isdisjoint(class_value.split())
+
+
+DETAIL_REGIONS_STRAINER = SoupStrainer(class_=_is_detail_region)
+
+
+def _extract_description(soup):
+    """Extract job description text."""
+    elem = soup.select_one('div.show-more-less-html__markup')
+    if elem:
+        # Get text with spaces between elements
+        return elem.get_text(separator=' ', strip=True)
+    return None
+
+
+def _extract_applicant_count(soup):
+    """Extract number of applicants.
+
+    LinkedIn displays 3 tiers:
+      - "Be among the first 25 applicants" → 25
+      - "101 applicants" (exact number)    → 101
+      - "Over 200 applicants"              → 201
+
+    Returns:
+        int or None
+    """
+    # Element can be <span> or <figcaption> with same class
+    elem = soup.select_one('.num-applicants__caption')
+    if not elem:
+        return None
+
+    text = elem.get_text(strip=True).lower()
+
+    if 'over' in text or 'más de' in text:
+        return 201
+    if 'first' in text or 'primero' in text:
+        return 25
+
+    # Exact number: "101 applicants"
+    match = re.search(r'(\d+)', text.replace(',', ''))
+    return int(match.group(1)) if match else None
+
+
+def _extract_job_criteria(soup):
+    """Extract seniority level, employment type, etc."""
+    criteria = {
+        'seniority_level': None,
+        'employment_type': None,
+        'job_function': None,
+        'industries': None,
+    }
+
+    items = soup.select('li.description__job-criteria-item')
+    for item in items:
+        header = item.select_one('h3.description__job-criteria-subheader')
+        value = item.select_one('span.description__job-criteria-text')
+
+        if header and value:
+            header_text = header.get_text(strip=True).lower()
+            value_text = value.get_text(strip=True)
+
+            if 'seniority' in header_text:
+                criteria['seniority_level'] = value_text
+            elif 'employment' in header_text:
+                criteria['employment_type'] = value_text
+            elif 'function' in header_text:
+                criteria['job_function'] = value_text
+            elif 'industr' in header_text:
+                criteria['industries'] = value_text
+
+    return criteria
+
+
+def parse_details(content, parse_mode=None):
+    """
+    Extract job details from a raw detail page.
+
+    A plain function, so parse workers don't need a DetailScraper (and its
+    HTTP client, archive and retry policy) to call it.
+
+    Args:
+        content: Response body (bytes or str)
+        parse_mode: 'partial' builds only the regions we read, 'full' parses
+            the whole page (default from config)
+
+    Returns:
+        dict with description, applicant_count and job criteria
+    """
+    if (parse_mode or DETAIL_PARSE_MODE) == 'partial':
+        soup = BeautifulSoup(content, 'html.parser', parse_only=DETAIL_REGIONS_STRAINER)
+    else:
+        soup = BeautifulSoup(content, 'html.parser')
+
+    details = {
+        'description': _extract_description(soup),
+        'applicant_count': _extract_applicant_count(soup),
+        **_extract_job_criteria(soup)
+    }
+
+    # Break the tree's reference cycles now instead of waiting for the GC
+    soup.decompose()
+    return details
+
+
+class _NoLimit:
+    """Stand-in for a semaphore when the caller does not bound concurrency."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
 
 class DetailScraper:
     """Scrapes job detail pages using requests with anti-detection measures."""
 
-    def __init__(self, min_delay=None, max_delay=None, batch_size=None, batch_pause=None):
+    def __init__(self, min_delay=None, max_delay=None, batch_size=None, batch_pause=None,
+                 http_client=None, parse_mode=None, archive=None,
+                 concurrency=None, requests_per_second=None, parse_pool=None, retry_policy=None):
         """
         Initialize the detail scraper.
 
@@ -28,178 +160,204 @@ class DetailScraper:
             max_delay: Maximum delay between requests (default from config)
             batch_size: Number of jobs per batch before pause (default from config)
             batch_pause: Seconds to pause between batches (default from config)
+            http_client: HttpClient to fetch with (default: shared pooled client)
+            parse_mode: 'partial' builds only the regions we read, 'full' parses
+                the whole page (default from config)
+            archive: HtmlArchive for raw pages (default: one if HTML_ARCHIVE_ENABLED)
+            concurrency: Requests in flight in the async pipeline (default from config)
+            requests_per_second: Async pipeline request ceiling (default from config)
+            parse_pool: ParsePool to parse pages in worker processes (default: parse inline)
+            retry_policy: RetryPolicy for 429/5xx/network errors (default from config)
         """
         self.min_delay = min_delay or SCRAPE_MIN_DELAY
         self.max_delay = max_delay or SCRAPE_MAX_DELAY
         self.batch_size = batch_size or BATCH_SIZE
         self.batch_pause = batch_pause or BATCH_PAUSE
+        self.http_client = http_client or get_default_client()
+        self.parse_mode = parse_mode or DETAIL_PARSE_MODE
+        if self.parse_mode not in ('partial', 'full'):
+            raise ValueError(f"Unknown detail parse mode: {self.parse_mode}")
+        if archive is None and HTML_ARCHIVE_ENABLED:
+            archive = HtmlArchive()
+        self.archive = archive
+        # The configured ceilings are per egress route
+        routes = self.http_client.route_count
+        self.concurrency = concurrency or DETAIL_CONCURRENCY * routes
+        self.requests_per_second = requests_per_second or DETAIL_REQUESTS_PER_SECOND * routes
+        self.parse_pool = parse_pool
+        self.retry_policy = retry_policy or RetryPolicy()
         self.request_count = 0
 
-    def _get_headers(self):
-        """Get request headers with rotated user agent."""
-        return {
-            'User-Agent': random.choice(USER_AGENTS),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-        }
-
-    def scrape_job_details(self, job_url, retry_count=0):
+    def _fetch(self, job_url):
+        """One attempt: (response, None) or (None, error)."""
+        try:
+            return self.http_client.get(job_url, profile='detail'), None
+        except requests.exceptions.RequestException as e:
+            return None, e
+
+    def _parse_response(self, job_url, response):
+        if self.archive:
+            self.archive.store('detail', job_url, response.content)
+        if self.parse_pool:
+            return self.parse_pool.parse_detail(response.content)
+        return self.parse_details(response.content)
+
+    def _log_retry(self, job_url, attempt, delay, response, error):
+        reason = error or f"HTTP {response.status_code}"
+        print(f"  ⚠️ {reason} for {job_url}. Retry {attempt}/{self.retry_policy.max_retries} in {delay:.0f}s")
+
+    def _log_failure(self, job_url, response, error):
+        reason = error or f"HTTP {response.status_code}"
+        print(f"  ❌ Error scraping {job_url}: {reason}")
+
+    def scrape_sequential(self, jobs, on_result):
         """
-        Scrape full details from a LinkedIn job page.
+        Scrape job pages one at a time, requeueing failed ones.
+
+        A URL that gets a 429, 5xx or network error goes to a retry queue
+        with its backoff delay and the next job is fetched meanwhile. Jobs
+        on a host whose circuit is open wait in the same queue. The loop
+        only sleeps when nothing else is ready.
 
         Args:
-            job_url: URL of the job posting
-            retry_count: Current retry attempt (internal use)
+            jobs: List of job dicts with a 'job_url' key
+            on_result: Callback(job, details) called as each job finishes
+                (details is None once its retries are used up)
 
         Returns:
-            dict with job details or None if failed
+            int: Number of jobs processed
         """
-        try:
-            response = requests.get(
-                job_url,
-                headers=self._get_headers(),
-                timeout=15
-            )
-
-            # Handle rate limiting
-            if response.status_code == 429:
-                if retry_count < MAX_RETRIES:
-                    print(f"  ⚠️ Rate limited. Waiting {RETRY_DELAY}s before retry {retry_count + 1}/{MAX_RETRIES}...")
-                    time.sleep(RETRY_DELAY)
-                    return self.scrape_job_details(job_url, retry_count + 1)
-                else:
-                    print(f"  ❌ Max retries reached for {job_url}")
-                    return None
-
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Extract all data
-            result = {
-                'description': self._extract_description(soup),
-                'applicant_count': self._extract_applicant_count(soup),
-                **self._extract_job_criteria(soup)
-            }
-
-            # Rate limiting with batch pauses
-            self._apply_rate_limiting()
-
-            return result
+        policy = self.retry_policy
+        fresh = deque((job, 0) for job in jobs)
+        retries = RetryQueue()
+
+        while fresh or retries:
+            item = retries.pop_ready()
+            if item is None and fresh:
+                item = fresh.popleft()
+            if item is None:
+                time.sleep(retries.ready_in())
+                continue
+
+            job, attempt = item
+            job_url = job['job_url']
+            wait = policy.breaker_for(job_url).wait_time()
+            if wait > 0:
+                retries.push(item, wait)
+                continue
+
+            response, error = self._fetch(job_url)
+            outcome = policy.record(job_url, response, error)
+            if outcome == 'ok':
+                on_result(job, self._parse_response(job_url, response))
+            elif outcome == 'retry' and attempt < policy.max_retries:
+                delay = policy.backoff(attempt + 1, response)
+                self._log_retry(job_url, attempt + 1, delay, response, error)
+                retries.push((job, attempt + 1), delay)
+            else:
+                self._log_failure(job_url, response, error)
+                on_result(job, None)
 
-        except requests.exceptions.RequestException as e:
-            print(f"  ❌ Error scraping {job_url}: {e}")
-            return None
+            if fresh or retries:
+                self._apply_rate_limiting()
 
-    def _apply_rate_limiting(self):
-        """Apply rate limiting between requests."""
-        self.request_count += 1
+        return len(jobs)
 
-        if self.request_count % self.batch_size == 0:
-            print(f"\n  ⏸️ Batch complete ({self.request_count} jobs). Pausing {self.batch_pause}s...")
-            time.sleep(self.batch_pause)
-        else:
-            delay = random.uniform(self.min_delay, self.max_delay)
-            time.sleep(delay)
+    def parse_details(self, content):
+        """Extract job details from a raw detail page with this scraper's parse mode (see parse_details)."""
+        return parse_details(content, self.parse_mode)
 
-    def _extract_description(self, soup):
-        """Extract job description text."""
-        elem = soup.select_one('div.show-more-less-html__markup')
-        if elem:
-            # Get text with spaces between elements
-            return elem.get_text(separator=' ', strip=True)
-        return None
+    async def scrape_job_details_async(self, job_url, rate_limiter, semaphore=None):
+        """
+        Scrape a job page without blocking the event loop.
 
-    def _extract_applicant_count(self, soup):
-        """Extract number of applicants.
+        The blocking fetch and parse run in worker threads over the pooled
+        session (parsing in the parse pool's processes, if any); rate
+        limiting, backoff and open circuits only suspend this task. The
+        semaphore is held per attempt, so a task waiting out a backoff does
+        not take a concurrency slot from the others.
 
-        LinkedIn displays 3 tiers:
-          - "Be among the first 25 applicants" → 25
-          - "101 applicants" (exact number)    → 101
-          - "Over 200 applicants"              → 201
+        Args:
+            job_url: URL of the job posting
+            rate_limiter: AsyncRateLimiter shared by all tasks
+            semaphore: Optional asyncio.Semaphore bounding requests in flight
 
         Returns:
-            int or None
+            dict with job details or None if failed
         """
-        # Element can be <span> or <figcaption> with same class
-        elem = soup.select_one('.num-applicants__caption')
-        if not elem:
-            return None
-
-        text = elem.get_text(strip=True).lower()
-
-        if 'over' in text or 'más de' in text:
-            return 201
-        if 'first' in text or 'primero' in text:
-            return 25
-
-        # Exact number: "101 applicants"
-        match = re.search(r'(\d+)', text.replace(',', ''))
-        return int(match.group(1)) if match else None
-
-    def _extract_job_criteria(self, soup):
-        """Extract seniority level, employment type, etc."""
-        criteria = {
-            'seniority_level': None,
-            'employment_type': None,
-            'job_function': None,
-            'industries': None,
-        }
-
-        items = soup.select('li.description__job-criteria-item')
-        for item in items:
-            header = item.select_one('h3.description__job-criteria-subheader')
-            value = item.select_one('span.description__job-criteria-text')
-
-            if header and value:
-                header_text = header.get_text(strip=True).lower()
-                value_text = value.get_text(strip=True)
-
-                if 'seniority' in header_text:
-                    criteria['seniority_level'] = value_text
-                elif 'employment' in header_text:
-                    criteria['employment_type'] = value_text
-                elif 'function' in header_text:
-                    criteria['job_function'] = value_text
-                elif 'industr' in header_text:
-                    criteria['industries'] = value_text
-
-        return criteria
-
-    def scrape_batch(self, jobs, progress_callback=None):
+        policy = self.retry_policy
+        breaker = policy.breaker_for(job_url)
+        semaphore = semaphore or _NoLimit()
+
+        for attempt in range(policy.max_retries + 1):
+            wait = breaker.wait_time()
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = breaker.wait_time()
+
+            async with semaphore:
+                await rate_limiter.acquire()
+                response, error = await asyncio.to_thread(self._fetch, job_url)
+                outcome = policy.record(job_url, response, error)
+                if outcome == 'ok':
+                    self.request_count += 1
+                    if self.archive:
+                        await asyncio.to_thread(self.archive.store, 'detail', job_url, response.content)
+                    if self.parse_pool:
+                        return await self.parse_pool.parse_detail_async(response.content)
+                    return await asyncio.to_thread(self.parse_details, response.content)
+
+            if outcome == 'fail' or attempt == policy.max_retries:
+                self._log_failure(job_url, response, error)
+                return None
+
+            delay = policy.backoff(attempt + 1, response)
+            self._log_retry(job_url, attempt + 1, delay, response, error)
+            await asyncio.sleep(delay)
+
+        return None
+
+    async def scrape_stream_async(self, jobs, on_result, concurrency=None, requests_per_second=None):
         """
-        Scrape details for multiple jobs.
+        Scrape job pages concurrently, handing each result over as it completes.
 
         Args:
-            jobs: List of job dicts with 'id' and 'job_url' keys
-            progress_callback: Optional callback(current, total, job) for progress updates
+            jobs: List of job dicts with a 'job_url' key
+            on_result: Callback(job, details) called in completion order
+            concurrency: Maximum requests in flight (default: self.concurrency)
+            requests_per_second: Global request ceiling (default: self.requests_per_second)
 
         Returns:
-            dict: {job_id: details_dict or None}
+            int: Number of jobs processed
         """
-        results = {}
-        total = len(jobs)
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+        rate_limiter = AsyncRateLimiter(requests_per_second or self.requests_per_second)
 
-        print(f"\n🔍 Starting to scrape {total} job detail pages...")
-        print(f"   Estimated time: {total * (self.min_delay + self.max_delay) / 2 / 60:.1f} minutes")
+        async def scrape_one(job):
+            return job, await self.scrape_job_details_async(job['job_url'], rate_limiter, semaphore)
 
-        for i, job in enumerate(jobs):
-            job_id = job['id']
-            job_url = job['job_url']
+        tasks = [asyncio.create_task(scrape_one(job)) for job in jobs]
+        for finished in asyncio.as_completed(tasks):
+            job, details = await finished
+            on_result(job, details)
 
-            if progress_callback:
-                progress_callback(i + 1, total, job)
-            else:
-                print(f"  [{i + 1}/{total}] Scraping: {job.get('title', 'Unknown')[:40]}...")
+        return len(tasks)
+
+    def scrape_stream(self, jobs, on_result, concurrency=None, requests_per_second=None):
+        """Synchronous entry point for scrape_stream_async (runs its own event loop)."""
+        return asyncio.run(self.scrape_stream_async(
+            jobs, on_result,
+            concurrency=concurrency,
+            requests_per_second=requests_per_second,
+        ))
 
-            details = self.scrape_job_details(job_url)
-            results[job_id] = details
+    def _apply_rate_limiting(self):
+        """Apply rate limiting between requests."""
+        self.request_count += 1
 
-        print(f"\n✅ Completed scraping {total} jobs")
-        return results
+        if self.request_count % self.batch_size == 0:
+            print(f"\n  ⏸️ Batch complete ({self.request_count} jobs). Pausing {self.batch_pause}s...")
+            time.sleep(self.batch_pause)
+        else:
+            delay = random.uniform(self.min_delay, self.max_delay)
+            time.sleep(delay)
@@ -0,0 +1,213 @@
+"""Egress routes (proxies or local source addresses) with per-route politeness."""
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limiter import TokenBucket
+from config.settings import (
+    EGRESS_REQUESTS_PER_SECOND,
+    EGRESS_BURST,
+    EGRESS_COOLDOWN,
+    EGRESS_MAX_COOLDOWN,
+    EGRESS_MIN_HEALTH,
+)
+
+# Weight of the newest outcome in the health score (exponential moving average)
+HEALTH_ALPHA = 0.2
+
+
+class SourceAddressAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections are bound to a local source address."""
+
+    def __init__(self, source_address, **kwargs):
+        self.source_address = (source_address, 0)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['source_address'] = self.source_address
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs['source_address'] = self.source_address
+        return super().proxy_manager_for(*args, **kwargs)
+
+
+class EgressRoute:
+    """One way out: a proxy URL, a local source address or the default route.
+
+    Each route has its own keep-alive session, token bucket and health
+    score. A 429 puts the route in cooldown (Retry-After if given, else
+    EGRESS_COOLDOWN doubled per consecutive 429, up to EGRESS_MAX_COOLDOWN).
+    """
+
+    def __init__(self, name, proxy=None, source_address=None, rate=None, burst=None,
+                 pool_connections=4, pool_maxsize=16):
+        """
+        Initialize the route.
+
+        Args:
+            name: Route name used in logs and stats
+            proxy: http://, https:// or socks5:// proxy URL (socks needs requests[socks])
+            source_address: Local IP address to bind outgoing connections to
+            rate: Requests per second through this route (default from config)
+            burst: Requests allowed back-to-back (default from config)
+            pool_connections: Number of per-host pools to cache
+            pool_maxsize: Keep-alive connections kept per host
+        """
+        self.name = name
+        self.proxy = proxy
+        self.source_address = source_address
+        self.bucket = TokenBucket(rate or EGRESS_REQUESTS_PER_SECOND, burst or EGRESS_BURST)
+        self.health = 1.0
+        self.cooldown_until = 0.0
+        self.consecutive_429 = 0
+        self.last_used = 0.0
+        self.counts = {'requests': 0, 'errors': 0, 'status_429': 0}
+        self._lock = threading.Lock()
+        self.session = self._build_session(pool_connections, pool_maxsize)
+
+    def _build_session(self, pool_connections, pool_maxsize):
+        session = requests.Session()
+        adapter_kwargs = dict(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        if self.source_address:
+            adapter = SourceAddressAdapter(self.source_address, **adapter_kwargs)
+        else:
+            adapter = HTTPAdapter(**adapter_kwargs)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if self.proxy:
+            session.proxies = {'http': self.proxy, 'https': self.proxy}
+        return session
+
+    def in_cooldown(self, now=None):
+        return (now or time.monotonic()) < self.cooldown_until
+
+    def record(self, response=None, error=None):
+        """Update health and cooldown from a response or a connection error."""
+        with self._lock:
+            self.counts['requests'] += 1
+            if error is not None or response is None:
+                self.counts['errors'] += 1
+                self.health *= 1 - HEALTH_ALPHA
+                return
+
+            if response.status_code == 429:
+                self.counts['status_429'] += 1
+                self.consecutive_429 += 1
+                self.health *= 1 - HEALTH_ALPHA
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    cooldown = float(retry_after)
+                else:
+                    cooldown = EGRESS_COOLDOWN * 2 ** (self.consecutive_429 - 1)
+                self.cooldown_until = time.monotonic() + min(cooldown, EGRESS_MAX_COOLDOWN)
+                return
+
+            self.consecutive_429 = 0
+            ok = response.status_code < 500
+            self.health = (1 - HEALTH_ALPHA) * self.health + HEALTH_ALPHA * (1.0 if ok else 0.0)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'health': round(self.health, 3),
+            'cooldown': max(0.0, round(self.cooldown_until - time.monotonic(), 1)),
+            **self.counts,
+        }
+
+    def close(self):
+        self.session.close()
+
+    def __repr__(self):
+        return f"EgressRoute(name='{self.name}', health={self.health:.2f})"
+
+
+class EgressPool:
+    """Spreads requests over the healthy routes with the soonest free token.
+
+    Routes whose token is free take turns, so traffic is shared evenly
+    even when no route is at its rate limit.
+    """
+
+    def __init__(self, routes):
+        """
+        Initialize the pool.
+
+        Args:
+            routes: List of EgressRoute
+        """
+        if not routes:
+            raise ValueError("an egress pool needs at least one route")
+        self.routes = routes
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, route_configs, rate=None, burst=None, pool_connections=4, pool_maxsize=16):
+        """
+        Build a pool from route dicts (see config.settings.EGRESS_ROUTES).
+
+        Each dict has a 'name' and optionally 'proxy', 'source_address',
+        'requests_per_second' and 'burst'.
+        """
+        routes = [
+            EgressRoute(
+                config.get('name', f"route-{i}"),
+                proxy=config.get('proxy'),
+                source_address=config.get('source_address'),
+                rate=config.get('requests_per_second', rate),
+                burst=config.get('burst', burst),
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+            )
+            for i, config in enumerate(route_configs, 1)
+        ]
+        return cls(routes)
+
+    def acquire(self):
+        """
+        Pick a route and block until its token bucket allows a request.
+
+        Routes in cooldown are skipped and routes below EGRESS_MIN_HEALTH are
+        only used when no healthy one is left (or to probe them once they
+        have been idle for EGRESS_COOLDOWN seconds). If every route is cooling
+        down, waits for the first cooldown to end.
+
+        Returns:
+            EgressRoute
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                available = [route for route in self.routes if not route.in_cooldown(now)]
+                if available:
+                    # An unhealthy route idle for a cooldown period gets a probe request
+                    healthy = [
+                        route for route in available
+                        if route.health >= EGRESS_MIN_HEALTH or now - route.last_used > EGRESS_COOLDOWN
+                    ]
+                    candidates = healthy or available
+                    # Soonest token first; among free routes, the least recently used
+                    route = min(candidates, key=lambda r: (r.bucket.wait_time(), r.last_used))
+                    route.last_used = now
+                    wait = route.bucket.reserve()
+                else:
+                    route = None
+                    wait = min(route.cooldown_until for route in self.routes) - now
+
+            if wait > 0:
+                time.sleep(wait)
+            if route is not None:
+                return route
+
+    def get_stats(self):
+        """Per-route health, cooldown and request counters."""
+        return [route.to_dict() for route in self.routes]
+
+    def close(self):
+        for route in self.routes:
+            route.close()
+
+    def __len__(self):
+        return len(self.routes)
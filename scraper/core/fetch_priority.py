@@ -0,0 +1,75 @@
+"""Order the detail-fetch backlog by a score predicted from listing data."""
+from datetime import datetime, timezone
+
+from ..analyzers.keyword_analyzer import KeywordAnalyzer
+from ..models.match_result import MatchResult
+from config.keyword_settings import FETCH_PRIORITY_AGING_PER_HOUR
+
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+class FetchPriority:
+    """Predicts which pending jobs are worth fetching first.
+
+    The prediction is the weighted keyword score of the listing's title,
+    company and location, which are known before the detail page is
+    fetched. Waiting time is added to it (aging_per_hour score points per
+    hour since the job was first seen), so low-scoring jobs still reach the
+    front of the backlog eventually.
+    """
+
+    def __init__(self, keyword_config, aging_per_hour=None):
+        """
+        Initialize the predictor.
+
+        Args:
+            keyword_config: KeywordConfig whose weights score the listing text
+            aging_per_hour: Priority gained per hour of waiting (default from config)
+        """
+        self.keyword_config = keyword_config
+        self.analyzer = KeywordAnalyzer(keyword_config)
+        self.aging_per_hour = FETCH_PRIORITY_AGING_PER_HOUR if aging_per_hour is None else aging_per_hour
+
+    def predict(self, job):
+        """
+        Weighted keyword score of a job's listing data.
+
+        Args:
+            job: dict with title, company and optionally location
+
+        Returns:
+            float: Same scale as MatchResult.weighted_score
+        """
+        text = ' '.join(filter(None, (job.get('title'), job.get('company'), job.get('location'))))
+        result = MatchResult(linkedin_job_id=job.get('linkedin_job_id'))
+        result.keyword_matches = self.analyzer.analyze(text)
+        result.calculate_score(self.keyword_config)
+        return result.weighted_score
+
+    def priority(self, job, now=None):
+        """
+        Predicted score plus aging since the job was first seen.
+
+        The job's searched_at timestamp is used, or its enqueued_at when it
+        has none (listings stored before searched_at was recorded).
+
+        Returns:
+            float: Higher is fetched first
+        """
+        score = self.predict(job)
+        searched_at = job.get('searched_at') or job.get('enqueued_at')
+        if searched_at and self.aging_per_hour:
+            now = now or datetime.now(timezone.utc)
+            seen = datetime.strptime(searched_at, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+            score += self.aging_per_hour * max(0.0, (now - seen).total_seconds() / 3600)
+        return score
+
+    def order(self, jobs, now=None):
+        """
+        Sort pending jobs by priority, highest first (ties keep their order).
+
+        Returns:
+            list: The same job dicts, reordered
+        """
+        now = now or datetime.now(timezone.utc)
+        return sorted(jobs, key=lambda job: -self.priority(job, now))
@@ -0,0 +1,151 @@
+"""Shared pooled HTTP client used by every fetcher."""
+import random
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import (
+    HEADER_PROFILES,
+    ROTATING_USER_AGENT_PROFILES,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    EGRESS_ROUTES,
+)
+from config.keyword_settings import USER_AGENTS
+from .egress import EgressPool
+
+
+class HttpClient:
+    """Keep-alive requests.Session with a sized connection pool and header profiles.
+
+    With egress routes configured, every request goes out through the
+    route the EgressPool picks (each route keeps its own session).
+    """
+
+    def __init__(self, pool_connections=None, pool_maxsize=None,
+                 connect_timeout=None, read_timeout=None, header_profiles=None,
+                 origin=None, egress_pool=None):
+        """
+        Initialize the client.
+
+        Args:
+            pool_connections: Number of per-host pools to cache (default from config)
+            pool_maxsize: Keep-alive connections kept per host (default from config)
+            connect_timeout: Seconds to establish a connection (default from config)
+            read_timeout: Seconds to wait for response data (default from config)
+            header_profiles: dict {profile_name: headers} (default from config)
+            origin: Send every request to this scheme://host[:port] instead of
+                the URL's own origin (e.g. a local replay server)
+            egress_pool: EgressPool to send requests through (default: one
+                built from EGRESS_ROUTES, or direct if none are configured)
+        """
+        self.pool_connections = pool_connections or HTTP_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or HTTP_POOL_MAXSIZE
+        self.timeout = (
+            connect_timeout or HTTP_CONNECT_TIMEOUT,
+            read_timeout or HTTP_READ_TIMEOUT,
+        )
+        self.header_profiles = header_profiles or HEADER_PROFILES
+        self.origin = urlsplit(origin) if origin else None
+        self.session = self._build_session()
+        if egress_pool is None and EGRESS_ROUTES:
+            egress_pool = EgressPool.from_config(
+                EGRESS_ROUTES,
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+            )
+        self.egress_pool = egress_pool
+
+    @property
+    def route_count(self):
+        """Number of egress routes (callers scale their global request ceilings by it)."""
+        return len(self.egress_pool) if self.egress_pool else 1
+
+    def _build_session(self):
+        """Create a session whose adapters keep connections alive between requests."""
+        session = requests.Session()
+        # Retries are the caller's business: they know about 429s and backoff
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def get_headers(self, profile='search'):
+        """Get request headers for a profile, rotating the User-Agent if configured."""
+        headers = dict(self.header_profiles[profile])
+        if profile in ROTATING_USER_AGENT_PROFILES:
+            headers['User-Agent'] = random.choice(USER_AGENTS)
+        return headers
+
+    def get(self, url, profile='search', timeout=None, **kwargs):
+        """
+        Perform a GET request over the pooled session.
+
+        Args:
+            url: URL to fetch
+            profile: Header profile name (e.g. 'search', 'detail')
+            timeout: Override for the (connect, read) timeout
+
+        Returns:
+            requests.Response
+        """
+        if self.origin:
+            url = urlunsplit(urlsplit(url)._replace(scheme=self.origin.scheme, netloc=self.origin.netloc))
+        if not self.egress_pool:
+            return self.session.get(
+                url,
+                headers=self.get_headers(profile),
+                timeout=timeout or self.timeout,
+                **kwargs
+            )
+
+        route = self.egress_pool.acquire()
+        try:
+            response = route.session.get(
+                url,
+                headers=self.get_headers(profile),
+                timeout=timeout or self.timeout,
+                **kwargs
+            )
+        except requests.exceptions.RequestException as e:
+            route.record(error=e)
+            raise
+        route.record(response)
+        response.egress_route = route.name
+        return response
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+        if self.egress_pool:
+            self.egress_pool.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client():
+    """Return the process-wide HttpClient, creating it on first use."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
+
+
+def set_default_client(client):
+    """Replace the process-wide HttpClient (returns the previous one)."""
+    global _default_client
+    with _default_client_lock:
+        previous = _default_client
+        _default_client = client
+        return previous
@@ -4,73 +4,100 @@ from datetime import datetime, timezone
 from ..models.match_result import MatchResult, LINKEDIN_JOB_BASE_URL
 from ..analyzers.keyword_analyzer import KeywordAnalyzer
 from .detail_scraper import DetailScraper
+from config.keyword_settings import DETAIL_ASYNC, DETAIL_STOP_CHECK_EVERY
 
 
 class KeywordMatcher:
     """Orchestrates the keyword matching workflow."""
 
-    def __init__(self, sqlite_storage, keyword_config):
+    def __init__(self, sqlite_storage, keyword_config, detail_scraper=None, analyzed_ids=None,
+                 near_duplicates=None, priority=None, prefetch_filter=None, should_stop=None):
         self.storage = sqlite_storage
         self.keyword_config = keyword_config
-        self.detail_scraper = DetailScraper()
+        self.detail_scraper = detail_scraper or DetailScraper()
         self.analyzer = KeywordAnalyzer(keyword_config)
+        # Results are saved with their keyword counts, tagged with this profile
+        self.storage.save_keyword_profile(keyword_config)
+        # Optional KnownJobIndex of analyzed jobs: duplicates are dropped before any fetch.
+        # IDs are added once saved, so jobs scheduled but never saved are retried next run.
+        self.analyzed_ids = analyzed_ids
+        # Optional NearDuplicateIndex: confirmed reposts inherit their cluster's analysis unfetched
+        self.near_duplicates = near_duplicates
+        # Optional FetchPriority: the backlog is fetched best predicted score first
+        self.priority = priority
+        # Optional PrefetchFilter: blacklisted companies and unwanted titles are never fetched
+        self.prefetch_filter = prefetch_filter
+        # Optional callable, True once shutdown was requested: checked between batches of fetches,
+        # so the jobs not yet handed to the detail scraper are left for the next run
+        self.should_stop = should_stop
 
-    def analyze_jobs(self, skip_analyzed=True):
+    def _stop_requested(self):
+        return self.should_stop is not None and self.should_stop()
+
+    def analyze_jobs(self, skip_analyzed=True, concurrent=None):
         """
         Analyze jobs for keyword matches.
 
+        With should_stop set, jobs are handed to the detail scraper
+        DETAIL_STOP_CHECK_EVERY at a time and a requested stop ends the run
+        after the current batch.
+
         Args:
             skip_analyzed: Skip jobs that already have analysis (default True)
+            concurrent: Fetch detail pages with the asyncio pipeline, analyzing
+                each page as it arrives (default from config)
 
         Returns:
             list[MatchResult]: Results sorted by weighted_score descending
         """
-        if skip_analyzed:
-            jobs = self.storage.get_jobs_without_analysis()
-        else:
-            jobs = self.storage.get_jobs_without_analysis()
+        jobs = self.storage.get_jobs_for_analysis(include_analyzed=not skip_analyzed)
+
+        if self.prefetch_filter is not None:
+            jobs = self.prefetch_filter.apply(jobs, self.storage)
+
+        if skip_analyzed and self.analyzed_ids is not None:
+            scheduled = [job for job in jobs if job['linkedin_job_id'] not in self.analyzed_ids]
+            if len(scheduled) < len(jobs):
+                print(f"♻️  Skipped {len(jobs) - len(scheduled)} already analyzed jobs")
+            jobs = scheduled
+
+        if self.near_duplicates is not None:
+            jobs = self._inherit_reposts(jobs)
 
         if not jobs:
             print("No jobs to analyze.")
             return []
 
+        if self.priority is not None:
+            jobs = self.priority.order(jobs)
+
         print(f"\n📊 Analyzing {len(jobs)} jobs for {len(self.keyword_config.keywords)} keywords...")
         print(f"   Keywords: {', '.join(self.keyword_config.keywords[:5])}{'...' if len(self.keyword_config.keywords) > 5 else ''}")
 
         results = []
 
-        for i, job in enumerate(jobs):
-            linkedin_job_id = job['linkedin_job_id']
-            job_url = f"{LINKEDIN_JOB_BASE_URL}{linkedin_job_id}/"
-
-            print(f"\n  [{i + 1}/{len(jobs)}] {job.get('title', 'Unknown')[:50]}...")
-
-            result = MatchResult(linkedin_job_id=linkedin_job_id)
-            result.date_time = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        if concurrent is None:
+            concurrent = DETAIL_ASYNC
 
-            # Scrape job details
-            details = self.detail_scraper.scrape_job_details(job_url)
+        def on_result(job, details):
+            print(f"\n  [{len(results) + 1}/{len(jobs)}] {job.get('title', 'Unknown')[:50]}...")
+            results.append(self._process_job(job, details))
 
-            if details:
-                result.description = details.get('description')
-                result.applicant_count = details.get('applicant_count')
-                result.employment_type = details.get('employment_type')
-                result.job_function = details.get('job_function')
-                result.seniority_level = details.get('seniority_level')
-                result.industries = details.get('industries')
-
-                # Analyze for keywords
-                result.keyword_matches = self.analyzer.analyze(result.description)
-                result.calculate_score(self.keyword_config)
-
-                print(f"      ✓ Score: {result.weighted_score:.1f} | Match: {result.match_percentage:.0f}% | Applicants: {result.applicant_count or 'N/A'}")
+        pending = [
+            {**job, 'job_url': f"{LINKEDIN_JOB_BASE_URL}{job['linkedin_job_id']}/"}
+            for job in jobs
+        ]
+        step = len(pending) if self.should_stop is None else DETAIL_STOP_CHECK_EVERY
+        for start in range(0, len(pending), step):
+            if self._stop_requested():
+                print(f"\n⏹️  Stop requested, {len(pending) - start} jobs left for the next run")
+                break
+            batch = pending[start:start + step]
+            if concurrent:
+                self.detail_scraper.scrape_stream(batch, on_result)
             else:
-                result.keyword_matches = {kw: 0 for kw in self.keyword_config.keywords}
-                print(f"      ✗ Failed to scrape")
-
-            # Save to database immediately (for resume capability)
-            self.storage.save_job_analysis(result)
-            results.append(result)
+                # Rate-limited pages are requeued while the next job is fetched
+                self.detail_scraper.scrape_sequential(batch, on_result)
 
         # Sort by score descending
         results.sort(key=lambda r: r.weighted_score, reverse=True)
@@ -79,12 +106,122 @@ class KeywordMatcher:
 
         return results
 
+    def drain_queue(self, queue, owner, batch_size=None):
+        """
+        Analyze jobs claimed from a DetailWorkQueue until none are available.
+
+        Each claimed batch goes through the asyncio detail pipeline. Analyzed
+        jobs are saved and acked one by one; failed fetches are nacked for a
+        later retry, and recorded as failed once out of attempts. A failed
+        job whose lease expired and was claimed by another worker is left to
+        that worker. A requested stop is honored between claimed batches.
+
+        Args:
+            queue: DetailWorkQueue shared by all workers
+            owner: Lease owner name of this worker
+            batch_size: Jobs claimed per lease (default from config)
+
+        Returns:
+            int: Number of jobs analyzed or recorded as failed
+        """
+        processed = 0
+
+        def on_result(job, details):
+            nonlocal processed
+            if details is None:
+                retry = queue.nack(owner, job['linkedin_job_id'], "detail fetch failed")
+                if retry is None:
+                    # Our lease expired and another worker holds the job now
+                    print(f"  ⏳ {job['linkedin_job_id']} lease lost, left to its new owner")
+                    return
+                if retry:
+                    print(f"  ↩️  {job['linkedin_job_id']} returned to the queue (attempt {job['attempts']})")
+                    return
+            self._process_job(job, details)
+            if details is not None:
+                queue.ack(owner, job['linkedin_job_id'])
+            processed += 1
+
+        while not self._stop_requested():
+            jobs = queue.claim(owner, batch_size)
+            if not jobs:
+                break
+            print(f"\n📥 {owner} claimed {len(jobs)} jobs")
+            if self.near_duplicates is not None:
+                # Pick up clusters the other workers fingerprinted since the last batch
+                self.near_duplicates.reload()
+                fetch = self._inherit_reposts(jobs)
+                fetch_ids = {job['linkedin_job_id'] for job in fetch}
+                for job in jobs:
+                    if job['linkedin_job_id'] not in fetch_ids:
+                        queue.ack(owner, job['linkedin_job_id'])
+                processed += len(jobs) - len(fetch)
+                jobs = fetch
+            pending = [
+                {**job, 'job_url': f"{LINKEDIN_JOB_BASE_URL}{job['linkedin_job_id']}/"}
+                for job in jobs
+            ]
+            self.detail_scraper.scrape_stream(pending, on_result)
+
+        return processed
+
+    def _inherit_reposts(self, jobs):
+        """
+        Copy the analysis of known repost clusters to matching jobs.
+
+        Returns:
+            list: The jobs that still need fetching
+        """
+        remaining = []
+        for job in jobs:
+            source_id = self.near_duplicates.inherit(job['linkedin_job_id'], job.get('title'), job.get('company'))
+            if source_id is None:
+                remaining.append(job)
+            elif self.analyzed_ids is not None:
+                self.analyzed_ids.add(job['linkedin_job_id'])
+        inherited = len(jobs) - len(remaining)
+        if inherited:
+            print(f"🧬 {inherited} reposts inherited their cluster's analysis ({inherited} detail requests saved)")
+        return remaining
+
+    def _process_job(self, job, details):
+        """Analyze scraped details for one job and save the result."""
+        result = MatchResult(linkedin_job_id=job['linkedin_job_id'])
+        result.date_time = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        if details:
+            result.description = details.get('description')
+            result.applicant_count = details.get('applicant_count')
+            result.employment_type = details.get('employment_type')
+            result.job_function = details.get('job_function')
+            result.seniority_level = details.get('seniority_level')
+            result.industries = details.get('industries')
+
+            # Analyze for keywords
+            result.keyword_matches = self.analyzer.analyze(result.description)
+            result.calculate_score(self.keyword_config)
+
+            print(f"      ✓ Score: {result.weighted_score:.1f} | Match: {result.match_percentage:.0f}% | Applicants: {result.applicant_count or 'N/A'}")
+        else:
+            result.keyword_matches = {kw: 0 for kw in self.keyword_config.keywords}
+            print(f"      ✗ Failed to scrape")
+
+        # Save to database immediately (for resume capability)
+        self.storage.save_job_analysis(result, self.keyword_config)
+        if self.analyzed_ids is not None:
+            self.analyzed_ids.add(result.linkedin_job_id)
+        if details and self.near_duplicates is not None:
+            self.near_duplicates.add(result.linkedin_job_id, job.get('title'), job.get('company'),
+                                     result.description)
+        return result
+
     def get_ranked_jobs(self, min_score=0, min_keywords=0, limit=None):
         """Get previously analyzed jobs, ranked by score."""
         return self.storage.get_analyzed_jobs(
             min_score=min_score,
             min_keywords=min_keywords,
-            limit=limit
+            limit=limit,
+            include_description=False,
         )
 
     def display_results(self, results, top_n=10):
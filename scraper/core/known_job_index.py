@@ -0,0 +1,119 @@
+"""Compact in-memory index of LinkedIn job IDs already in the database."""
+import threading
+from array import array
+from bisect import bisect_left
+
+# Multipliers for double hashing (64-bit golden ratio and a large odd constant)
+_HASH_MUL_1 = 0x9E3779B97F4A7C15
+_HASH_MUL_2 = 0xC2B2AE3D27D4EB4F
+_MASK_64 = (1 << 64) - 1
+
+
+class KnownJobIndex:
+    """Set of job IDs backed by a sorted int64 array with a Bloom filter in front.
+
+    A Bloom filter miss answers "new" in constant time, which is the common
+    case when checking fresh search results. A hit is confirmed against the
+    sorted array (or the IDs added since loading), so answers are exact.
+    Memory is about 8 bytes per ID plus `bits_per_id` bits.
+    """
+
+    def __init__(self, job_ids=(), bits_per_id=10, num_hashes=7, headroom=4096):
+        """
+        Initialize the index.
+
+        Args:
+            job_ids: Iterable of job IDs (str or int) known at load time
+            bits_per_id: Bloom filter bits per expected ID (10 -> ~1% false positives)
+            num_hashes: Bloom filter hash functions
+            headroom: Extra IDs the filter is sized for beyond the initial load
+        """
+        self._sorted = array('q', sorted({int(job_id) for job_id in job_ids}))
+        self._added = set()
+        self._num_hashes = num_hashes
+        self._num_bits = max(64, (len(self._sorted) + headroom) * bits_per_id)
+        self._bloom = bytearray((self._num_bits + 7) // 8)
+        self._lock = threading.Lock()
+
+        for job_id in self._sorted:
+            self._bloom_add(job_id)
+
+    @classmethod
+    def from_storage(cls, storage, analyzed=False):
+        """
+        Load the index from the database.
+
+        Args:
+            storage: SQLiteStorage instance
+            analyzed: Index job_posts (analyzed jobs) instead of job_searches (seen jobs)
+        """
+        if analyzed:
+            return cls(storage.get_analyzed_job_ids())
+        return cls(storage.get_known_job_ids())
+
+    def _positions(self, job_id):
+        h1 = (job_id * _HASH_MUL_1) & _MASK_64
+        h2 = ((job_id * _HASH_MUL_2) & _MASK_64) | 1
+        return [((h1 + i * h2) & _MASK_64) % self._num_bits for i in range(self._num_hashes)]
+
+    def _bloom_add(self, job_id):
+        for pos in self._positions(job_id):
+            self._bloom[pos >> 3] |= 1 << (pos & 7)
+
+    def _bloom_may_contain(self, job_id):
+        for pos in self._positions(job_id):
+            if not self._bloom[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def _contains(self, job_id):
+        if not self._bloom_may_contain(job_id):
+            return False
+        if job_id in self._added:
+            return True
+        i = bisect_left(self._sorted, job_id)
+        return i < len(self._sorted) and self._sorted[i] == job_id
+
+    @staticmethod
+    def _as_int(job_id):
+        """Numeric form of a job ID, or None for a missing or non-numeric one."""
+        try:
+            return int(job_id)
+        except (TypeError, ValueError):
+            return None
+
+    def __contains__(self, job_id):
+        job_id = self._as_int(job_id)
+        return job_id is not None and self._contains(job_id)
+
+    def add(self, job_id):
+        """
+        Record a job ID.
+
+        Returns:
+            bool: True if the ID was new, False if it was already known
+                or is missing/non-numeric (such IDs are never recorded)
+        """
+        job_id = self._as_int(job_id)
+        if job_id is None:
+            return False
+        with self._lock:
+            if self._contains(job_id):
+                return False
+            self._added.add(job_id)
+            self._bloom_add(job_id)
+            return True
+
+    def __len__(self):
+        return len(self._sorted) + len(self._added)
+
+    def memory_bytes(self):
+        """Approximate memory held by the index structures."""
+        return (
+            self._sorted.itemsize * len(self._sorted)
+            + len(self._bloom)
+            + 64 * len(self._added)  # set slot plus int object
+        )
+
+    def __repr__(self):
+        return f"KnownJobIndex(ids={len(self)}, memory={self.memory_bytes() / 1024:.0f}KB)"
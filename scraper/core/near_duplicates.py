@@ -0,0 +1,259 @@
+"""Near-duplicate posting detection: MinHash fingerprints with an LSH index."""
+import re
+import threading
+import unicodedata
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+from config.keyword_settings import (
+    DEDUP_SIMILARITY,
+    DEDUP_NUM_PERM,
+    DEDUP_BANDS,
+    DEDUP_SHINGLE_SIZE,
+    DEDUP_MIN_CLUSTER_SIZE,
+)
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+_TITLE_ABBREVIATIONS = {'sr': 'senior', 'jr': 'junior', 'ssr': 'semisenior', 'dev': 'developer', 'eng': 'engineer'}
+_COMPANY_SUFFIXES = {'inc', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co', 'sa', 'srl', 'sas', 'gmbh', 'bv', 'plc'}
+# Seeded so stored signatures stay comparable across runs
+_PERMUTATION_SEED = 20240601
+
+
+def _tokens(text):
+    folded = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode('ascii').lower()
+    return _NON_ALNUM.sub(' ', folded).split()
+
+
+def normalize_title_key(title, company):
+    """
+    Listing key that survives cosmetic edits of title and company.
+
+    Accents, case, punctuation, common abbreviations ("Sr." = "Senior") and
+    company legal suffixes ("Inc.", "S.A.") are ignored.
+
+    Returns:
+        str: "title|company"
+    """
+    title_tokens = [_TITLE_ABBREVIATIONS.get(token, token) for token in _tokens(title)]
+    company_tokens = [token for token in _tokens(company) if token not in _COMPANY_SUFFIXES]
+    return f"{' '.join(title_tokens)}|{' '.join(company_tokens)}"
+
+
+class MinHasher:
+    """MinHash signatures of word shingles (multiply-shift hashing on uint64)."""
+
+    def __init__(self, num_perm=None, shingle_size=None):
+        self.num_perm = num_perm or DEDUP_NUM_PERM
+        self.shingle_size = shingle_size or DEDUP_SHINGLE_SIZE
+        rng = np.random.default_rng(_PERMUTATION_SEED)
+        self._mul = rng.integers(1, 2 ** 63, size=self.num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._add = rng.integers(0, 2 ** 63, size=self.num_perm, dtype=np.uint64)
+
+    def signature(self, text):
+        """
+        MinHash signature of a description.
+
+        Returns:
+            np.ndarray of uint32 (num_perm,), or None if the text has no words
+        """
+        tokens = _tokens(text)
+        if not tokens:
+            return None
+        size = min(self.shingle_size, len(tokens))
+        shingles = {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64, count=len(shingles))
+        # Wrapping multiply-shift: the high 32 bits of a*x+b are a universal hash of x
+        permuted = (hashes[:, None] * self._mul + self._add) >> np.uint64(32)
+        return permuted.min(axis=0).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """Clusters of reposted jobs, found by description similarity.
+
+    Each analyzed job's description gets a MinHash signature. LSH banding
+    (DEDUP_BANDS bands of the signature) finds candidate matches, which
+    are confirmed when the estimated Jaccard similarity reaches
+    DEDUP_SIMILARITY. A matching job joins the existing cluster; otherwise it
+    starts a new one.
+
+    Before fetching, a new listing whose normalized title/company key
+    belongs to exactly one cluster with at least DEDUP_MIN_CLUSTER_SIZE
+    postings (fetched or inherited) can inherit that cluster's analysis. Such a posting is a
+    confirmed repost, so fetching it again would be wasted.
+    """
+
+    def __init__(self, storage, similarity=None, bands=None, min_cluster_size=None, hasher=None,
+                 backfill=True):
+        """
+        Initialize the index from the job_fingerprints table.
+
+        Jobs analyzed before fingerprints existed are fingerprinted first,
+        unless backfill is False.
+
+        Args:
+            storage: SQLiteStorage with job_posts and job_fingerprints
+            similarity: Estimated Jaccard similarity that makes a duplicate (default from config)
+            bands: LSH bands; DEDUP_NUM_PERM must divide evenly (default from config)
+            min_cluster_size: Postings a cluster needs before reposts inherit it (default from config)
+            hasher: MinHasher (default: from config)
+            backfill: Fingerprint analyzed jobs without one (work processes
+                leave this to the parent, so they don't race to do it)
+        """
+        self.storage = storage
+        self.similarity = similarity or DEDUP_SIMILARITY
+        self.hasher = hasher or MinHasher()
+        self.bands = bands or DEDUP_BANDS
+        if self.hasher.num_perm % self.bands:
+            raise ValueError(f"{self.hasher.num_perm} permutations cannot be split into {self.bands} bands")
+        self.rows_per_band = self.hasher.num_perm // self.bands
+        self.min_cluster_size = min_cluster_size or DEDUP_MIN_CLUSTER_SIZE
+
+        self._signatures = {}
+        self._clusters = {}
+        self._title_keys = {}
+        self._buckets = defaultdict(list)
+        self._key_clusters = defaultdict(set)
+        self._cluster_sizes = defaultdict(int)
+        self._lock = threading.Lock()
+        self._seq = 0
+
+        self.reload()
+        if backfill:
+            self.backfill()
+
+    def reload(self):
+        """Index fingerprints written since the last load (e.g. by other work processes). Returns how many."""
+        with self._lock:
+            rows = self.storage.get_fingerprints(after_seq=self._seq)
+            for seq, job_id, title_key, signature, cluster_id in rows:
+                if signature is not None:
+                    signature = np.frombuffer(signature, dtype=np.uint32)
+                self._index(job_id, title_key, signature, cluster_id)
+                self._seq = seq
+            return len(rows)
+
+    def backfill(self):
+        """Fingerprint analyzed jobs that have none yet. Returns how many were added."""
+        rows = self.storage.get_unfingerprinted_posts()
+        for job_id, title, company, description in rows:
+            self._store(job_id, normalize_title_key(title, company), self.hasher.signature(description), None)
+        if rows:
+            print(f"🧬 Fingerprinted {len(rows)} analyzed jobs")
+        return len(rows)
+
+    def _band_keys(self, signature):
+        rows = self.rows_per_band
+        return [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(self.bands)]
+
+    def _forget(self, job_id):
+        """Drop a job from the index (it is being fingerprinted again)."""
+        cluster_id = self._clusters.pop(job_id)
+        self._cluster_sizes[cluster_id] -= 1
+        title_key = self._title_keys.pop(job_id)
+        if title_key and not any(
+            self._clusters[other] == cluster_id
+            for other, key in self._title_keys.items() if key == title_key
+        ):
+            self._key_clusters[title_key].discard(cluster_id)
+        signature = self._signatures.pop(job_id, None)
+        if signature is not None:
+            for band_key in self._band_keys(signature):
+                self._buckets[band_key].remove(job_id)
+
+    def _index(self, job_id, title_key, signature, cluster_id):
+        if job_id in self._clusters:
+            self._forget(job_id)
+        self._clusters[job_id] = cluster_id
+        self._title_keys[job_id] = title_key
+        self._cluster_sizes[cluster_id] += 1
+        if title_key:
+            self._key_clusters[title_key].add(cluster_id)
+        if signature is not None:
+            self._signatures[job_id] = signature
+            for band_key in self._band_keys(signature):
+                self._buckets[band_key].append(job_id)
+
+    def find_duplicate(self, signature, exclude=None):
+        """
+        Most similar indexed job at or above the similarity threshold.
+
+        Args:
+            signature: MinHash signature from MinHasher.signature
+            exclude: job_id to leave out of the candidates
+
+        Returns:
+            tuple (job_id, similarity) or None
+        """
+        if signature is None:
+            return None
+        candidates = {job_id for band_key in self._band_keys(signature) for job_id in self._buckets.get(band_key, ())}
+        best = None
+        candidates.discard(exclude)
+        for job_id in candidates:
+            similarity = float(np.mean(self._signatures[job_id] == signature))
+            if similarity >= self.similarity and (best is None or similarity > best[1]):
+                best = (job_id, similarity)
+        return best
+
+    def _store(self, job_id, title_key, signature, inherited_from):
+        """Assign a cluster, persist the fingerprint and index it. Returns the cluster id."""
+        duplicate = self.find_duplicate(signature, exclude=job_id)
+        cluster_id = self._clusters[duplicate[0]] if duplicate else job_id
+        blob = signature.tobytes() if signature is not None else None
+        self.storage.save_fingerprint(job_id, title_key, blob, cluster_id, inherited_from)
+        self._index(job_id, title_key, signature, cluster_id)
+        return cluster_id
+
+    def add(self, job_id, title, company, description):
+        """
+        Fingerprint a freshly analyzed job and put it in its cluster.
+
+        Returns:
+            str: Cluster id (the job_id of the cluster's first posting)
+        """
+        with self._lock:
+            return self._store(job_id, normalize_title_key(title, company), self.hasher.signature(description), None)
+
+    def inheritable_source(self, title, company):
+        """
+        Analyzed job whose analysis a new listing can reuse, if any.
+
+        Returns:
+            str job_id of the cluster's first posting, or None
+        """
+        clusters = self._key_clusters.get(normalize_title_key(title, company), ())
+        if len(clusters) != 1:
+            return None
+        cluster_id = next(iter(clusters))
+        if self._cluster_sizes[cluster_id] < self.min_cluster_size:
+            return None
+        return cluster_id
+
+    def inherit(self, job_id, title, company):
+        """
+        Copy a cluster's analysis to a new repost instead of fetching it.
+
+        Returns:
+            str source job_id, or None if the listing matches no confirmed cluster
+        """
+        with self._lock:
+            source_id = self.inheritable_source(title, company)
+            if source_id is None or not self.storage.copy_job_analysis(source_id, job_id):
+                return None
+            title_key = normalize_title_key(title, company)
+            signature = self._signatures.get(source_id)
+            blob = signature.tobytes() if signature is not None else None
+            self.storage.save_fingerprint(job_id, title_key, blob, source_id, source_id)
+            self._index(job_id, title_key, signature, source_id)
+            return source_id
+
+    def get_stats(self):
+        """Number of fingerprinted jobs and of clusters with reposts."""
+        return {
+            'jobs': len(self._clusters),
+            'clusters': len(self._cluster_sizes),
+            'repost_clusters': sum(1 for size in self._cluster_sizes.values() if size > 1),
+        }
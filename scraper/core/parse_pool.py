@@ -0,0 +1,87 @@
+"""Process pool that parses raw pages off the fetching threads."""
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from ..extractors.linkedin_extractor import LinkedInExtractor
+from ..models.job import Job
+from .detail_scraper import parse_details
+from config.settings import PARSE_WORKERS
+
+# Per-process state, set up once by _init_worker
+_extractor = None
+_detail_parse_mode = None
+
+
+def _init_worker(detail_parse_mode):
+    global _extractor, _detail_parse_mode
+    _extractor = LinkedInExtractor()
+    _detail_parse_mode = detail_parse_mode
+
+
+def _parse_listing(content, max_results):
+    """Parse a search results page into job dicts."""
+    jobs = _extractor.extract_jobs_from_html(content, max_results=max_results)
+    return [job.to_dict() for job in jobs]
+
+
+def _parse_detail(content):
+    """Parse a job detail page into a details dict."""
+    return parse_details(content, _detail_parse_mode)
+
+
+class ParsePool:
+    """Runs LinkedInExtractor and detail page parsing in worker processes.
+
+    Fetching threads (or the detail event loop) hand over raw response
+    bytes and get plain dicts back, so HTML parsing no longer competes
+    with network I/O for the GIL.
+    """
+
+    def __init__(self, workers=None, detail_parse_mode=None):
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Number of parse processes (default from config, else os.cpu_count())
+            detail_parse_mode: Detail parse mode for the workers (default from config)
+        """
+        self.workers = workers or PARSE_WORKERS or os.cpu_count()
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(detail_parse_mode,),
+        )
+
+    def parse_listing(self, content, max_results=None):
+        """
+        Parse a search results page in a worker process.
+
+        Args:
+            content: Response body (bytes)
+            max_results: Maximum number of jobs to extract (None for all)
+
+        Returns:
+            list[Job]
+        """
+        job_dicts = self.executor.submit(_parse_listing, content, max_results).result()
+        return [Job(**job_data) for job_data in job_dicts]
+
+    def parse_detail(self, content):
+        """Parse a job detail page in a worker process (see detail_scraper.parse_details)."""
+        return self.executor.submit(_parse_detail, content).result()
+
+    async def parse_detail_async(self, content):
+        """Await parse_detail without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _parse_detail, content)
+
+    def close(self):
+        """Shut the worker processes down."""
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,82 @@
+"""Drop pending jobs that are not worth a detail request."""
+import re
+
+from config.keyword_settings import TITLE_INCLUDE_PATTERNS, TITLE_EXCLUDE_PATTERNS
+
+
+def _compile(patterns):
+    """One case-insensitive regex for a list of patterns (None if the list is empty)."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+
+class PrefetchFilter:
+    """Blacklist and title rules applied before any detail page is fetched.
+
+    Jobs come from get_jobs_for_analysis, which flags blacklisted companies
+    with a join against blacklisted_companies (same exact-name match as the
+    dashboard). Titles are then checked against the include patterns (a job
+    must match one, if any are configured) and the exclude patterns.
+    """
+
+    def __init__(self, include=None, exclude=None):
+        """
+        Initialize the filter.
+
+        Args:
+            include: Title regexes of which one must match (default from config; empty = any title)
+            exclude: Title regexes that drop a job (default from config)
+        """
+        self.include = _compile(TITLE_INCLUDE_PATTERNS if include is None else include)
+        self.exclude = _compile(TITLE_EXCLUDE_PATTERNS if exclude is None else exclude)
+
+    def reason(self, job):
+        """
+        Why a job should not be fetched.
+
+        Returns:
+            str ('blacklisted', 'title_excluded', 'title_not_included') or None to keep it
+        """
+        if job.get('blacklisted'):
+            return 'blacklisted'
+        title = job.get('title') or ''
+        if self.exclude is not None and self.exclude.search(title):
+            return 'title_excluded'
+        if self.include is not None and not self.include.search(title):
+            return 'title_not_included'
+        return None
+
+    def apply(self, jobs, storage=None):
+        """
+        Keep the jobs worth fetching and report how many requests were saved.
+
+        Args:
+            jobs: Pending job dicts (from get_jobs_for_analysis)
+            storage: Optional SQLiteStorage recording the drops, so jobs
+                dropped on an earlier run are not reported as savings again
+
+        Returns:
+            list: Jobs that passed the filter, in their original order
+        """
+        kept = []
+        dropped = []
+        for job in jobs:
+            reason = self.reason(job)
+            if reason is None:
+                kept.append(job)
+            else:
+                dropped.append((job['linkedin_job_id'], reason))
+
+        new_ids = storage.record_prefetch_drops(dropped) if storage is not None else {job_id for job_id, _ in dropped}
+        reasons = {}
+        for job_id, reason in dropped:
+            if job_id in new_ids:
+                reasons[reason] = reasons.get(reason, 0) + 1
+        if reasons:
+            details = ', '.join(f"{count} {reason.replace('_', ' ')}" for reason, count in sorted(reasons.items()))
+            print(f"🚫 Filtered {len(new_ids)} new jobs before fetching ({details}): "
+                  f"{len(new_ids)} detail requests saved")
+        if len(dropped) > len(new_ids):
+            print(f"🚫 Skipped {len(dropped) - len(new_ids)} jobs filtered on earlier runs")
+        return kept
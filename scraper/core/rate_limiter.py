@@ -0,0 +1,109 @@
+"""Thread-safe token bucket rate limiting shared across fetch workers."""
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of busy-waiting."""
+
+    def __init__(self, rate, burst=1):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens that can accumulate
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait_time(self):
+        """Seconds until a token would be available, without taking one."""
+        with self._lock:
+            tokens = min(self.burst, self._tokens + (time.monotonic() - self._updated) * self.rate)
+            return 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+
+    def reserve(self):
+        """
+        Take one token, possibly borrowing from the future.
+
+        Returns:
+            float: Seconds the caller must wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block until a token is available. Returns seconds waited."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """Keeps one token bucket per host so concurrent workers share politeness."""
+
+    def __init__(self, rate, burst=1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Requests per second allowed for each host
+            burst: Requests allowed back-to-back before throttling kicks in
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket_for(self, url):
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def reserve(self, url):
+        """Reserve a request slot for the host of `url` without sleeping."""
+        return self._bucket_for(url).reserve()
+
+    def acquire(self, url):
+        """Block until the host of `url` may be requested. Returns seconds waited."""
+        return self._bucket_for(url).acquire()
+
+
+class AsyncRateLimiter:
+    """Global requests-per-second ceiling for asyncio tasks."""
+
+    def __init__(self, rate, burst=1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Requests per second allowed across all tasks
+            burst: Requests allowed back-to-back before throttling kicks in
+        """
+        self._bucket = TokenBucket(rate, burst)
+
+    async def acquire(self):
+        """Suspend the calling task until a request slot is available."""
+        wait = self._bucket.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
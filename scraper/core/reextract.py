@@ -0,0 +1,91 @@
+"""Rebuild stored job fields from the raw page archive, without any network."""
+import contextlib
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ..extractors.linkedin_extractor import LinkedInExtractor, extract_job_id
+from ..models.job import Job
+from .detail_scraper import parse_details
+from utils.html_archive import HtmlArchive
+
+# Per-process state, set up once by _init_worker
+_archive = None
+_extractor = None
+
+
+def _init_worker(archive_root):
+    global _archive, _extractor
+    _archive = HtmlArchive(archive_root)
+    _extractor = LinkedInExtractor()
+
+
+def _extract_entry(entry):
+    """Parse one archived page. Returns (kind, url, payload) with picklable payload."""
+    content = _archive.load(entry['sha256'])
+
+    if entry['kind'] == 'detail':
+        job_id = extract_job_id(entry['url'])
+        return entry['kind'], entry['url'], (job_id, parse_details(content))
+
+    # The extractor reports progress per page; thousands of pages would drown the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        jobs = _extractor.extract_jobs_from_html(content, max_results=None)
+    return entry['kind'], entry['url'], [job.to_dict() for job in jobs]
+
+
+def reextract_archive(storage, archive=None, workers=None, chunksize=16):
+    """
+    Re-run listing and detail extraction over the latest archived fetch of every URL.
+
+    Args:
+        storage: SQLiteStorage whose job_searches / job_posts rows are updated
+        archive: HtmlArchive to read from (default: data/archive)
+        workers: Number of parse processes (default: os.cpu_count())
+        chunksize: Archive entries handed to a worker at a time
+
+    Returns:
+        dict with page and row counts and elapsed seconds
+    """
+    archive = archive or HtmlArchive()
+    entries = archive.get_latest_fetches()
+    start = time.perf_counter()
+
+    details_by_id = {}
+    jobs_by_id = {}
+
+    print(f"♻️  Re-extracting {len(entries)} archived pages...")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(str(archive.root),),
+    ) as executor:
+        for kind, url, payload in executor.map(_extract_entry, entries, chunksize=chunksize):
+            if kind == 'detail':
+                job_id, details = payload
+                if job_id:
+                    details_by_id[job_id] = details
+            else:
+                # Entries come oldest first, so newer listings win
+                for job_data in payload:
+                    if job_data.get('linkedin_job_id'):
+                        jobs_by_id[job_data['linkedin_job_id']] = Job(**job_data)
+
+    posts_updated = storage.update_job_post_details(details_by_id) if details_by_id else 0
+    searches_updated = storage.update_search_listings(jobs_by_id.values()) if jobs_by_id else 0
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"✅ Re-extracted {len(entries)} pages in {elapsed:.1f}s: "
+        f"{posts_updated} job_posts rows, {searches_updated} job_searches rows updated"
+    )
+
+    return {
+        'pages': len(entries),
+        'detail_pages': len(details_by_id),
+        'listing_jobs': len(jobs_by_id),
+        'job_posts_updated': posts_updated,
+        'job_searches_updated': searches_updated,
+        'elapsed': elapsed,
+    }
@@ -0,0 +1,158 @@
+"""Re-score stored job descriptions for the current keywords, without any network."""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+
+from ..analyzers.keyword_analyzer import compile_keywords
+from ..models.match_result import MatchResult
+from config.keyword_settings import RESCORE_BATCH_SIZE
+
+
+def _count_batch(rows, case_sensitive):
+    """Count the missing terms of (linkedin_job_id, description, terms) rows."""
+    counted = []
+    for job_id, description, terms in rows:
+        counts = {}
+        if description:
+            text = description if case_sensitive else description.lower()
+            counts = compile_keywords(terms, case_sensitive).count(text)
+        counted.append((job_id, terms, counts))
+    return counted
+
+
+def score_from_counts(job_id, term_counts, keyword_config):
+    """
+    Build a scored MatchResult from stored term counts (no text scan).
+
+    Args:
+        job_id: linkedin_job_id
+        term_counts: {term: count} covering every term of keyword_config
+        keyword_config: KeywordConfig with the keywords and weights to apply
+
+    Returns:
+        MatchResult with the same scores a fresh analysis would give
+    """
+    result = MatchResult(linkedin_job_id=job_id)
+    result.keyword_matches = {
+        kw: term_counts[keyword_config.term(kw)] for kw in keyword_config.keywords
+    }
+    result.calculate_score(keyword_config)
+    return result
+
+
+def count_missing_terms(storage, keyword_config, workers=None, batch_size=None):
+    """
+    Store the counts of every keyword a job post has no stored count for.
+
+    Missing terms are searched in the descriptions in a process pool, in
+    streamed batches, and each batch is written back in one transaction.
+
+    Args:
+        storage: SQLiteStorage whose job_posts rows are counted
+        keyword_config: KeywordConfig with the keywords to count
+        workers: Number of counting processes (default: os.cpu_count())
+        batch_size: Job posts per batch and per write transaction (default from config)
+
+    Returns:
+        dict with counted_jobs and counted_terms (keyword/job pairs searched)
+    """
+    batch_size = batch_size or RESCORE_BATCH_SIZE
+    storage.save_keyword_profile(keyword_config)
+    stats = {'counted_jobs': 0, 'counted_terms': 0}
+    to_count, _ = storage.count_stale_job_posts(keyword_config)
+    if not to_count:
+        return stats
+
+    start = time.perf_counter()
+    terms = set(keyword_config.terms())
+    case_sensitive = keyword_config.case_sensitive
+    covered = storage.get_keyword_profile_terms()
+
+    def missing_terms(keywords_hash):
+        known, known_case = covered.get(keywords_hash, (set(), None))
+        if known_case != case_sensitive:
+            known = set()
+        return tuple(sorted(terms - known))
+
+    print(f"🔢 Counting missing keywords for {to_count} job posts...")
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def write(futures):
+            for future in futures:
+                counted = future.result()
+                storage.save_keyword_counts(counted, case_sensitive, keyword_config.keywords_hash)
+                stats['counted_jobs'] += len(counted)
+                stats['counted_terms'] += sum(len(job_terms) for _, job_terms, _ in counted)
+                rate = stats['counted_jobs'] / (time.perf_counter() - start)
+                print(f"  [{stats['counted_jobs']}/{to_count}] {rate:.0f} jobs/s")
+
+        # A couple of batches per worker in flight keeps them busy with bounded memory
+        in_flight = set()
+        for rows in storage.iter_jobs_missing_counts(keyword_config.keywords_hash, batch_size):
+            batch = [(job_id, description, missing_terms(job_hash)) for job_id, description, job_hash in rows]
+            # Jobs whose counts already cover every term only need their hash updated
+            storage.save_keyword_counts(
+                [(job_id, (), {}) for job_id, _, job_terms in batch if not job_terms],
+                case_sensitive, keyword_config.keywords_hash,
+            )
+            batch = [row for row in batch if row[2]]
+            if not batch:
+                continue
+            in_flight.add(executor.submit(_count_batch, batch, case_sensitive))
+            if len(in_flight) >= 2 * workers:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                write(finished)
+        write(as_completed(in_flight))
+    return stats
+
+
+def rescore_job_posts(storage, keyword_config, workers=None, batch_size=None, full=False):
+    """
+    Bring the scores of every stored job post up to date with keyword_config.
+
+    Only keywords a job has no stored count for are searched in its
+    description (see count_missing_terms); scores are then derived from the
+    stored counts. A weights-only change therefore scans no text at all,
+    and adding a keyword scans for that keyword only.
+
+    Args:
+        storage: SQLiteStorage whose job_posts rows are re-scored
+        keyword_config: KeywordConfig with the keywords and weights to apply
+        workers: Number of counting processes (default: os.cpu_count())
+        batch_size: Job posts per batch and per write transaction (default from config)
+        full: Forget stored counts and recount every keyword of every job
+
+    Returns:
+        dict with counted/scored job counts, terms counted, elapsed seconds
+        and jobs per second
+    """
+    batch_size = batch_size or RESCORE_BATCH_SIZE
+    if full:
+        storage.reset_keyword_counts()
+    storage.save_keyword_profile(keyword_config)
+
+    to_count, to_score = storage.count_stale_job_posts(keyword_config)
+    stats = {'counted_jobs': 0, 'counted_terms': 0, 'scored_jobs': 0, 'elapsed': 0.0, 'jobs_per_second': 0.0}
+    if not to_count and not to_score:
+        print("✅ All job post scores are up to date")
+        return stats
+
+    start = time.perf_counter()
+    stats.update(count_missing_terms(storage, keyword_config, workers, batch_size))
+
+    for batch in storage.iter_job_keyword_counts(keyword_config, batch_size):
+        results = [score_from_counts(job_id, term_counts, keyword_config) for job_id, term_counts in batch]
+        storage.update_job_scores([
+            (r.linkedin_job_id, r.total_matches, r.weighted_score, r.matched_keywords, r.match_percentage)
+            for r in results
+        ], profile_hash=keyword_config.profile_hash)
+        stats['scored_jobs'] += len(results)
+
+    stats['elapsed'] = time.perf_counter() - start
+    stats['jobs_per_second'] = stats['scored_jobs'] / stats['elapsed'] if stats['elapsed'] else 0.0
+    print(
+        f"✅ Re-scored {stats['scored_jobs']} job posts in {stats['elapsed']:.1f}s "
+        f"({stats['jobs_per_second']:.0f} jobs/s); counted {stats['counted_terms']} "
+        f"keyword/job pairs for {stats['counted_jobs']} jobs"
+    )
+    return stats
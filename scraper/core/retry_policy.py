@@ -0,0 +1,248 @@
+"""Retry policy shared by all fetchers: backoff, Retry-After and per-host circuit breaking."""
+import heapq
+import itertools
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+
+from config.keyword_settings import (
+    MAX_RETRIES,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_COOLDOWN,
+)
+
+# Responses worth another attempt; anything else (404, 410...) is final
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """Stops requests to a host after repeated failures.
+
+    After `threshold` consecutive failures the circuit opens for `cooldown`
+    seconds. Then a single trial request is let through: success closes the
+    circuit, failure opens it again.
+    """
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    def wait_time(self):
+        """
+        Seconds to hold off before requesting this host (0 = go ahead).
+
+        While half-open, the caller that gets 0 is the trial request.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            remaining = self.opened_at + self.cooldown - time.monotonic()
+            if remaining > 0:
+                return remaining
+            if self._trial_in_flight:
+                return min(self.cooldown, 1.0)
+            self._trial_in_flight = True
+            return 0.0
+
+    def release(self):
+        """End a trial request without counting its outcome either way."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record(self, success):
+        with self._lock:
+            self._trial_in_flight = False
+            if success:
+                self.failures = 0
+                self.opened_at = None
+                return
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """Decides whether and when a failed fetch is retried.
+
+    Retries 429, 5xx and connection/timeout errors up to max_retries times,
+    waiting Retry-After when the server sends one and otherwise an
+    exponential backoff with jitter. Keeps one CircuitBreaker per host.
+
+    A 429 that came through an egress route is not a breaker failure: the
+    egress pool already cooled that route down, and the other routes to
+    the same host are still fine.
+    """
+
+    def __init__(self, max_retries=None, base_delay=None, max_delay=None,
+                 breaker_threshold=None, breaker_cooldown=None):
+        """
+        Initialize the policy.
+
+        Args:
+            max_retries: Retries per URL (default from config)
+            base_delay: Seconds before the first retry (default from config)
+            max_delay: Backoff ceiling in seconds (default from config)
+            breaker_threshold: Consecutive failures that open a host's circuit (default from config)
+            breaker_cooldown: Seconds an open circuit waits before a trial (default from config)
+        """
+        self.max_retries = MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = RETRY_BASE_DELAY if base_delay is None else base_delay
+        self.max_delay = max_delay or RETRY_MAX_DELAY
+        self.breaker_threshold = breaker_threshold or CIRCUIT_BREAKER_THRESHOLD
+        self.breaker_cooldown = CIRCUIT_BREAKER_COOLDOWN if breaker_cooldown is None else breaker_cooldown
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, url):
+        """Circuit breaker of the host of `url`."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.breaker_threshold, self.breaker_cooldown)
+                self._breakers[host] = breaker
+            return breaker
+
+    @staticmethod
+    def is_retryable(response=None, error=None):
+        """True for 429/5xx responses and connection or timeout errors."""
+        if error is not None:
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        return response is not None and response.status_code in RETRY_STATUSES
+
+    def backoff(self, attempt, response=None):
+        """
+        Seconds to wait before retry number `attempt` (1-based).
+
+        Retry-After wins when present; otherwise base_delay * 2^(attempt-1),
+        capped at max_delay, with "equal jitter" (half fixed, half random).
+        """
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return retry_after
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def record(self, url, response=None, error=None):
+        """
+        Feed an attempt's outcome to the host's breaker and classify it.
+
+        Returns:
+            str: 'ok', 'retry' (retryable failure) or 'fail' (final failure)
+        """
+        retryable = self.is_retryable(response, error)
+        breaker = self.breaker_for(url)
+        if retryable and response is not None and response.status_code == 429 \
+                and getattr(response, 'egress_route', None):
+            breaker.release()
+        else:
+            breaker.record(success=not retryable)
+        if retryable:
+            return 'retry'
+        if error is not None:
+            return 'fail'
+        return 'ok' if response.ok else 'fail'
+
+
+def fetch_with_retry(http_client, url, policy=None, profile='detail', on_retry=None):
+    """
+    GET a URL under a RetryPolicy, sleeping between attempts.
+
+    For a single URL in a sequential script; callers juggling many URLs
+    should use RetryQueue (or asyncio) so one slow URL does not hold the
+    others back.
+
+    Args:
+        http_client: HttpClient to fetch with
+        url: URL to fetch
+        policy: RetryPolicy (default: a new one from config)
+        profile: Header profile name
+        on_retry: Optional callback(attempt, delay, response, error)
+
+    Returns:
+        requests.Response with a 2xx/3xx status, or None if every attempt failed
+    """
+    policy = policy or RetryPolicy()
+    breaker = policy.breaker_for(url)
+
+    for attempt in range(policy.max_retries + 1):
+        wait = breaker.wait_time()
+        while wait > 0:
+            time.sleep(wait)
+            wait = breaker.wait_time()
+
+        response, error = None, None
+        try:
+            response = http_client.get(url, profile=profile)
+        except requests.exceptions.RequestException as e:
+            error = e
+
+        outcome = policy.record(url, response, error)
+        if outcome == 'ok':
+            return response
+        if outcome == 'fail' or attempt == policy.max_retries:
+            return None
+
+        delay = policy.backoff(attempt + 1, response)
+        if on_retry:
+            on_retry(attempt + 1, delay, response, error)
+        time.sleep(delay)
+
+    return None
+
+
+class RetryQueue:
+    """Items waiting for their retry time, popped in ready order."""
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+
+    def push(self, item, delay):
+        """Schedule `item` to be ready in `delay` seconds."""
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._counter), item))
+
+    def ready_in(self):
+        """Seconds until the next item is ready (0 if one is ready now, None if empty)."""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+    def pop_ready(self):
+        """Pop the next item if it is ready, else None."""
+        if self._heap and self._heap[0][0] <= time.monotonic():
+            return heapq.heappop(self._heap)[2]
+        return None
+
+    def __len__(self):
+        return len(self._heap)
@@ -1,52 +1,211 @@
-import requests
-from bs4 import BeautifulSoup
 from .url_builder import LinkedInURLBuilder
+from .http_client import get_default_client
 from ..extractors.linkedin_extractor import LinkedInExtractor
-from config.settings import DEFAULT_HEADERS
+from config.settings import MAX_SEARCH_PAGES, SEARCH_KNOWN_STREAK, HTML_ARCHIVE_ENABLED
 from utils.sqlite_storage import SQLiteStorage
+from utils.html_archive import HtmlArchive
 
 
 class JobScraper:
     """Main scraper class for job search websites"""
     
-    def __init__(self):
+    def __init__(self, rate_limiter=None, sqlite_storage=None, http_client=None, archive=None,
+                 known_ids=None, parse_pool=None):
         self.url_builder = LinkedInURLBuilder()
         self.linkedin_extractor = LinkedInExtractor()
-        self.headers = DEFAULT_HEADERS
-        self.sqlite_storage = SQLiteStorage()
+        self.http_client = http_client or get_default_client()
+        self.sqlite_storage = sqlite_storage or SQLiteStorage()
+        self.rate_limiter = rate_limiter
+        if archive is None and HTML_ARCHIVE_ENABLED:
+            archive = HtmlArchive()
+        self.archive = archive
+        # Optional KnownJobIndex: jobs already stored are dropped right after extraction
+        self.known_ids = known_ids
+        # Optional ParsePool: listings are parsed in worker processes
+        self.parse_pool = parse_pool
     
-    def search_jobs(self, search_config, save_results=True):
-        """Search for jobs based on configuration"""
+    def search_jobs(self, search_config, save_results=True, paginate=False, incremental=False):
+        """Search for jobs based on configuration
+
+        With paginate=True the guest results fragments are walked page by
+        page (see iter_job_pages) and each batch is saved as it arrives.
+        With incremental=True only postings newer than the search's
+        watermark are fetched and saved (see sync_new_jobs); without
+        paginate that is limited to the first results page.
+        """
+        if incremental:
+            return self.sync_new_jobs(
+                search_config, save_results=save_results, max_pages=None if paginate else 1
+            )
+
+        if paginate:
+            jobs = []
+            for batch in self.iter_job_pages(search_config):
+                batch = self._drop_known(batch)
+                jobs.extend(batch)
+                if save_results:
+                    self._save_jobs(batch, search_config)
+            return jobs
+
         # Build URL
         search_url = self.url_builder.build_url(search_config)
         print(f"🌐 Search URL: {search_url}")
         
         # Get page content
-        soup = self._get_page_content(search_url)
-        if not soup:
+        content = self._get_page_content(search_url)
+        if content is None:
             return []
         
         # Extract jobs
-        jobs = self.linkedin_extractor.extract_jobs(soup, search_config.max_results)
+        jobs = self._extract_jobs(content, search_config.max_results)
+        jobs = self._drop_known(jobs)
         
         # Save results to SQLite database (with duplicate prevention)
-        if save_results and jobs:
-            try:
-                self.sqlite_storage.append_jobs(jobs, search_config)
-            except Exception as e:
-                print(f"⚠️  Warning: Could not save results: {e}")
+        if save_results:
+            self._save_jobs(jobs, search_config)
         
         return jobs
+
+    def sync_new_jobs(self, search_config, save_results=True, max_pages=None):
+        """Fetch only postings newer than this search's watermark
+
+        Pages are requested newest first and the walk stops after
+        SEARCH_KNOWN_STREAK consecutive postings at or below the watermark,
+        so a steady-state run costs one or two page fetches. The first run
+        for a search is a full crawl that establishes the watermark.
+        """
+        search_key = self.url_builder.build_search_key(search_config)
+        watermark = self.sqlite_storage.get_search_watermark(search_key)
+
+        jobs = []
+        newest = []
+        for batch in self.iter_job_pages(search_config, max_pages=max_pages, watermark=watermark):
+            # The watermark follows everything above it, including jobs other searches stored
+            newest.extend(batch)
+            batch = self._drop_known(batch)
+            jobs.extend(batch)
+            if save_results:
+                self._save_jobs(batch, search_config)
+
+        if newest:
+            job_ids = [int(job.linkedin_job_id) for job in newest if job.linkedin_job_id]
+            posted_dates = [job.posted_date for job in newest if job.posted_date]
+            self.sqlite_storage.update_search_watermark(
+                search_key,
+                search_config,
+                max(job_ids) if job_ids else None,
+                max(posted_dates) if posted_dates else None,
+            )
+
+        print(f"🔖 Incremental sync: {len(jobs)} new jobs for '{search_config.keywords}'")
+        return jobs
+
+    @staticmethod
+    def _is_known(job, watermark):
+        """True if a posting is at or below the watermark"""
+        if job.linkedin_job_id and watermark.get('newest_job_id'):
+            return int(job.linkedin_job_id) <= watermark['newest_job_id']
+        if job.posted_date and watermark.get('newest_posted_date'):
+            return job.posted_date < watermark['newest_posted_date']
+        return False
+
+    def iter_job_pages(self, search_config, max_pages=None, watermark=None, known_streak=None):
+        """Yield batches of new Job objects, one batch per results page
+
+        Stops as soon as max_results jobs were yielded, a page fails to
+        load, or a page contains no job that was not already seen. With a
+        watermark, results are sorted newest first and postings at or below
+        it are skipped; the walk stops after known_streak of them in a row
+        or a page of only known postings. A single promoted or reposted
+        card near the top therefore doesn't hide the new ones after it.
+        """
+        max_pages = max_pages or MAX_SEARCH_PAGES
+        known_streak = known_streak or SEARCH_KNOWN_STREAK
+        remaining = search_config.max_results
+        seen = set()
+        start = 0
+        streak = 0
+
+        for page in range(max_pages):
+            page_url = self.url_builder.build_page_url(
+                search_config, start, sort_by_date=watermark is not None
+            )
+            print(f"🌐 Page {page + 1} URL: {page_url}")
+
+            content = self._get_page_content(page_url)
+            if not content:
+                return
+
+            page_jobs = self._extract_jobs(content, max_results=None)
+            if not page_jobs:
+                return
+
+            new_jobs = []
+            reached_known = False
+            for job in page_jobs:
+                if watermark and self._is_known(job, watermark):
+                    streak += 1
+                    if streak >= known_streak:
+                        reached_known = True
+                        break
+                    continue
+                streak = 0
+                key = job.linkedin_job_id or (job.title, job.company, job.location)
+                if key not in seen:
+                    seen.add(key)
+                    new_jobs.append(job)
+
+            if not new_jobs:
+                return
+
+            batch = new_jobs[:remaining]
+            remaining -= len(batch)
+            yield batch
+
+            if remaining <= 0 or reached_known:
+                return
+            start += len(page_jobs)
+
+    def _extract_jobs(self, content, max_results):
+        """Extract jobs from a results page, in the parse pool if there is one"""
+        if self.parse_pool:
+            return self.parse_pool.parse_listing(content, max_results)
+        return self.linkedin_extractor.extract_jobs_from_html(content, max_results)
+
+    def _drop_known(self, jobs):
+        """Drop jobs already in the known-ID index (and record the new ones)"""
+        if self.known_ids is None:
+            return jobs
+
+        new_jobs = [
+            job for job in jobs
+            if not job.linkedin_job_id or self.known_ids.add(job.linkedin_job_id)
+        ]
+        if len(new_jobs) < len(jobs):
+            print(f"♻️  Skipped {len(jobs) - len(new_jobs)} already known jobs")
+        return new_jobs
+
+    def _save_jobs(self, jobs, search_config):
+        """Save jobs to SQLite without letting storage errors abort the search"""
+        if not jobs:
+            return
+        try:
+            self.sqlite_storage.append_jobs(jobs, search_config)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not save results: {e}")
     
     def _get_page_content(self, url):
-        """Get and parse page content"""
+        """Get raw page content (bytes), or None on error"""
         try:
-            response = requests.get(url, headers=self.headers)
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            response = self.http_client.get(url, profile='search')
             response.raise_for_status()
+            if self.archive:
+                self.archive.store('search', url, response.content)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
             print(f"✅ Successfully connected to {url}")
-            return soup
+            return response.content
             
         except Exception as e:
             print(f"❌ Error connecting to {url}: {e}")
@@ -0,0 +1,149 @@
+"""Compiles search templates into the set of distinct queries to request."""
+import itertools
+import math
+
+from .url_builder import LinkedInURLBuilder
+from ..models.search_config import SearchConfig
+from config.settings import MAX_SEARCH_PAGES, SEARCH_PAGE_SIZE
+
+# Template fields that may hold a list of values to expand into a grid
+GRID_FIELDS = ('keywords', 'location', 'remote', 'time_posted')
+
+
+def expand_templates(templates):
+    """
+    Expand grid templates into one (name, SearchConfig) per combination.
+
+    A template whose keywords, location, remote or time_posted is a list
+    stands for every combination of those values, e.g.
+    {"keywords": ["Java", "Python"], "location": ["Argentina", "Chile"]}
+    yields four searches named "<name> [Java / Argentina]" and so on.
+
+    Args:
+        templates: List of template dicts (see config.settings.SEARCH_TEMPLATES)
+
+    Returns:
+        list[tuple[str, SearchConfig]] in template order
+    """
+    expanded = []
+    for i, template in enumerate(templates, 1):
+        params = dict(template)
+        name = params.pop("name", f"Search {i}")
+
+        grid = [field for field in GRID_FIELDS if isinstance(params.get(field), (list, tuple))]
+        if not grid:
+            expanded.append((name, SearchConfig(**params)))
+            continue
+
+        for values in itertools.product(*(params[field] for field in grid)):
+            combo = dict(params, **dict(zip(grid, values)))
+            labels = [_grid_label(field, value) for field, value in zip(grid, values)]
+            label = " / ".join(filter(None, labels))
+            expanded.append((f"{name} [{label}]", SearchConfig(**combo)))
+
+    return expanded
+
+
+def _grid_label(field, value):
+    if field == 'remote':
+        return "remote" if value else "on-site"
+    return str(value)
+
+
+def _normalize(search_config):
+    """Copy of a SearchConfig with the spelling differences LinkedIn ignores removed"""
+    return SearchConfig(
+        keywords=" ".join(search_config.keywords.split()),
+        location=" ".join(search_config.location.split()),
+        time_posted=search_config.time_posted,
+        remote=bool(search_config.remote),
+        experience_levels=sorted(set(search_config.experience_levels)),
+        max_results=search_config.max_results,
+    )
+
+
+class PlannedQuery:
+    """A distinct search request shared by one or more templates."""
+
+    def __init__(self, search_config, url):
+        self.search_config = search_config
+        self.url = url
+        self.template_names = []
+
+    def expected_requests(self, paginate=True):
+        """Upper bound on requests needed to collect max_results postings."""
+        if not paginate:
+            return 1
+        return min(MAX_SEARCH_PAGES, max(1, math.ceil(self.search_config.max_results / SEARCH_PAGE_SIZE)))
+
+    def __repr__(self):
+        return f"PlannedQuery(url='{self.url}', templates={len(self.template_names)})"
+
+
+class SearchPlan:
+    """Deduplicated set of queries for a list of templates.
+
+    Templates that expand to the same request (same keywords, location,
+    filters) share one PlannedQuery; the query asks for the largest
+    max_results among them and every template is attributed the results.
+    """
+
+    def __init__(self, templates):
+        """
+        Compile a plan.
+
+        Args:
+            templates: List of template dicts (see config.settings.SEARCH_TEMPLATES)
+        """
+        self.templates = []   # (name, SearchConfig, PlannedQuery) in template order
+        self.queries = []
+        by_url = {}
+
+        for name, search_config in expand_templates(templates):
+            normalized = _normalize(search_config)
+            # Case-insensitive: "java" and "Java" are the same LinkedIn search
+            url = LinkedInURLBuilder.build_page_url(normalized).lower()
+
+            query = by_url.get(url)
+            if query is None:
+                query = PlannedQuery(normalized, url)
+                by_url[url] = query
+                self.queries.append(query)
+            else:
+                query.search_config.max_results = max(
+                    query.search_config.max_results, search_config.max_results
+                )
+            query.template_names.append(name)
+            self.templates.append((name, search_config, query))
+
+    def expected_requests(self, paginate=True):
+        """Upper bound on search requests the plan issues."""
+        return sum(query.expected_requests(paginate) for query in self.queries)
+
+    def naive_requests(self, paginate=True):
+        """Requests the templates would cost if each ran on its own."""
+        return sum(
+            PlannedQuery(search_config, None).expected_requests(paginate)
+            for _, search_config, _ in self.templates
+        )
+
+    def print_report(self, paginate=True):
+        """Print the plan: distinct queries, their templates and request counts."""
+        print(f"\n🗺️  SEARCH PLAN")
+        print("=" * 50)
+        print(f"Templates: {len(self.templates)}  ->  distinct queries: {len(self.queries)}")
+        print(f"Expected requests: up to {self.expected_requests(paginate)} "
+              f"(vs {self.naive_requests(paginate)} without dedup)")
+        print()
+        for i, query in enumerate(self.queries, 1):
+            print(f"{i:2}. {query.search_config.keywords!r} in {query.search_config.location!r} "
+                  f"(max {query.search_config.max_results}, "
+                  f"up to {query.expected_requests(paginate)} requests)")
+            if len(query.template_names) > 1:
+                print(f"    shared by: {', '.join(query.template_names)}")
+
+    def __len__(self):
+        return len(self.queries)
+
+    def __repr__(self):
+        return f"SearchPlan(templates={len(self.templates)}, queries={len(self.queries)})"
@@ -0,0 +1,174 @@
+"""Yield-adaptive polling schedule for search plan queries."""
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+from config.settings import (
+    TIME_POSTED_MAPPING,
+    SCHEDULE_BASE_INTERVAL,
+    SCHEDULE_MIN_INTERVAL,
+    SCHEDULE_MAX_INTERVAL,
+    SCHEDULE_HIGH_YIELD,
+    SCHEDULE_GRACE,
+)
+
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def _format(moment):
+    return moment.strftime(TIMESTAMP_FORMAT)
+
+
+def _parse(value):
+    return datetime.strptime(value, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+
+
+class TemplateScheduler:
+    """Decides which queries of a SearchPlan are due and adapts their intervals.
+
+    Every run's new-job yield is stored (search_runs). A query that brought
+    SCHEDULE_HIGH_YIELD or more new jobs is polled twice as often, down to
+    SCHEDULE_MIN_INTERVAL; one that brought none backs off exponentially up
+    to SCHEDULE_MAX_INTERVAL. A query that waited longer than its
+    time_posted window is run with a window wide enough to cover the gap.
+    """
+
+    def __init__(self, storage, base_interval=None, min_interval=None, max_interval=None,
+                 high_yield=None, grace=None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            storage: SQLiteStorage holding search_schedule / search_runs
+            base_interval: Minutes between runs of a new query (default from config)
+            min_interval: Shortest interval in minutes (default from config)
+            max_interval: Longest back-off interval in minutes (default from config)
+            high_yield: New jobs per run that halve the interval (default from config)
+            grace: Queries due within this many minutes run now (default from config)
+        """
+        self.storage = storage
+        self.base_interval = base_interval or SCHEDULE_BASE_INTERVAL
+        self.min_interval = min_interval or SCHEDULE_MIN_INTERVAL
+        self.max_interval = max_interval or SCHEDULE_MAX_INTERVAL
+        self.high_yield = high_yield or SCHEDULE_HIGH_YIELD
+        self.grace = SCHEDULE_GRACE if grace is None else grace
+        self.decisions = []
+
+    @staticmethod
+    def schedule_key(query):
+        """Stable identifier of a planned query"""
+        return hashlib.sha1(query.url.encode('utf-8')).hexdigest()[:16]
+
+    def select(self, plan, now=None):
+        """
+        Pick the queries of a plan that are due.
+
+        Due queries whose last run is older than their time_posted window get
+        a wider window for this run (their search_config is updated in place).
+
+        Args:
+            plan: SearchPlan
+            now: Current time (default: utcnow)
+
+        Returns:
+            list[PlannedQuery] to run
+        """
+        now = now or datetime.now(timezone.utc)
+        schedule = self.storage.get_search_schedule()
+        self.decisions = []
+        self._now = now
+        self._state = {}
+
+        due = []
+        for query in plan.queries:
+            key = self.schedule_key(query)
+            state = schedule.get(key)
+            self._state[query] = (key, state)
+
+            if state and state['next_run_at']:
+                next_run = _parse(state['next_run_at'])
+                if next_run > now + timedelta(minutes=self.grace):
+                    self.decisions.append({
+                        'query': query,
+                        'action': 'skipped',
+                        'new_jobs': None,
+                        'interval': state['interval_minutes'],
+                        'next_run_at': state['next_run_at'],
+                    })
+                    continue
+
+            if state and state['last_run_at']:
+                self._widen_window(query, now - _parse(state['last_run_at']))
+            due.append(query)
+
+        return due
+
+    def _widen_window(self, query, gap):
+        """Use the narrowest time_posted window that still covers `gap`."""
+        config = query.search_config
+        current = int(TIME_POSTED_MAPPING.get(config.time_posted, 0))
+        needed = gap.total_seconds() + self.grace * 60
+        if not current or current >= needed:
+            return
+
+        windows = sorted(TIME_POSTED_MAPPING.items(), key=lambda item: int(item[1]))
+        wider = [name for name, seconds in windows if int(seconds) >= needed]
+        config.time_posted = wider[0] if wider else windows[-1][0]
+
+    def record(self, query, result):
+        """
+        Store a run's yield and compute the query's next interval.
+
+        Args:
+            query: PlannedQuery returned by select()
+            result: TemplateResult of the query's run
+
+        Returns:
+            dict decision (action, new_jobs, interval, next_run_at)
+        """
+        key, state = self._state[query]
+        interval = state['interval_minutes'] if state else self.base_interval
+        new_jobs = len(result.jobs)
+
+        if result.error:
+            action = 'error'
+        elif new_jobs >= self.high_yield:
+            interval = max(self.min_interval, interval / 2)
+            action = 'faster'
+        elif new_jobs == 0:
+            interval = min(self.max_interval, interval * 2)
+            action = 'backoff'
+        else:
+            action = 'steady'
+
+        next_run_at = _format(self._now + timedelta(minutes=interval))
+        self.storage.record_search_run(
+            key,
+            ", ".join(query.template_names),
+            _format(self._now),
+            new_jobs,
+            result.elapsed,
+            result.error,
+            interval,
+            next_run_at,
+        )
+
+        decision = {
+            'query': query,
+            'action': action,
+            'new_jobs': new_jobs,
+            'interval': interval,
+            'next_run_at': next_run_at,
+        }
+        self.decisions.append(decision)
+        return decision
+
+    def print_report(self):
+        """Print the decisions of the last run."""
+        ran = [d for d in self.decisions if d['action'] != 'skipped']
+        print(f"\n⏱️  SCHEDULE REPORT ({len(ran)} run, {len(self.decisions) - len(ran)} skipped)")
+        print("=" * 50)
+        for decision in sorted(self.decisions, key=lambda d: d['next_run_at']):
+            names = ", ".join(decision['query'].template_names)
+            new_jobs = "-" if decision['new_jobs'] is None else decision['new_jobs']
+            print(f"{decision['action']:>8}  {names}: new={new_jobs}, "
+                  f"every {decision['interval']:.0f}min, next {decision['next_run_at']}")
@@ -1,7 +1,13 @@
 """URL Builder for LinkedIn job searches"""
 
+import hashlib
 from urllib.parse import quote_plus
-from config.settings import LINKEDIN_BASE_URL, TIME_POSTED_MAPPING, EXPERIENCE_LEVELS
+from config.settings import (
+    LINKEDIN_BASE_URL,
+    LINKEDIN_GUEST_SEARCH_URL,
+    TIME_POSTED_MAPPING,
+    EXPERIENCE_LEVELS,
+)
 
 
 class LinkedInURLBuilder:
@@ -10,6 +16,45 @@ class LinkedInURLBuilder:
     @staticmethod
     def build_url(search_config):
         """Convert SearchConfig to LinkedIn URL"""
+        query_params = LinkedInURLBuilder._build_query_params(search_config)
+
+        # Build final URL
+        if query_params:
+            final_url = f"{LINKEDIN_BASE_URL}?{'&'.join(query_params)}"
+            print(f"🔗 Generated URL: {final_url}")
+            return final_url
+        else:
+            return LINKEDIN_BASE_URL
+
+    @staticmethod
+    def build_page_url(search_config, start=0, sort_by_date=False):
+        """Convert SearchConfig to a guest "see more postings" fragment URL at offset `start`
+
+        sort_by_date=True asks for newest postings first (sortBy=DD), which
+        incremental sync relies on to stop once it reaches already-known jobs.
+        """
+        query_params = LinkedInURLBuilder._build_query_params(search_config, verbose=False)
+        if sort_by_date:
+            query_params.append("sortBy=DD")
+        query_params.append(f"start={int(start)}")
+        return f"{LINKEDIN_GUEST_SEARCH_URL}?{'&'.join(query_params)}"
+
+    @staticmethod
+    def build_search_key(search_config):
+        """Stable identifier of a search (same filters -> same key)
+
+        The time_posted window is left out: widening it for one run (see
+        TemplateScheduler) must not start the search's watermark over.
+        """
+        query_params = [
+            param for param in LinkedInURLBuilder._build_query_params(search_config, verbose=False)
+            if not param.startswith("f_TPR=")
+        ]
+        return hashlib.sha1('&'.join(query_params).encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _build_query_params(search_config, verbose=True):
+        """Build the list of encoded query parameters shared by all search URLs"""
         query_params = []
         
         # Keywords - handle multiple words properly
@@ -38,7 +83,8 @@ class LinkedInURLBuilder:
                 if isinstance(level, int) and 1 <= level <= 6:
                     valid_levels.append(str(level))
                 else:
-                    print(f"⚠️  Warning: Invalid experience level {level}, skipping")
+                    if verbose:
+                        print(f"⚠️  Warning: Invalid experience level {level}, skipping")
             
             if valid_levels:
                 # Join multiple levels with commas and URL encode
@@ -47,18 +93,14 @@ class LinkedInURLBuilder:
                 query_params.append(f"f_E={encoded_experience}")
                 
                 # Debug info
-                level_names = [EXPERIENCE_LEVELS.get(int(level), f"Level {level}") for level in valid_levels]
-                print(f"🎯 Experience filter: {', '.join(level_names)} (codes: {experience_param})")
+                if verbose:
+                    level_names = [EXPERIENCE_LEVELS.get(int(level), f"Level {level}") for level in valid_levels]
+                    print(f"🎯 Experience filter: {', '.join(level_names)} (codes: {experience_param})")
         
         # Remote work
         if search_config.remote:
             query_params.append("f_WT=2")
-            print(f"🏠 Remote filter: enabled")
-        
-        # Build final URL
-        if query_params:
-            final_url = f"{LINKEDIN_BASE_URL}?{'&'.join(query_params)}"
-            print(f"🔗 Generated URL: {final_url}")
-            return final_url
-        else:
-            return LINKEDIN_BASE_URL
\ No newline at end of file
+            if verbose:
+                print(f"🏠 Remote filter: enabled")
+
+        return query_params
\ No newline at end of file
@@ -1,15 +1,92 @@
 """LinkedIn-specific job extraction logic"""
 
 from ..models.job import Job
+from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from urllib.parse import urlparse, urlunparse
 import re
 
+from config.settings import LISTING_PARSER
+
+
+def _class_xpath(tag, css_class):
+    """XPath step matching `tag` elements carrying `css_class` (like bs4's class_=)"""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+
+
+# Compiled once: the lxml path runs these for every card
+_CARDS_XPATH = etree.XPath('//' + _class_xpath('div', 'job-search-card'))
+_TITLE_XPATH = etree.XPath('.//' + _class_xpath('h3', 'base-search-card__title'))
+_COMPANY_XPATH = etree.XPath('.//' + _class_xpath('h4', 'base-search-card__subtitle'))
+_LOCATION_XPATH = etree.XPath('.//' + _class_xpath('span', 'job-search-card__location'))
+_TITLE_LINK_XPATH = etree.XPath('.//' + _class_xpath('a', 'job-card-container__link'))
+_LINKS_XPATH = etree.XPath('.//a')
+_LISTDATE_XPATH = etree.XPath('.//time[@datetime]')
+
+_JOB_ID_PATTERN = re.compile(r'/jobs/view/[^/]*?(\d{5,})')
+
+
+def extract_job_id(url):
+    """Extract the job ID from a LinkedIn job view URL.
+
+    Returns:
+        str: job ID or None
+    """
+    match = _JOB_ID_PATTERN.search(url)
+    if match:
+        return match.group(1)
+    return None
+
 
 class LinkedInExtractor:
     """Extract job data from LinkedIn pages"""
 
+    def __init__(self, parser=None):
+        """
+        Initialize the extractor.
+
+        Args:
+            parser: 'lxml' for the XPath fast path or 'bs4' for BeautifulSoup
+                (default from config)
+        """
+        self.parser = parser or LISTING_PARSER
+        if self.parser not in ('lxml', 'bs4'):
+            raise ValueError(f"Unknown listing parser: {self.parser}")
+
+    def extract_jobs_from_html(self, content, max_results=10, encoding='utf-8'):
+        """Extract jobs straight from a raw search response using the configured backend"""
+        if self.parser == 'bs4':
+            return self.extract_jobs(BeautifulSoup(content, 'html.parser'), max_results)
+
+        print(f"\n🎯 EXTRACTING LINKEDIN JOBS")
+        print("="*50)
+
+        try:
+            if isinstance(content, bytes):
+                tree = lxml_html.document_fromstring(
+                    content, parser=lxml_html.HTMLParser(encoding=encoding)
+                )
+            else:
+                tree = lxml_html.document_fromstring(content)
+        except etree.ParserError:
+            # Empty body (e.g. past the last results page)
+            print("Found 0 job cards")
+            return []
+
+        job_cards = _CARDS_XPATH(tree)
+        print(f"Found {len(job_cards)} job cards")
+
+        jobs = []
+
+        for card in job_cards[:max_results]:
+            job_data = self._extract_single_job_lxml(card)
+            if job_data:
+                jobs.append(Job(**job_data))
+
+        return jobs
+
     def extract_jobs(self, soup, max_results=10):
-        """Extract jobs from LinkedIn search results"""
+        """Extract jobs from LinkedIn search results (max_results=None for no limit)"""
         print(f"\n🎯 EXTRACTING LINKEDIN JOBS")
         print("="*50)
 
@@ -45,6 +122,11 @@ class LinkedInExtractor:
         location = self._extract_location(card)
         job['location'] = location
 
+        # Listing date ("job-search-card__listdate" or its "--new" variant)
+        listdate_element = card.find('time', attrs={'datetime': True})
+        if listdate_element:
+            job['posted_date'] = listdate_element['datetime'].strip()
+
         # LinkedIn Job ID
         linkedin_job_id = self._extract_linkedin_job_id(card)
         if linkedin_job_id:
@@ -52,6 +134,39 @@ class LinkedInExtractor:
 
         return job
 
+    def _extract_single_job_lxml(self, card):
+        """lxml twin of _extract_single_job; must produce the same dict"""
+        job = {}
+
+        title_elements = _TITLE_XPATH(card)
+        if title_elements:
+            job['title'] = title_elements[0].text_content().strip()
+
+        company_elements = _COMPANY_XPATH(card)
+        if company_elements:
+            company_element = company_elements[0]
+            job['company'] = company_element.text_content().strip()
+            links = _LINKS_XPATH(company_element)
+            company_url = self._normalize_company_url(links[0].get('href')) if links else None
+            if company_url:
+                job['company_url'] = company_url
+
+        location_elements = _LOCATION_XPATH(card)
+        job['location'] = location_elements[0].text_content().strip() if location_elements else 'Not found'
+
+        listdate_elements = _LISTDATE_XPATH(card)
+        if listdate_elements:
+            job['posted_date'] = listdate_elements[0].get('datetime').strip()
+
+        linkedin_job_id = self._extract_linkedin_job_id_from_hrefs(
+            [link.get('href') for link in _TITLE_LINK_XPATH(card)[:1]],
+            [link.get('href', '') for link in _LINKS_XPATH(card)],
+        )
+        if linkedin_job_id:
+            job['linkedin_job_id'] = linkedin_job_id
+
+        return job
+
     def _extract_location(self, card):
         location_element = card.find('span', class_='job-search-card__location')
 
@@ -66,7 +181,10 @@ class LinkedInExtractor:
         link = company_element.find('a')
         if not link:
             return None
-        href = link.get('href')
+        return self._normalize_company_url(link.get('href'))
+
+    def _normalize_company_url(self, href):
+        """Normalize a company profile link, or None if it is not one."""
         if not href or '/company/' not in href:
             return None
         # Normalize domain and strip tracking query params
@@ -86,31 +204,28 @@ class LinkedInExtractor:
             str: LinkedIn job ID or None
         """
         title_link = card.find('a', class_='job-card-container__link')
-        if title_link:
-            href = title_link.get('href')
+        return self._extract_linkedin_job_id_from_hrefs(
+            [title_link.get('href')] if title_link else [],
+            [link.get('href', '') for link in card.find_all('a')],
+        )
+
+    def _extract_linkedin_job_id_from_hrefs(self, title_hrefs, all_hrefs):
+        """Pick the job ID from the title link, falling back to any job view link.
+
+        Returns:
+            str: LinkedIn job ID or None
+        """
+        for href in title_hrefs:
             if href:
-                job_id = self._extract_id_from_url(href)
+                job_id = extract_job_id(href)
                 if job_id:
                     return job_id
 
         # Fallback: Look for any link containing '/jobs/view/'
-        all_links = card.find_all('a')
-        for link in all_links:
-            href = link.get('href', '')
+        for href in all_hrefs:
             if '/jobs/view/' in href:
-                job_id = self._extract_id_from_url(href)
+                job_id = extract_job_id(href)
                 if job_id:
                     return job_id
 
         return None
-
-    def _extract_id_from_url(self, href):
-        """Extract job ID from a LinkedIn URL.
-
-        Returns:
-            str: job ID or None
-        """
-        match = re.search(r'/jobs/view/[^/]*?(\d{5,})', href)
-        if match:
-            return match.group(1)
-        return None
@@ -4,12 +4,14 @@
 class Job:
     """Represents a job listing from a LinkedIn search result"""
 
-    def __init__(self, title=None, company=None, location=None, company_url=None, linkedin_job_id=None, **kwargs):
+    def __init__(self, title=None, company=None, location=None, company_url=None, linkedin_job_id=None,
+                 posted_date=None, **kwargs):
         self.title = title or "Not specified"
         self.company = company or "Not specified"
         self.location = location or "Not specified"
         self.company_url = company_url
         self.linkedin_job_id = linkedin_job_id
+        self.posted_date = posted_date  # Listing date from the card (YYYY-MM-DD)
 
     def to_dict(self):
         """Convert job to dictionary format"""
@@ -18,7 +20,8 @@ class Job:
             'company': self.company,
             'location': self.location,
             'company_url': self.company_url,
-            'linkedin_job_id': self.linkedin_job_id
+            'linkedin_job_id': self.linkedin_job_id,
+            'posted_date': self.posted_date,
         }
 
     def __str__(self):
@@ -1,4 +1,11 @@
 """Configuration for keyword matching in job descriptions."""
+import hashlib
+import json
+
+
+def _hash(value):
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
 
 
 class KeywordConfig:
@@ -30,6 +37,33 @@ class KeywordConfig:
             'case_sensitive': self.case_sensitive
         }
 
+    def term(self, keyword):
+        """Text a keyword is matched as (lowercased unless case-sensitive)."""
+        return keyword if self.case_sensitive else keyword.lower()
+
+    def terms(self):
+        """Distinct match terms of the keywords, sorted."""
+        return sorted({self.term(kw) for kw in self.keywords})
+
+    @property
+    def keywords_hash(self):
+        """Identifies the set of match terms (what stored counts cover)."""
+        return _hash({'terms': self.terms(), 'case_sensitive': self.case_sensitive})
+
+    @property
+    def weights_hash(self):
+        """Identifies the weights of the configured keywords."""
+        return _hash({kw: self.weights[kw] for kw in self.keywords})
+
+    @property
+    def profile_hash(self):
+        """Identifies everything a score depends on: keyword list, weights, case sensitivity."""
+        return _hash({
+            'keywords': self.keywords,
+            'weights': self.weights_hash,
+            'case_sensitive': self.case_sensitive,
+        })
+
     def get_keywords_string(self):
         """Get comma-separated keywords string for storage."""
         return ','.join(sorted(self.keywords))
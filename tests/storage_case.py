@@ -0,0 +1,28 @@
+"""Base test case with a throwaway SQLite database"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from utils.sqlite_storage import SQLiteStorage
+
+
+class StorageTestCase(unittest.TestCase):
+    """Gives each test a fresh SQLiteStorage in a temporary directory.
+
+    Subclasses that override setUp must call super().setUp() first.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.storage = self.open_storage()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def open_storage(self, **kwargs):
+        """Open (another) SQLiteStorage on the test database, without its setup output."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            return SQLiteStorage(os.path.join(self.tmp.name, "jobs.db"), **kwargs)
@@ -0,0 +1,108 @@
+"""Tests for the long-running daemon loop"""
+
+import contextlib
+import io
+import json
+import socket
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from config.keyword_settings import DETAIL_STOP_CHECK_EVERY
+from scraper.core.keyword_matcher import KeywordMatcher
+from scraper.models.job import Job
+from scraper.models.keyword_config import KeywordConfig
+from scraper.models.search_config import SearchConfig
+from utils.daemon import ScraperDaemon
+from tests.storage_case import StorageTestCase
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class TestScraperDaemon(StorageTestCase):
+    """Test cases for cycles, status reporting and shutdown"""
+
+    def test_cycles_status_and_stop(self):
+        """Cycles repeat until stopped; /status and /health reflect the loop"""
+        port = free_port()
+        cycles_done = threading.Event()
+
+        def cycle():
+            if runner.status['cycles'] >= 2:
+                cycles_done.set()
+            return {'jobs_found': 3}
+
+        runner = ScraperDaemon(cycle, interval=0.01, status_port=port)
+        thread = threading.Thread(target=runner.run_forever)
+        thread.start()
+        try:
+            self.assertTrue(cycles_done.wait(5))
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/status") as response:
+                status = json.load(response)
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health") as response:
+                self.assertEqual(response.status, 200)
+        finally:
+            runner.stop()
+            thread.join(5)
+
+        self.assertGreaterEqual(status['cycles'], 2)
+        self.assertEqual(status['last_cycle_summary'], {'jobs_found': 3})
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(runner.status['state'], 'stopped')
+
+    def test_failed_cycle_is_unhealthy(self):
+        """A cycle that raises is counted and marks the daemon unhealthy"""
+        def cycle():
+            runner.stop()
+            raise RuntimeError("boom")
+
+        runner = ScraperDaemon(cycle, interval=0.01)
+        with contextlib.redirect_stderr(io.StringIO()):
+            runner.run_forever()
+
+        self.assertEqual(runner.status['failures'], 1)
+        self.assertEqual(runner.status['last_error'], "boom")
+        self.assertFalse(runner.healthy())
+
+    def test_stop_interrupts_analysis_between_batches(self):
+        """A stop requested mid-analysis ends it after the current batch of fetches"""
+        runner = ScraperDaemon(lambda: {}, interval=60)
+
+        class StoppingDetailScraper:
+            def __init__(self):
+                self.fetched = 0
+
+            def scrape_stream(self, jobs, on_result):
+                for job in jobs:
+                    self.fetched += 1
+                    on_result(job, {'description': "Java"})
+                    runner.stop()
+
+        total = DETAIL_STOP_CHECK_EVERY + 5
+        scraper = StoppingDetailScraper()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs([
+                Job(title=f"Dev {i}", company="Acme", linkedin_job_id=str(3901000000 + i)) for i in range(total)
+            ], SearchConfig(keywords="java"))
+            matcher = KeywordMatcher(self.storage, KeywordConfig(["Java"]), detail_scraper=scraper,
+                                     should_stop=lambda: runner.stopping)
+            results = matcher.analyze_jobs(concurrent=True)
+
+        self.assertEqual((scraper.fetched, len(results)), (DETAIL_STOP_CHECK_EVERY, DETAIL_STOP_CHECK_EVERY))
+        self.assertEqual(len(self.storage.get_jobs_for_analysis()), total - DETAIL_STOP_CHECK_EVERY)
+
+    def test_persistent_storage_reuses_connection(self):
+        """A persistent SQLiteStorage keeps one connection per thread open"""
+        storage = self.open_storage(persistent=True)
+        first = storage._connect()
+        storage.get_stats()
+        self.assertIs(storage._connect(), first)
+        storage.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
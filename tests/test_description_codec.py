@@ -0,0 +1,98 @@
+"""Tests for compressed description storage"""
+
+import contextlib
+import io
+import sqlite3
+import unittest
+
+from scraper.models.job import Job
+from scraper.models.match_result import MatchResult
+from scraper.models.search_config import SearchConfig
+from utils.description_codec import DescriptionCodec, is_compressed, train_dictionary
+from tests.storage_case import StorageTestCase
+
+BOILERPLATE = (
+    "We are an equal opportunity employer and value diversity at our company. "
+    "We offer remote work, flexible hours, health insurance and an annual learning budget."
+)
+DESCRIPTIONS = [
+    f"Role {i}: backend developer working with Java {8 + i % 13} and Spring Boot. "
+    f"Team of {i % 7 + 3} engineers, English level B{i % 2 + 1}. {BOILERPLATE} Señor desarrollador ✓"
+    for i in range(40)
+]
+
+
+class TestDescriptionCodec(StorageTestCase):
+    """Test cases for the codec and transparent storage access"""
+
+    def save(self, job_id, description):
+        result = MatchResult(str(job_id))
+        result.description = description
+        self.storage.save_job_analysis(result)
+
+    def rescore_input(self):
+        """(job_id, description) pairs as the keyword counting of rescore and rank reads them"""
+        return [(job_id, description)
+                for batch in self.storage.iter_jobs_missing_counts("not counted yet")
+                for job_id, description, _ in batch]
+
+    def test_dictionary_round_trip_and_ratio(self):
+        """Decoding returns the original text; a trained dictionary compresses better"""
+        zdict = train_dictionary(DESCRIPTIONS)
+        plain, trained = DescriptionCodec(), DescriptionCodec({1: zdict})
+
+        for text in DESCRIPTIONS:
+            self.assertEqual(trained.decode(trained.encode(text)), text)
+            self.assertEqual(trained.decode(plain.encode(text)), text)
+        self.assertEqual(trained.decode("legacy plain text"), "legacy plain text")
+        self.assertIsNone(trained.encode(None))
+        self.assertLess(
+            sum(len(trained.encode(text)) for text in DESCRIPTIONS),
+            0.6 * sum(len(plain.encode(text)) for text in DESCRIPTIONS),
+        )
+
+    def test_storage_is_transparent(self):
+        """Plain legacy rows and compressed rows read back the same, before and after conversion"""
+        self.save(3900000000, DESCRIPTIONS[0])
+        conn = sqlite3.connect(self.storage.db_file)
+        conn.execute("UPDATE job_posts SET description = ? WHERE linkedin_job_id = '3900000000'", (DESCRIPTIONS[0],))
+        conn.commit()
+        for i, description in enumerate(DESCRIPTIONS[1:], 1):
+            self.save(3900000000 + i, description)
+
+        expected = [(str(3900000000 + i), text) for i, text in enumerate(DESCRIPTIONS)]
+        self.assertEqual(self.rescore_input(), expected)
+
+        report = self.storage.compress_descriptions(batch_size=7)
+        self.assertEqual(report['rows'], len(DESCRIPTIONS))
+        self.assertLess(report['stored_after'], report['stored_before'])
+        self.assertEqual(self.rescore_input(), expected)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs([Job(title="Dev", company="Acme", linkedin_job_id="3900000003")],
+                                     SearchConfig(keywords="java"))
+        self.assertEqual(self.storage.get_analyzed_jobs()[0]['description'], DESCRIPTIONS[3])
+        self.assertNotIn('description', self.storage.get_analyzed_jobs(include_description=False)[0])
+        stored = conn.execute("SELECT description FROM job_posts").fetchall()
+        conn.close()
+        self.assertTrue(all(is_compressed(row[0]) for row in stored))
+
+        stats = self.storage.get_description_size_stats()
+        self.assertEqual((stats['rows'], stats['compressed_rows'], stats['dictionaries']),
+                         (len(DESCRIPTIONS), len(DESCRIPTIONS), 1))
+
+    def test_dictionary_trained_elsewhere_is_loaded(self):
+        """Rows written with a dictionary another process trained still decode"""
+        for i, description in enumerate(DESCRIPTIONS):
+            self.save(3900000000 + i, description)
+        other = self.open_storage()
+        other.train_description_dictionary()
+        other.save_job_analysis(MatchResult("3999999999"))
+        result = MatchResult("3999999998")
+        result.description = DESCRIPTIONS[5]
+        other.save_job_analysis(result)
+
+        self.assertIn(("3999999998", DESCRIPTIONS[5]), self.rescore_input())
+
+
+if __name__ == '__main__':
+    unittest.main()
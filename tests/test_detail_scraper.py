@@ -0,0 +1,36 @@
+"""Tests for job detail page parsing"""
+
+import unittest
+from pathlib import Path
+from scraper.core.detail_scraper import DetailScraper, parse_details
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+class TestDetailParsing(unittest.TestCase):
+    """Test cases for detail page extraction"""
+
+    def setUp(self):
+        self.content = (FIXTURES / "detail_page.html").read_bytes()
+
+    def test_partial_matches_full_parse(self):
+        """Parsing only the needed regions gives the same details as the full DOM"""
+        full = parse_details(self.content, parse_mode='full')
+        partial = parse_details(self.content, parse_mode='partial')
+
+        self.assertEqual(partial, full)
+        self.assertEqual(DetailScraper(parse_mode='partial').parse_details(self.content), partial)
+
+    def test_extracted_details(self):
+        """Description, applicants and criteria are extracted"""
+        details = DetailScraper(parse_mode='partial').parse_details(self.content)
+
+        self.assertTrue(details['description'].startswith("About us We build Java & Spring Boot"))
+        self.assertEqual(details['applicant_count'], 201)
+        self.assertEqual(details['seniority_level'], "Entry level")
+        self.assertEqual(details['employment_type'], "Full-time")
+        self.assertEqual(details['industries'], "Software Development")
+
+
+if __name__ == '__main__':
+    unittest.main()
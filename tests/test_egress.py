@@ -0,0 +1,55 @@
+"""Tests for spreading requests over egress routes"""
+
+import unittest
+from benchmarks.replay_server import ReplayServer
+from scraper.core.egress import EgressPool, EgressRoute
+from scraper.core.http_client import HttpClient
+
+DETAIL_URL = "https://www.linkedin.com/jobs/view/3901234567/"
+
+
+class TestEgressPool(unittest.TestCase):
+    """Replay servers stand in for HTTP proxies"""
+
+    def setUp(self):
+        self.proxies = [ReplayServer(seed=i).start() for i in range(3)]
+
+    def tearDown(self):
+        for proxy in self.proxies:
+            proxy.stop()
+
+    def make_client(self, rate=50.0):
+        pool = EgressPool([
+            EgressRoute(f"proxy-{i}", proxy=proxy.url, rate=rate, burst=1)
+            for i, proxy in enumerate(self.proxies)
+        ])
+        # Plain http so the proxies see absolute-form requests instead of CONNECT
+        return HttpClient(origin="http://www.linkedin.com", egress_pool=pool)
+
+    def test_requests_are_spread_over_routes(self):
+        """Each route serves its share of the requests"""
+        client = self.make_client()
+        responses = [client.get(DETAIL_URL, profile='detail') for _ in range(30)]
+        client.close()
+
+        self.assertTrue(all(response.status_code == 200 for response in responses))
+        self.assertEqual([proxy.counts['detail_requests'] for proxy in self.proxies], [10, 10, 10])
+        self.assertEqual(client.route_count, 3)
+
+    def test_rate_limited_route_cools_down(self):
+        """After a 429 a route is skipped until its Retry-After has passed"""
+        self.proxies[0].rate_limit_ratio = 1.0
+        self.proxies[0].retry_after = 30
+        client = self.make_client()
+        statuses = [client.get(DETAIL_URL, profile='detail').status_code for _ in range(20)]
+        stats = {route['name']: route for route in client.egress_pool.get_stats()}
+        client.close()
+
+        self.assertEqual(statuses.count(429), 1)
+        self.assertEqual(stats['proxy-0']['status_429'], 1)
+        self.assertGreater(stats['proxy-0']['cooldown'], 0)
+        self.assertLess(stats['proxy-0']['health'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Tests for the LinkedIn listing extractor backends"""
+
+import unittest
+from pathlib import Path
+from scraper.extractors.linkedin_extractor import LinkedInExtractor
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+class TestLinkedInExtractor(unittest.TestCase):
+    """Test cases for listing extraction"""
+
+    def setUp(self):
+        self.content = (FIXTURES / "search_page.html").read_bytes()
+
+    def test_backends_produce_identical_jobs(self):
+        """lxml fast path and BeautifulSoup fallback agree job for job"""
+        lxml_jobs = LinkedInExtractor(parser='lxml').extract_jobs_from_html(self.content, max_results=None)
+        bs4_jobs = LinkedInExtractor(parser='bs4').extract_jobs_from_html(self.content, max_results=None)
+
+        self.assertEqual(len(lxml_jobs), 3)
+        self.assertEqual([j.to_dict() for j in lxml_jobs], [j.to_dict() for j in bs4_jobs])
+
+    def test_extracted_fields(self):
+        """Fields are cleaned and normalized"""
+        jobs = LinkedInExtractor(parser='lxml').extract_jobs_from_html(self.content, max_results=2)
+
+        self.assertEqual(len(jobs), 2)
+        self.assertEqual(jobs[0].title, "Java Developer")
+        self.assertEqual(jobs[0].company, "Acme & Co.")
+        self.assertEqual(jobs[0].company_url, "https://www.linkedin.com/company/acme-sa")
+        self.assertEqual(jobs[0].location, "Córdoba, Argentina")
+        self.assertEqual(jobs[0].linkedin_job_id, "3901234567")
+        self.assertEqual(jobs[1].title, "Desarrollador Backend Sr.")
+        self.assertEqual(jobs[1].linkedin_job_id, "3907654321")
+
+    def test_empty_page(self):
+        """An empty fragment (past the last page) yields no jobs"""
+        self.assertEqual(LinkedInExtractor(parser='lxml').extract_jobs_from_html(b""), [])
+        self.assertEqual(LinkedInExtractor(parser='bs4').extract_jobs_from_html(b""), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
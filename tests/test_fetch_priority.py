@@ -0,0 +1,99 @@
+"""Tests for predicted-score ordering of the detail backlog"""
+
+import contextlib
+import io
+import sqlite3
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from scraper.core.fetch_priority import FetchPriority
+from scraper.models.job import Job
+from scraper.models.keyword_config import KeywordConfig
+from scraper.models.search_config import SearchConfig
+from utils.work_queue import DetailWorkQueue
+from tests.storage_case import StorageTestCase
+
+NOW = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+JOBS = [
+    {'linkedin_job_id': "3900000001", 'title': "Sales Manager", 'company': "Acme",
+     'searched_at': "2024-06-01T11:00:00Z"},
+    {'linkedin_job_id': "3900000002", 'title': "Senior Java Backend Developer", 'company': "Acme",
+     'searched_at': "2024-06-01T11:00:00Z"},
+    {'linkedin_job_id': "3900000003", 'title': "Python Developer", 'company': "Acme",
+     'location': "Remote", 'searched_at': "2024-06-01T11:00:00Z"},
+]
+
+
+class TestFetchPriority(StorageTestCase):
+    """Test cases for prediction, aging and queue claim order"""
+
+    def setUp(self):
+        super().setUp()
+        self.config = KeywordConfig(["Java", "Backend", "Python"], weights={"Java": 10, "Backend": 8, "Python": 3})
+
+    def test_best_predicted_jobs_come_first(self):
+        """Listing keywords weigh like description keywords"""
+        priority = FetchPriority(self.config, aging_per_hour=0)
+
+        self.assertEqual(priority.predict(JOBS[1]), 18)
+        ordered = priority.order(JOBS, now=NOW)
+        self.assertEqual([job['linkedin_job_id'] for job in ordered], ["3900000002", "3900000003", "3900000001"])
+
+    def test_aging_prevents_starvation(self):
+        """A job that waited long enough overtakes fresh high scorers"""
+        priority = FetchPriority(self.config, aging_per_hour=1.0)
+        stale = dict(JOBS[0], searched_at="2024-05-31T12:00:00Z")
+
+        self.assertEqual(priority.priority(stale, now=NOW), 24)
+        self.assertEqual(priority.order([JOBS[1], stale], now=NOW)[0], stale)
+
+    def test_legacy_rows_without_searched_at_still_age(self):
+        """Listings stored before searched_at existed are stamped when first seen and age from then"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs([Job(title="Sales Manager", company="Acme", linkedin_job_id="3900000001")],
+                                     SearchConfig(keywords="java"))
+        conn = sqlite3.connect(self.storage.db_file)
+        conn.execute("ALTER TABLE job_searches DROP COLUMN searched_at")
+        conn.commit()
+        conn.close()
+
+        legacy = self.open_storage().get_jobs_for_analysis()[0]
+        self.assertIsNotNone(legacy['searched_at'])
+        later = datetime.strptime(legacy['searched_at'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+        priority = FetchPriority(self.config, aging_per_hour=1.0)
+        self.assertEqual(priority.priority(legacy, now=later + timedelta(hours=30)), 30)
+
+        queued = dict(JOBS[0], searched_at=None, enqueued_at="2024-05-31T12:00:00Z")
+        self.assertEqual(priority.priority(queued, now=NOW), 24)
+
+    def test_backfill_runs_only_when_the_column_is_added(self):
+        """Reopening a migrated database does not rewrite job_searches again"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs([Job(title="Sales Manager", company="Acme", linkedin_job_id="3900000001")],
+                                     SearchConfig(keywords="java"))
+        conn = sqlite3.connect(self.storage.db_file)
+        conn.execute("UPDATE job_searches SET searched_at = NULL")
+        conn.commit()
+        conn.close()
+
+        self.assertIsNone(self.open_storage().get_jobs_for_analysis()[0]['searched_at'])
+
+    def test_queue_claims_by_priority(self):
+        """The work queue hands out the best predicted jobs first"""
+        queue = DetailWorkQueue(self.storage, aging_per_hour=1.0)
+        queue.enqueue(JOBS, priority=FetchPriority(self.config))
+
+        claimed = queue.claim("a", batch_size=2)
+        self.assertEqual([job['linkedin_job_id'] for job in claimed], ["3900000002", "3900000003"])
+
+        # Queued long ago: aging lifts the sales job above fresh ones
+        conn = sqlite3.connect(self.storage.db_file)
+        conn.execute("UPDATE detail_queue SET enqueued_at = '2000-01-01T00:00:00Z' WHERE linkedin_job_id = '3900000001'")
+        conn.commit()
+        conn.close()
+        queue.enqueue([{'linkedin_job_id': "3900000004", 'title': "Java Backend", 'company': "Acme"}],
+                      priority=FetchPriority(self.config))
+        self.assertEqual(queue.claim("a", batch_size=1)[0]['linkedin_job_id'], "3900000001")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Tests for the content-addressed raw page archive"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from utils.html_archive import HtmlArchive
+
+URL = "https://www.linkedin.com/jobs/view/java-developer-at-acme-3901234567/"
+PAGE = b"<html><body>" + b"Java developer wanted. " * 200 + b"</body></html>"
+
+
+class TestHtmlArchive(unittest.TestCase):
+    """Test cases for storing, deduplicating and listing fetches"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive = HtmlArchive(Path(self.tmp.name) / "archive")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_identical_bodies_are_stored_once(self):
+        """Refetching the same page adds an index row, not another blob"""
+        first = self.archive.store('detail', URL, PAGE, fetched_at="2024-06-01T10:00:00Z")
+        second = self.archive.store('detail', URL, PAGE, fetched_at="2024-06-02T10:00:00Z")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.archive.load(first), PAGE)
+        self.assertEqual(len(list(self.archive.objects_dir.rglob("*.z"))), 1)
+        stats = self.archive.get_stats()
+        self.assertEqual((stats['fetches'], stats['blobs'], stats['raw_bytes']), (2, 1, len(PAGE)))
+        self.assertLess(stats['stored_bytes'], stats['raw_bytes'])
+
+    def test_latest_fetch_per_url(self):
+        """Only the newest fetch of each URL is listed, oldest URL first, optionally by kind"""
+        self.archive.store('detail', URL, b"old", fetched_at="2024-06-01T10:00:00Z")
+        newest = self.archive.store('detail', URL, b"new", fetched_at="2024-06-03T10:00:00Z")
+        search = self.archive.store('search', "https://www.linkedin.com/jobs/search?keywords=java", b"cards",
+                                    fetched_at="2024-06-02T10:00:00Z")
+
+        latest = self.archive.get_latest_fetches()
+        self.assertEqual([(entry['kind'], entry['sha256']) for entry in latest],
+                         [('search', search), ('detail', newest)])
+        self.assertEqual([entry['sha256'] for entry in self.archive.get_latest_fetches(kind='detail')], [newest])
+
+
+if __name__ == '__main__':
+    unittest.main()
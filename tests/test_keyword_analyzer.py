@@ -0,0 +1,82 @@
+"""Tests for single-pass keyword matching"""
+
+import random
+import re
+import unittest
+from config.keyword_settings import DEFAULT_KEYWORDS
+from scraper.analyzers.keyword_analyzer import CompiledKeywords, KeywordAnalyzer
+from scraper.models.keyword_config import KeywordConfig
+
+
+def findall_counts(keywords, description, case_sensitive=False):
+    """Reference result: one \\b...\\b findall per keyword"""
+    text = description if case_sensitive else description.lower()
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return {
+        kw: len(re.findall(r'\b' + re.escape(kw if case_sensitive else kw.lower()) + r'\b', text, flags))
+        for kw in keywords
+    }
+
+
+class TestKeywordAnalyzer(unittest.TestCase):
+    """The compiled matcher gives the same counts as per-keyword regexes"""
+
+    DESCRIPTION = (
+        "Backend developer (Java, Spring Boot, Spring Cloud). JavaScript is a plus; "
+        "SQL/PostgreSQL, Node.js, OAuth 2.0, QA automation testing, Automated Testing. "
+        "Semi-senior or Semisenior (SSR). AI/LLMs, Open Telemetry. JAVA java-8."
+    )
+
+    def test_default_keywords_parity(self):
+        """Same counts as one findall per keyword, overlapping keywords included"""
+        analyzer = KeywordAnalyzer(KeywordConfig(DEFAULT_KEYWORDS))
+        result = analyzer.analyze(self.DESCRIPTION)
+
+        self.assertEqual(result, findall_counts(DEFAULT_KEYWORDS, self.DESCRIPTION))
+        self.assertEqual(result['Java'], 3)
+        self.assertEqual(result['Spring'], 2)
+        self.assertEqual(result['Spring Boot'], 1)
+        self.assertEqual(result['Semi'], 1)
+
+    def test_case_sensitive_parity(self):
+        """case_sensitive=True matches exact case only"""
+        config = KeywordConfig(["Java", "JAVA", "SQL"], case_sensitive=True)
+        result = KeywordAnalyzer(config).analyze(self.DESCRIPTION)
+
+        self.assertEqual(result, findall_counts(config.keywords, self.DESCRIPTION, case_sensitive=True))
+        self.assertEqual(result['JAVA'], 1)
+
+    def test_random_parity(self):
+        """Random keyword sets over a small alphabet, including punctuation and self-overlaps"""
+        rnd = random.Random(7)
+        alphabet = "ab AB.+-_\n"
+        for _ in range(500):
+            keywords = [''.join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 4)))
+                        for _ in range(rnd.randint(1, 8))]
+            text = ''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 60)))
+            case_sensitive = rnd.random() < 0.3
+            prepared = text if case_sensitive else text.lower()
+
+            self.assertEqual(
+                CompiledKeywords(keywords, case_sensitive).count(prepared),
+                findall_counts(keywords, text, case_sensitive),
+                (keywords, text, case_sensitive),
+            )
+
+    def test_empty_description(self):
+        """Every keyword counts 0 for a missing description"""
+        result = KeywordAnalyzer(KeywordConfig(["Java", "SQL"])).analyze(None)
+        self.assertEqual(result, {"Java": 0, "SQL": 0})
+
+    def test_keyword_list_change_recompiles(self):
+        """Editing the config's keyword list is picked up on the next call"""
+        config = KeywordConfig(["Java"])
+        analyzer = KeywordAnalyzer(config)
+        analyzer.analyze(self.DESCRIPTION)
+        config.keywords.append("Docker")
+
+        self.assertEqual(analyzer.analyze("Docker and Java"), {"Java": 1, "Docker": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
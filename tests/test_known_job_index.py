@@ -0,0 +1,112 @@
+"""Tests for the in-memory known job ID index"""
+
+import contextlib
+import io
+import unittest
+from scraper.core.keyword_matcher import KeywordMatcher
+from scraper.core.known_job_index import KnownJobIndex
+from scraper.models.job import Job
+from scraper.models.keyword_config import KeywordConfig
+from scraper.models.search_config import SearchConfig
+from tests.storage_case import StorageTestCase
+
+
+class InterruptedDetailScraper:
+    """Raises before the first page is fetched, then serves empty pages"""
+
+    def __init__(self):
+        self.calls = 0
+        self.fetched = []
+
+    def scrape_stream(self, jobs, on_result):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("cycle interrupted")
+        for job in jobs:
+            self.fetched.append(job['linkedin_job_id'])
+            on_result(job, {'description': "Java"})
+
+
+class RecordingDetailScraper:
+    """Records the jobs it is asked to fetch without fetching them"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def scrape_stream(self, jobs, on_result):
+        self.scheduled.extend(job['linkedin_job_id'] for job in jobs)
+
+
+class TestKnownJobIndex(StorageTestCase):
+    """Test cases for exact membership and additions"""
+
+    def test_membership_is_exact(self):
+        """Loaded IDs are found and Bloom false positives never leak through"""
+        loaded = range(3_900_000_000, 3_900_000_000 + 20_000, 2)
+        index = KnownJobIndex(str(job_id) for job_id in loaded)
+
+        self.assertEqual(len(index), 10_000)
+        self.assertTrue(all(job_id in index for job_id in loaded))
+        self.assertFalse(any(job_id + 1 in index for job_id in loaded))
+
+    def test_add_reports_new_ids(self):
+        """add() is True once per ID and the ID is known afterwards"""
+        index = KnownJobIndex(["3901234567"])
+
+        self.assertFalse(index.add("3901234567"))
+        self.assertTrue(index.add("3907654321"))
+        self.assertFalse(index.add(3907654321))
+        self.assertIn("3907654321", index)
+        self.assertEqual(len(index), 2)
+
+    def test_missing_ids_are_never_known(self):
+        """None and non-numeric IDs are not members and are not recorded"""
+        index = KnownJobIndex(["3901234567"])
+
+        self.assertNotIn(None, index)
+        self.assertNotIn("not-an-id", index)
+        self.assertFalse(index.add(None))
+        self.assertEqual(len(index), 1)
+
+    def test_memory_is_compact(self):
+        """Fifty thousand IDs fit in well under a megabyte"""
+        index = KnownJobIndex(range(3_900_000_000, 3_900_050_000))
+
+        self.assertLess(index.memory_bytes(), 1024 * 1024)
+
+    def test_unsaved_jobs_are_retried(self):
+        """Jobs scheduled in an interrupted run are fetched by the next one, saved ones are not"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs([Job(title="Dev", company="Acme", linkedin_job_id="3901234567")],
+                                     SearchConfig(keywords="java"))
+            index = KnownJobIndex.from_storage(self.storage, analyzed=True)
+            scraper = InterruptedDetailScraper()
+            matcher = KeywordMatcher(self.storage, KeywordConfig(["Java"]), detail_scraper=scraper,
+                                     analyzed_ids=index)
+
+            with self.assertRaises(RuntimeError):
+                matcher.analyze_jobs(concurrent=True)
+            self.assertNotIn("3901234567", index)
+
+            matcher.analyze_jobs(concurrent=True)
+            self.assertEqual(scraper.fetched, ["3901234567"])
+            self.assertIn("3901234567", index)
+
+    def test_jobs_without_id_pass_the_analyzed_filter(self):
+        """A NULL-ID group from get_jobs_for_analysis is scheduled instead of raising"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs([
+                Job(title="Dev", company="Acme", linkedin_job_id=None),
+                Job(title="QA", company="Acme", linkedin_job_id="3901234567"),
+            ], SearchConfig(keywords="java"))
+            scraper = RecordingDetailScraper()
+            matcher = KeywordMatcher(self.storage, KeywordConfig(["Java"]), detail_scraper=scraper,
+                                     analyzed_ids=KnownJobIndex.from_storage(self.storage, analyzed=True))
+
+            matcher.analyze_jobs(concurrent=True)
+
+        self.assertEqual(scraper.scheduled, [None, "3901234567"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""Tests for near-duplicate posting detection"""
+
+import contextlib
+import io
+import sqlite3
+import unittest
+
+from scraper.core.keyword_matcher import KeywordMatcher
+from scraper.core.near_duplicates import MinHasher, NearDuplicateIndex, normalize_title_key
+from scraper.models.job import Job
+from scraper.models.keyword_config import KeywordConfig
+from scraper.models.search_config import SearchConfig
+from tests.storage_case import StorageTestCase
+
+BACKEND = (
+    "We are looking for a backend engineer to build Java and Spring Boot microservices. "
+    "You will design REST APIs, write JUnit tests, run PostgreSQL in production and "
+    "work with Docker and Kubernetes. Three years of experience and good English required."
+)
+REPOST = BACKEND + " Apply today!"
+FRONTEND = (
+    "Join our design team as a frontend developer. You will build React components, "
+    "improve accessibility, write Cypress tests and collaborate with product managers "
+    "on the user experience of our mobile web application."
+)
+
+
+class FakeDetailScraper:
+    """Serves descriptions by job ID and records which were fetched"""
+
+    def __init__(self, descriptions):
+        self.descriptions = descriptions
+        self.fetched = []
+
+    def scrape_stream(self, jobs, on_result):
+        for job in jobs:
+            self.fetched.append(job['linkedin_job_id'])
+            on_result(job, {'description': self.descriptions[job['linkedin_job_id']], 'applicant_count': 25})
+
+
+class TestNearDuplicates(StorageTestCase):
+    """Test cases for fingerprints, clusters and analysis inheritance"""
+
+    def setUp(self):
+        super().setUp()
+        self.config = KeywordConfig(["Java", "Spring Boot", "React"])
+
+    def search(self, *jobs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs([
+                Job(title=title, company=company, linkedin_job_id=job_id)
+                for job_id, title, company in jobs
+            ], SearchConfig(keywords="java"))
+
+    def analyze(self, descriptions, index):
+        scraper = FakeDetailScraper(descriptions)
+        matcher = KeywordMatcher(self.storage, self.config, detail_scraper=scraper, near_duplicates=index)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = matcher.analyze_jobs(concurrent=True)
+        return scraper.fetched, results
+
+    def test_title_key_ignores_cosmetic_edits(self):
+        """Case, accents, punctuation, abbreviations and legal suffixes don't matter"""
+        self.assertEqual(
+            normalize_title_key("Sr. Backend Devéloper", "Acme, Inc."),
+            normalize_title_key("senior backend developer", "ACME"),
+        )
+        self.assertNotEqual(
+            normalize_title_key("Backend Developer", "Acme"),
+            normalize_title_key("Frontend Developer", "Acme"),
+        )
+
+    def test_signatures_estimate_similarity(self):
+        """Reposts with small edits match, unrelated descriptions don't"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            index = NearDuplicateIndex(self.storage)
+        hasher = MinHasher()
+        index.add("1", "Backend", "Acme", BACKEND)
+
+        self.assertEqual(index.find_duplicate(hasher.signature(REPOST))[0], "1")
+        self.assertIsNone(index.find_duplicate(hasher.signature(FRONTEND)))
+        self.assertIsNone(hasher.signature(""))
+
+    def test_reposts_inherit_analysis(self):
+        """A confirmed cluster's analysis is copied to reposts without fetching them"""
+        self.search(("3900000001", "Backend Developer", "Acme"),
+                    ("3900000002", "Backend Developer", "Acme"),
+                    ("3900000003", "Frontend Developer", "Acme"))
+        descriptions = {"3900000001": BACKEND, "3900000002": BACKEND, "3900000003": FRONTEND}
+        with contextlib.redirect_stdout(io.StringIO()):
+            index = NearDuplicateIndex(self.storage)
+        fetched, _ = self.analyze(descriptions, index)
+        self.assertEqual(len(fetched), 3)
+
+        # Same listing, cosmetically different title and company
+        self.search(("3900000004", "Backend Developer!", "ACME Inc."),
+                    ("3900000005", "Frontend Developer", "Acme"))
+        descriptions["3900000005"] = FRONTEND
+        fetched, _ = self.analyze(descriptions, index)
+
+        # The frontend cluster has a single posting, so it is not trusted yet
+        self.assertEqual(fetched, ["3900000005"])
+        conn = sqlite3.connect(self.storage.db_file)
+        scores = dict(conn.execute("SELECT linkedin_job_id, weighted_score FROM job_posts").fetchall())
+        posting_fields = conn.execute(
+            "SELECT applicant_count, date_time FROM job_posts WHERE linkedin_job_id = '3900000004'"
+        ).fetchone()
+        counts = conn.execute(
+            "SELECT COUNT(*) FROM job_keyword_counts WHERE linkedin_job_id = '3900000004'"
+        ).fetchone()[0]
+        unique = [row[0] for row in conn.execute("SELECT linkedin_job_id FROM job_summary_unique")]
+        conn.close()
+        self.assertEqual(scores["3900000004"], scores["3900000001"])
+        self.assertEqual(counts, 2)
+        # Applicants and posting date belong to the source posting, not the repost
+        self.assertEqual(posting_fields, (None, None))
+        # The dashboard shows one posting per cluster
+        self.assertEqual(len(unique), 2)
+
+        # Clusters survive a restart
+        with contextlib.redirect_stdout(io.StringIO()):
+            reloaded = NearDuplicateIndex(self.storage)
+        self.assertEqual(reloaded.get_stats(), index.get_stats())
+        self.assertEqual(reloaded.get_stats()['repost_clusters'], 2)
+
+    def test_backfills_analyzed_jobs(self):
+        """Jobs analyzed before fingerprinting are clustered on first load"""
+        self.search(("3900000001", "Backend Developer", "Acme"),
+                    ("3900000002", "Backend Developer", "Acme"))
+        self.analyze({"3900000001": BACKEND, "3900000002": REPOST}, None)
+
+        # Work processes leave the backfill to the parent and pick its fingerprints up on reload
+        worker = NearDuplicateIndex(self.storage, backfill=False)
+        self.assertIsNone(worker.inheritable_source("Backend Developer", "Acme"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            index = NearDuplicateIndex(self.storage)
+        self.assertEqual(index.inheritable_source("Backend Developer", "Acme"), "3900000001")
+        self.assertEqual(worker.reload(), 2)
+        self.assertEqual(worker.inheritable_source("Backend Developer", "Acme"), "3900000001")
+        self.assertEqual(worker.reload(), 0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(index.backfill(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
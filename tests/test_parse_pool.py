@@ -0,0 +1,43 @@
+"""Tests for parsing pages in worker processes"""
+
+import contextlib
+import io
+import unittest
+from pathlib import Path
+from scraper.core.detail_scraper import parse_details
+from scraper.core.parse_pool import ParsePool
+from scraper.extractors.linkedin_extractor import LinkedInExtractor
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+class TestParsePool(unittest.TestCase):
+    """Worker processes return the same results as inline parsing"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParsePool(workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_listing_parity(self):
+        """Listings parsed in the pool match the inline extractor"""
+        content = (FIXTURES / "search_page.html").read_bytes()
+        with contextlib.redirect_stdout(io.StringIO()):
+            inline = LinkedInExtractor().extract_jobs_from_html(content, max_results=None)
+            pooled = self.pool.parse_listing(content)
+
+        self.assertTrue(pooled)
+        self.assertEqual([job.to_dict() for job in pooled], [job.to_dict() for job in inline])
+
+    def test_detail_parity(self):
+        """Detail pages parsed in the pool match parse_details"""
+        content = (FIXTURES / "detail_page.html").read_bytes()
+
+        self.assertEqual(self.pool.parse_detail(content), parse_details(content))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for the blacklist and title filter applied before detail fetching"""
+
+import contextlib
+import io
+import unittest
+
+from scraper.core.keyword_matcher import KeywordMatcher
+from scraper.core.prefetch_filter import PrefetchFilter
+from scraper.models.job import Job
+from scraper.models.keyword_config import KeywordConfig
+from scraper.models.search_config import SearchConfig
+from utils.work_queue import DetailWorkQueue
+from tests.storage_case import StorageTestCase
+
+LISTINGS = [
+    ("3900000001", "Java Developer", "Acme"),
+    ("3900000002", "Java Developer", "Spam Corp"),
+    ("3900000003", "Sales Executive", "Acme"),
+    ("3900000004", "Backend Engineer (Internship)", "Acme"),
+    ("3900000005", "Data Analyst", "Acme"),
+]
+
+
+class RecordingDetailScraper:
+    """Records fetched job IDs and returns no details"""
+
+    def __init__(self):
+        self.fetched = []
+
+    def scrape_stream(self, jobs, on_result):
+        for job in jobs:
+            self.fetched.append(job['linkedin_job_id'])
+            on_result(job, None)
+
+
+class TestPrefetchFilter(StorageTestCase):
+    """Test cases for dropping jobs before any request"""
+
+    def setUp(self):
+        super().setUp()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs([
+                Job(title=title, company=company, linkedin_job_id=job_id)
+                for job_id, title, company in LISTINGS
+            ], SearchConfig(keywords="java"))
+        self.storage.add_blacklisted_company("Spam Corp")
+        self.prefetch_filter = PrefetchFilter(include=[r"\bdeveloper\b", r"\bengineer\b", r"\bsales\b"],
+                                              exclude=[r"\bsales\b", r"\bintern(ship)?\b"])
+
+    def test_reasons(self):
+        """Blacklist first, then exclude rules, then include rules"""
+        jobs = {job['linkedin_job_id']: job for job in self.storage.get_jobs_without_analysis()}
+
+        self.assertEqual(
+            {job_id: self.prefetch_filter.reason(job) for job_id, job in jobs.items()},
+            {
+                "3900000001": None,
+                "3900000002": 'blacklisted',
+                "3900000003": 'title_excluded',
+                "3900000004": 'title_excluded',
+                "3900000005": 'title_not_included',
+            },
+        )
+
+    def test_filtered_jobs_are_never_fetched(self):
+        """analyze_jobs and the work queue only see jobs that pass, and report the savings"""
+        scraper = RecordingDetailScraper()
+        matcher = KeywordMatcher(self.storage, KeywordConfig(["Java"]), detail_scraper=scraper,
+                                 prefetch_filter=self.prefetch_filter)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            matcher.analyze_jobs(concurrent=True)
+
+        self.assertEqual(scraper.fetched, ["3900000001"])
+        self.assertIn("4 detail requests saved", output.getvalue())
+
+        # Jobs dropped on an earlier run are not counted as savings again
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.storage.remove_blacklisted_company("Spam Corp")
+            added = DetailWorkQueue(self.storage).enqueue_backlog(prefetch_filter=self.prefetch_filter)
+        self.assertEqual(added, 1)
+        self.assertNotIn("requests saved", output.getvalue())
+        self.assertIn("Skipped 3 jobs filtered on earlier runs", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
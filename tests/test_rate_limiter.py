@@ -0,0 +1,30 @@
+"""Tests for the shared per-host rate limiter"""
+
+import unittest
+from scraper.core.rate_limiter import HostRateLimiter
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    """Test cases for token bucket reservations"""
+
+    def test_burst_then_throttle(self):
+        """Requests beyond the burst must wait roughly 1/rate seconds each"""
+        limiter = HostRateLimiter(rate=10, burst=2)
+        url = "https://www.linkedin.com/jobs/search/?keywords=java"
+
+        self.assertEqual(limiter.reserve(url), 0.0)
+        self.assertEqual(limiter.reserve(url), 0.0)
+        self.assertAlmostEqual(limiter.reserve(url), 0.1, places=2)
+        self.assertAlmostEqual(limiter.reserve(url), 0.2, places=2)
+
+    def test_hosts_are_independent(self):
+        """Each host gets its own bucket"""
+        limiter = HostRateLimiter(rate=1, burst=1)
+
+        self.assertEqual(limiter.reserve("https://a.example.com/x"), 0.0)
+        self.assertEqual(limiter.reserve("https://b.example.com/x"), 0.0)
+        self.assertGreater(limiter.reserve("https://a.example.com/y"), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for rebuilding stored job fields from the page archive"""
+
+import contextlib
+import io
+import unittest
+from pathlib import Path
+
+from scraper.core.reextract import reextract_archive
+from scraper.extractors.linkedin_extractor import extract_job_id
+from scraper.models.job import Job
+from scraper.models.match_result import MatchResult
+from scraper.models.search_config import SearchConfig
+from utils.html_archive import HtmlArchive
+from tests.storage_case import StorageTestCase
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+DETAIL_URL = "https://www.linkedin.com/jobs/view/java-developer-at-acme-3901234567/"
+SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords=java"
+
+
+class TestReextract(StorageTestCase):
+    """Test cases for offline re-extraction"""
+
+    def setUp(self):
+        super().setUp()
+        self.archive = HtmlArchive(Path(self.tmp.name) / "archive")
+
+    def test_job_id_from_url(self):
+        """IDs are read from slugged and bare job view URLs only"""
+        self.assertEqual(extract_job_id(DETAIL_URL), "3901234567")
+        self.assertEqual(extract_job_id("https://www.linkedin.com/jobs/view/3907654321/?trk=x"), "3907654321")
+        self.assertIsNone(extract_job_id(SEARCH_URL))
+
+    def test_stored_rows_are_rebuilt_from_archived_pages(self):
+        """Listing and detail fields come back from the latest archived pages"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs([
+                Job(title="stale title", company="stale company", linkedin_job_id="3901234567"),
+                Job(title="stale title", company="stale company", linkedin_job_id="3907654321"),
+            ], SearchConfig(keywords="java"))
+        stale = MatchResult("3901234567")
+        stale.description = "stale description"
+        self.storage.save_job_analysis(stale)
+        self.archive.store('search', SEARCH_URL, (FIXTURES / "search_page.html").read_bytes())
+        self.archive.store('detail', DETAIL_URL, (FIXTURES / "detail_page.html").read_bytes())
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = reextract_archive(self.storage, archive=self.archive, workers=1)
+
+        self.assertEqual((report['pages'], report['job_posts_updated'], report['job_searches_updated']), (2, 1, 2))
+        jobs = {job['linkedin_job_id']: job for job in self.storage.get_analyzed_jobs()}
+        self.assertEqual((jobs["3901234567"]['title'], jobs["3901234567"]['company']), ("Java Developer", "Acme & Co."))
+        self.assertIn("Spring Boot", jobs["3901234567"]['description'])
+        self.assertEqual(jobs["3901234567"]['applicant_count'], 201)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Tests for the offline replay server"""
+
+import unittest
+from benchmarks.replay_server import ReplayServer, SyntheticSource
+from scraper.core.http_client import HttpClient
+from scraper.core.scraper import JobScraper
+from scraper.models.search_config import SearchConfig
+from tests.storage_case import StorageTestCase
+
+
+class TestReplayServer(StorageTestCase):
+    """Test cases for serving pages to the real fetch code"""
+
+    def test_paginated_search_against_server(self):
+        """JobScraper walks synthetic pages served locally"""
+        with ReplayServer(source=SyntheticSource(jobs_per_query=25, page_size=10)) as server:
+            client = HttpClient(origin=server.url, read_timeout=2)
+            scraper = JobScraper(sqlite_storage=self.storage, http_client=client)
+
+            jobs = scraper.search_jobs(SearchConfig(keywords="java", max_results=100), paginate=True)
+
+        self.assertEqual(len(jobs), 25)
+        self.assertEqual(server.counts['search_requests'], 4)
+
+    def test_injected_rate_limit(self):
+        """rate_limit_ratio=1 answers every request with 429 and Retry-After"""
+        with ReplayServer(rate_limit_ratio=1.0, retry_after=7) as server:
+            response = HttpClient(origin=server.url).get("https://www.linkedin.com/jobs/view/3900000001/")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers['Retry-After'], "7")
+
+
+if __name__ == '__main__':
+    unittest.main()
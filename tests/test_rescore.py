@@ -0,0 +1,125 @@
+"""Tests for offline re-scoring of stored descriptions"""
+
+import contextlib
+import io
+import sqlite3
+import unittest
+from scraper.analyzers.keyword_analyzer import KeywordAnalyzer
+from scraper.core.rescore import rescore_job_posts
+from scraper.models.job import Job
+from scraper.models.keyword_config import KeywordConfig
+from scraper.models.match_result import MatchResult
+from scraper.models.search_config import SearchConfig
+from tests.storage_case import StorageTestCase
+
+DESCRIPTIONS = [
+    "Java and Spring Boot backend, Docker",
+    "Python data pipelines with SQL",
+    None,
+    "Java Java Kotlin",
+] * 5
+
+
+class TestRescore(StorageTestCase):
+    """Test cases for re-scoring job_posts with new keywords"""
+
+    def setUp(self):
+        super().setUp()
+        old_config = KeywordConfig(["Java"])
+        for i, description in enumerate(DESCRIPTIONS):
+            self.storage.save_job_analysis(self.analyze(str(3900000000 + i), description, old_config))
+
+    @staticmethod
+    def analyze(job_id, description, config):
+        result = MatchResult(job_id)
+        result.description = description
+        if description:
+            result.keyword_matches = KeywordAnalyzer(config).analyze(description)
+        result.calculate_score(config)
+        return result
+
+    def stored_scores(self):
+        conn = sqlite3.connect(self.storage.db_file)
+        rows = conn.execute("""
+            SELECT linkedin_job_id, total_matches, weighted_score, matched_keywords, match_percentage
+            FROM job_posts
+        """).fetchall()
+        conn.close()
+        return {row[0]: row[1:] for row in rows}
+
+    def rescore(self, config, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return rescore_job_posts(self.storage, config, workers=2, batch_size=3, **kwargs)
+
+    def assert_scores_match(self, config):
+        stored = self.stored_scores()
+        for i, description in enumerate(DESCRIPTIONS):
+            expected = self.analyze(str(3900000000 + i), description, config)
+            self.assertEqual(stored[expected.linkedin_job_id], (
+                expected.total_matches,
+                expected.weighted_score,
+                ','.join(expected.matched_keywords),
+                expected.match_percentage,
+            ))
+
+    def test_rescore_matches_fresh_analysis(self):
+        """Every row gets the scores a fresh analysis with the new config would give"""
+        config = KeywordConfig(["Java", "Docker", "SQL", "Kotlin", "java"], weights={"Java": 5, "Kotlin": 2})
+        stats = self.rescore(config)
+
+        self.assertEqual(stats['counted_jobs'], len(DESCRIPTIONS))
+        self.assertEqual(stats['counted_terms'], 4 * len(DESCRIPTIONS))
+        self.assertEqual(stats['scored_jobs'], len(DESCRIPTIONS))
+        self.assert_scores_match(config)
+
+    def test_work_is_proportional_to_the_change(self):
+        """Weight edits scan no text; a new keyword is counted alone; no change does nothing"""
+        self.rescore(KeywordConfig(["Java", "Docker"]))
+
+        reweighted = KeywordConfig(["Java", "Docker"], weights={"Docker": 4})
+        stats = self.rescore(reweighted)
+        self.assertEqual(stats['counted_terms'], 0)
+        self.assertEqual(stats['scored_jobs'], len(DESCRIPTIONS))
+        self.assert_scores_match(reweighted)
+
+        extended = KeywordConfig(["Java", "Docker", "SQL"], weights={"Docker": 4})
+        stats = self.rescore(extended)
+        self.assertEqual(stats['counted_terms'], len(DESCRIPTIONS))
+        self.assert_scores_match(extended)
+
+        # Dropping a keyword needs no counting either
+        stats = self.rescore(reweighted)
+        self.assertEqual(stats['counted_terms'], 0)
+        self.assert_scores_match(reweighted)
+
+        self.assertEqual(self.rescore(reweighted)['scored_jobs'], 0)
+        self.assertEqual(self.rescore(reweighted, full=True)['counted_terms'], 2 * len(DESCRIPTIONS))
+
+    def test_analysis_saves_counts(self):
+        """Jobs saved with their config need no counting for that config"""
+        config = KeywordConfig(["Java", "SQL"])
+        self.storage.save_keyword_profile(config)
+        for i, description in enumerate(DESCRIPTIONS):
+            self.storage.save_job_analysis(self.analyze(str(3900000000 + i), description, config), config)
+
+        self.assertEqual(self.storage.count_stale_job_posts(config), (0, 0))
+        stats = self.rescore(KeywordConfig(["Java", "SQL"], weights={"SQL": 3}))
+        self.assertEqual(stats['counted_terms'], 0)
+        self.assertEqual(stats['scored_jobs'], len(DESCRIPTIONS))
+
+    def test_include_analyzed_jobs(self):
+        """skip_analyzed=False re-selects jobs that already have an analysis"""
+        jobs = [Job(title=f"Dev {i}", company=f"Co {i}", linkedin_job_id=str(3900000000 + i)) for i in range(2)]
+        jobs.append(Job(title="New", company="Co", linkedin_job_id="3999999999"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage.append_jobs(jobs, SearchConfig(keywords="java"))
+
+        pending = self.storage.get_jobs_for_analysis(include_analyzed=False)
+        everything = self.storage.get_jobs_for_analysis(include_analyzed=True)
+
+        self.assertEqual([job['linkedin_job_id'] for job in pending], ["3999999999"])
+        self.assertEqual(len(everything), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
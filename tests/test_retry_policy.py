@@ -0,0 +1,156 @@
+"""Tests for the shared retry policy and non-blocking retries"""
+
+import time
+import unittest
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import requests
+
+from scraper.core.detail_scraper import DetailScraper
+from scraper.core.retry_policy import CircuitBreaker, RetryPolicy, parse_retry_after
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def make_response(status, headers=None, content=b""):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = content
+    return response
+
+
+class ScriptedClient:
+    """Answers each URL with its scripted statuses in turn, then 200"""
+
+    route_count = 1
+
+    def __init__(self, script):
+        self.script = {url: list(statuses) for url, statuses in script.items()}
+        self.calls = []
+        self.page = (FIXTURES / "detail_page.html").read_bytes()
+
+    def get(self, url, profile=None):
+        self.calls.append(url)
+        statuses = self.script.get(url)
+        status = statuses.pop(0) if statuses else 200
+        if status == 'error':
+            raise requests.exceptions.ConnectionError("connection reset")
+        return make_response(status, content=self.page if status == 200 else b"")
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test cases for retry decisions and backoff"""
+
+    def test_retryable_outcomes(self):
+        """429, 5xx and connection errors are retried; 404 is final"""
+        self.assertTrue(RetryPolicy.is_retryable(make_response(429)))
+        self.assertTrue(RetryPolicy.is_retryable(make_response(503)))
+        self.assertTrue(RetryPolicy.is_retryable(error=requests.exceptions.ConnectionError()))
+        self.assertFalse(RetryPolicy.is_retryable(make_response(404)))
+
+    def test_retry_after_wins(self):
+        """Retry-After is honored in seconds and as an HTTP date"""
+        policy = RetryPolicy(base_delay=5, max_delay=60)
+        self.assertEqual(policy.backoff(1, make_response(429, {'Retry-After': '42'})), 42.0)
+
+        later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=90), usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(later), 90, delta=2)
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_exponential_backoff_with_jitter(self):
+        """Delays double per attempt, stay within equal-jitter bounds and are capped"""
+        policy = RetryPolicy(base_delay=4, max_delay=20)
+        for attempt, ceiling in [(1, 4), (2, 8), (3, 16), (4, 20), (8, 20)]:
+            delay = policy.backoff(attempt)
+            self.assertGreaterEqual(delay, ceiling / 2)
+            self.assertLessEqual(delay, ceiling)
+
+    def test_circuit_breaker(self):
+        """Opens after the threshold, lets one trial through, closes on success"""
+        breaker = CircuitBreaker(threshold=2, cooldown=0.05)
+        breaker.record(success=False)
+        self.assertEqual(breaker.wait_time(), 0)
+        breaker.record(success=False)
+        self.assertGreater(breaker.wait_time(), 0)
+
+        time.sleep(0.06)
+        self.assertEqual(breaker.wait_time(), 0)
+        self.assertGreater(breaker.wait_time(), 0)
+        breaker.record(success=True)
+        self.assertFalse(breaker.is_open)
+
+    def test_breakers_are_per_host(self):
+        """Failures on one host do not open another host's circuit"""
+        policy = RetryPolicy(breaker_threshold=1)
+        policy.record("https://a.example/x", make_response(503))
+        self.assertTrue(policy.breaker_for("https://a.example/y").is_open)
+        self.assertFalse(policy.breaker_for("https://b.example/y").is_open)
+
+    def test_route_429s_leave_the_host_breaker_closed(self):
+        """429s the egress pool cooled a route down for don't open the host's circuit for all routes"""
+        policy = RetryPolicy(breaker_threshold=1)
+        routed = make_response(429)
+        routed.egress_route = "proxy-1"
+
+        self.assertEqual(policy.record("https://a.example/x", routed), 'retry')
+        self.assertFalse(policy.breaker_for("https://a.example/y").is_open)
+        policy.record("https://a.example/x", make_response(429))
+        self.assertTrue(policy.breaker_for("https://a.example/y").is_open)
+
+
+class TestNonBlockingRetries(unittest.TestCase):
+    """A rate-limited URL is rescheduled instead of stalling the others"""
+
+    URL_A = "https://www.linkedin.com/jobs/view/1/"
+    URL_B = "https://www.linkedin.com/jobs/view/2/"
+
+    def make_scraper(self, client):
+        policy = RetryPolicy(max_retries=2, base_delay=0.2)
+        return DetailScraper(http_client=client, min_delay=0.001, max_delay=0.001,
+                             archive=False, retry_policy=policy)
+
+    def test_sequential_requeues_rate_limited_url(self):
+        """The next job is fetched while a 429'd one waits its backoff"""
+        client = ScriptedClient({self.URL_A: [429]})
+        finished = []
+        self.make_scraper(client).scrape_sequential(
+            [{'job_url': self.URL_A}, {'job_url': self.URL_B}],
+            lambda job, details: finished.append((job['job_url'], details is not None)),
+        )
+
+        self.assertEqual(client.calls, [self.URL_A, self.URL_B, self.URL_A])
+        self.assertEqual(finished, [(self.URL_B, True), (self.URL_A, True)])
+
+    def test_sequential_gives_up_after_max_retries(self):
+        """Retries stop at max_retries and a final 404 is not retried"""
+        client = ScriptedClient({self.URL_A: ['error', 503, 503, 503], self.URL_B: [404]})
+        finished = {}
+        self.make_scraper(client).scrape_sequential(
+            [{'job_url': self.URL_A}, {'job_url': self.URL_B}],
+            lambda job, details: finished.update({job['job_url']: details}),
+        )
+
+        self.assertEqual(client.calls.count(self.URL_A), 3)
+        self.assertEqual(client.calls.count(self.URL_B), 1)
+        self.assertEqual(finished, {self.URL_A: None, self.URL_B: None})
+
+    def test_async_backoff_frees_the_slot(self):
+        """With one slot, another job runs while a 429'd job backs off"""
+        client = ScriptedClient({self.URL_A: [429]})
+        finished = []
+        self.make_scraper(client).scrape_stream(
+            [{'job_url': self.URL_A}, {'job_url': self.URL_B}],
+            lambda job, details: finished.append(job['job_url']),
+            concurrency=1,
+            requests_per_second=100,
+        )
+
+        self.assertEqual(client.calls, [self.URL_A, self.URL_B, self.URL_A])
+        self.assertEqual(finished, [self.URL_B, self.URL_A])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,34 @@ import unittest
 from scraper.models.job import Job
 from scraper.models.search_config import SearchConfig
 from scraper.core.url_builder import LinkedInURLBuilder
+from scraper.core.scraper import JobScraper
+from tests.storage_case import StorageTestCase
+
+
+def make_card(job_id, title="Java Developer", company="Acme"):
+    """Build a minimal guest search result card"""
+    return (
+        f'<li><div class="base-card job-search-card">'
+        f'<a class="base-card__full-link" href="https://ar.linkedin.com/jobs/view/java-dev-{job_id}?trk=x"></a>'
+        f'<h3 class="base-search-card__title"> {title} </h3>'
+        f'<h4 class="base-search-card__subtitle"><a href="https://ar.linkedin.com/company/{company.lower()}?trk=x">{company}</a></h4>'
+        f'<span class="job-search-card__location">Buenos Aires</span>'
+        f'</div></li>'
+    )
+
+
+class PagedScraper(JobScraper):
+    """JobScraper serving canned result pages keyed by start offset"""
+
+    def __init__(self, pages, **kwargs):
+        super().__init__(**kwargs)
+        self.pages = pages
+        self.requested = []
+
+    def _get_page_content(self, url):
+        start = int(url.rsplit("start=", 1)[1])
+        self.requested.append(start)
+        return self.pages.get(start, "").encode("utf-8")
 
 
 class TestJobScraper(unittest.TestCase):
@@ -52,6 +80,95 @@ class TestJobScraper(unittest.TestCase):
         self.assertIn("location=", url)
         self.assertIn("f_TPR=", url)
 
+    def test_page_url_builder(self):
+        """Test guest fragment URL with result offset"""
+        config = SearchConfig(keywords="java", location="Argentina", remote=True)
+
+        url = LinkedInURLBuilder.build_page_url(config, start=25)
+
+        self.assertIn("seeMoreJobPostings", url)
+        self.assertIn("keywords=java", url)
+        self.assertIn("f_WT=2", url)
+        self.assertTrue(url.endswith("start=25"))
+
+
+class TestPagination(StorageTestCase):
+    """Test cases for paginated search results"""
+
+    def test_stops_at_max_results(self):
+        """Pagination stops once max_results jobs were yielded"""
+        pages = {
+            0: "".join(make_card(10000 + i) for i in range(10)),
+            10: "".join(make_card(20000 + i) for i in range(10)),
+            20: "".join(make_card(30000 + i) for i in range(10)),
+        }
+        scraper = PagedScraper(pages, sqlite_storage=self.storage)
+        config = SearchConfig(keywords="java", max_results=15)
+
+        batches = list(scraper.iter_job_pages(config))
+
+        self.assertEqual([len(b) for b in batches], [10, 5])
+        self.assertEqual(scraper.requested, [0, 10])
+
+    def test_stops_when_page_has_nothing_new(self):
+        """A page repeating already seen jobs ends the walk"""
+        first = "".join(make_card(10000 + i) for i in range(10))
+        scraper = PagedScraper({0: first, 10: first}, sqlite_storage=self.storage)
+        config = SearchConfig(keywords="java", max_results=100)
+
+        jobs = scraper.search_jobs(config, save_results=True, paginate=True)
+
+        self.assertEqual(len(jobs), 10)
+        self.assertEqual(scraper.requested, [0, 10])
+        self.assertEqual(self.storage.get_total_jobs(), 10)
+
+    def test_incremental_sync_stops_at_watermark(self):
+        """A second run only fetches and stores postings above the watermark"""
+        config = SearchConfig(keywords="java", max_results=100)
+        first = PagedScraper({
+            0: "".join(make_card(10019 - i) for i in range(10)),
+            10: "".join(make_card(10009 - i) for i in range(10)),
+        }, sqlite_storage=self.storage)
+
+        self.assertEqual(len(first.search_jobs(config, incremental=True, paginate=True)), 20)
+
+        second = PagedScraper({
+            0: "".join(make_card(10022 - i) for i in range(10)),
+            10: "".join(make_card(10012 - i) for i in range(10)),
+        }, sqlite_storage=self.storage)
+        jobs = second.search_jobs(config, incremental=True, paginate=True)
+
+        self.assertEqual([j.linkedin_job_id for j in jobs], ["10022", "10021", "10020"])
+        self.assertEqual(second.requested, [0])
+        self.assertEqual(self.storage.get_total_jobs(), 23)
+
+    def test_incremental_sync_skips_a_promoted_known_card(self):
+        """An old card at the top of page 1 doesn't end the walk before newer postings"""
+        config = SearchConfig(keywords="java", max_results=100)
+        first = PagedScraper({0: "".join(make_card(10009 - i) for i in range(10))}, sqlite_storage=self.storage)
+        first.search_jobs(config, incremental=True, paginate=True)
+
+        # Promoted old posting first, then new ones spilling onto page 2
+        second = PagedScraper({
+            0: make_card(10003) + "".join(make_card(10020 - i) for i in range(9)),
+            10: "".join(make_card(10011 - i) for i in range(2)) + "".join(make_card(10009 - i) for i in range(8)),
+        }, sqlite_storage=self.storage)
+        jobs = second.search_jobs(config, incremental=True, paginate=True)
+
+        self.assertEqual([j.linkedin_job_id for j in jobs], [str(10020 - i) for i in range(11)])
+        self.assertEqual(second.requested, [0, 10])
+
+    def test_incremental_sync_respects_paginate(self):
+        """Without paginate, an incremental run reads only the first page"""
+        config = SearchConfig(keywords="java", max_results=100)
+        scraper = PagedScraper({
+            0: "".join(make_card(10019 - i) for i in range(10)),
+            10: "".join(make_card(10009 - i) for i in range(10)),
+        }, sqlite_storage=self.storage)
+
+        self.assertEqual(len(scraper.search_jobs(config, incremental=True, paginate=False)), 10)
+        self.assertEqual(scraper.requested, [0])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""Tests for the search plan compiler"""
+
+import unittest
+from scraper.core.batch_search import BatchSearchEngine
+from scraper.core.http_client import HttpClient
+from scraper.core.search_plan import SearchPlan, expand_templates
+from scraper.models.job import Job
+
+
+class CountingScraper:
+    """Stand-in JobScraper that records each search it is asked to run"""
+
+    def __init__(self):
+        self.searches = []
+        self.http_client = HttpClient()
+
+    def search_jobs(self, search_config, save_results=True, paginate=False, incremental=False):
+        self.searches.append(search_config)
+        return [
+            Job(title=f"{search_config.keywords} {i}", linkedin_job_id=str(i))
+            for i in range(search_config.max_results)
+        ]
+
+
+class TestSearchPlan(unittest.TestCase):
+    """Test cases for grid expansion, query dedup and result attribution"""
+
+    def test_grid_expansion(self):
+        """List-valued fields expand into every combination"""
+        expanded = expand_templates([{
+            "name": "Jr",
+            "keywords": ["Java", "Python"],
+            "location": ["Argentina", "Latin America"],
+            "remote": [False, True],
+        }])
+
+        self.assertEqual(len(expanded), 8)
+        self.assertEqual(expanded[0][0], "Jr [Java / Argentina / on-site]")
+        self.assertTrue(expanded[-1][1].remote)
+
+    def test_identical_queries_are_merged(self):
+        """Spelling differences collapse to one query asking for the largest max_results"""
+        plan = SearchPlan([
+            {"name": "A", "keywords": "Java", "location": "Argentina", "experience_levels": [1, 2], "max_results": 20},
+            {"name": "B", "keywords": "java ", "location": "Argentina", "experience_levels": [2, 1], "max_results": 50},
+            {"name": "C", "keywords": "Java", "location": "Chile", "max_results": 20},
+        ])
+
+        self.assertEqual(len(plan.templates), 3)
+        self.assertEqual(len(plan), 2)
+        self.assertEqual(plan.queries[0].template_names, ["A", "B"])
+        self.assertEqual(plan.queries[0].search_config.max_results, 50)
+        self.assertEqual(plan.expected_requests(), 5 + 2)
+        self.assertEqual(plan.naive_requests(), 2 + 5 + 2)
+
+    def test_shared_results_are_attributed(self):
+        """Each shared query is requested once and every template gets its results"""
+        scraper = CountingScraper()
+        engine = BatchSearchEngine(scraper=scraper, max_workers=2)
+        results = engine.run([
+            {"name": "Arg", "keywords": "Java", "location": "Argentina", "max_results": 5},
+            {"name": "Arg again", "keywords": "Java", "location": "Argentina", "max_results": 3},
+        ])
+
+        self.assertEqual(len(scraper.searches), 1)
+        self.assertEqual([len(r.jobs) for r in results], [5, 3])
+        self.assertEqual(results[0].shared_with, ["Arg again"])
+
+
+if __name__ == '__main__':
+    unittest.main()
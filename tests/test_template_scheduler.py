@@ -0,0 +1,69 @@
+"""Tests for the yield-adaptive search scheduler"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from scraper.core.batch_search import TemplateResult
+from scraper.core.search_plan import SearchPlan
+from scraper.core.template_scheduler import TemplateScheduler
+from scraper.models.job import Job
+from tests.storage_case import StorageTestCase
+
+TEMPLATES = [
+    {"name": "Busy", "keywords": "Java", "location": "Argentina", "time_posted": "1h"},
+    {"name": "Dead", "keywords": "Cobol", "location": "Argentina", "time_posted": "1h"},
+]
+
+
+class TestTemplateScheduler(StorageTestCase):
+    """Test cases for due selection and interval adaptation"""
+
+    def setUp(self):
+        super().setUp()
+        self.start = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+    def run_plan(self, now, yields):
+        """Select due queries at `now` and record the given new-job counts per template"""
+        scheduler = TemplateScheduler(
+            self.storage, base_interval=60, min_interval=15, max_interval=480, high_yield=10, grace=5
+        )
+        plan = SearchPlan(TEMPLATES)
+        due = scheduler.select(plan, now=now)
+        for query in due:
+            result = TemplateResult(query.template_names[0], query.search_config)
+            result.jobs = [Job(linkedin_job_id=str(i)) for i in range(yields[query.template_names[0]])]
+            scheduler.record(query, result)
+        return {d['query'].template_names[0]: d for d in scheduler.decisions}
+
+    def test_intervals_adapt_to_yield(self):
+        """High-yield queries speed up, empty ones back off, and not-due ones are skipped"""
+        decisions = self.run_plan(self.start, {"Busy": 12, "Dead": 0})
+        self.assertEqual(decisions["Busy"]["interval"], 30)
+        self.assertEqual(decisions["Dead"]["interval"], 120)
+
+        decisions = self.run_plan(self.start + timedelta(minutes=30), {"Busy": 12, "Dead": 0})
+        self.assertEqual(decisions["Busy"]["action"], "faster")
+        self.assertEqual(decisions["Busy"]["interval"], 15)
+        self.assertEqual(decisions["Dead"]["action"], "skipped")
+
+        runs = self.storage.get_search_schedule()
+        self.assertEqual(sorted(row["runs"] for row in runs.values()), [1, 2])
+
+    def test_interval_is_capped(self):
+        """Back-off stops at the maximum interval"""
+        now = self.start
+        for _ in range(6):
+            decisions = self.run_plan(now, {"Busy": 0, "Dead": 0})
+            now += timedelta(minutes=decisions["Dead"]["interval"])
+        self.assertEqual(decisions["Dead"]["interval"], 480)
+
+    def test_window_widens_after_long_gap(self):
+        """A query that waited three hours searches the last 24h instead of the last hour"""
+        self.run_plan(self.start, {"Busy": 0, "Dead": 0})
+        scheduler = TemplateScheduler(self.storage, grace=5)
+        due = scheduler.select(SearchPlan(TEMPLATES), now=self.start + timedelta(hours=3))
+
+        self.assertEqual([query.search_config.time_posted for query in due], ["24", "24"])
+
+
+if __name__ == '__main__':
+    unittest.main()
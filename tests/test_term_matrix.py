@@ -0,0 +1,103 @@
+"""Tests for the persisted job x keyword term matrix"""
+
+import contextlib
+import io
+import os
+import unittest
+
+import numpy as np
+
+from scraper.analyzers.keyword_analyzer import KeywordAnalyzer
+from scraper.analyzers.term_matrix import TermMatrix
+from scraper.models.keyword_config import KeywordConfig
+from scraper.models.match_result import MatchResult
+from tests.storage_case import StorageTestCase
+
+KEYWORDS = ["Java", "Spring", "Spring Boot", "SQL", "Docker", "Python", "java"]
+DESCRIPTIONS = [
+    "Java developer with Spring Boot and SQL. Java 17.",
+    "Python and Docker, some SQL",
+    "Spring, Spring Boot, spring batch",
+    None,
+    "Nothing relevant here",
+]
+
+
+class TestTermMatrix(StorageTestCase):
+    """Matrix scores equal per-job calculate_score for any weights"""
+
+    def setUp(self):
+        super().setUp()
+        self.config = KeywordConfig(KEYWORDS, weights={"Java": 10, "Spring Boot": 2.5})
+        for i, description in enumerate(DESCRIPTIONS):
+            self.save_job(3900000000 + i, description)
+        self.root = os.path.join(self.tmp.name, "term_matrix")
+
+    def save_job(self, job_id, description, config=None):
+        config = config or self.config
+        result = MatchResult(str(job_id))
+        result.description = description
+        if description:
+            result.keyword_matches = KeywordAnalyzer(config).analyze(description)
+        result.calculate_score(config)
+        self.storage.save_job_analysis(result)
+        return result
+
+    def expected(self, weights):
+        config = KeywordConfig(KEYWORDS, weights=dict(weights))
+        return {
+            str(3900000000 + i): self.save_job(3900000000 + i, description, config)
+            for i, description in enumerate(DESCRIPTIONS)
+        }
+
+    def test_scores_match_calculate_score(self):
+        """weighted_score, total_matches and match_percentage for new weights"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            matrix = TermMatrix.build(self.storage, self.config)
+        weights = {"Java": 3, "SQL": 0.5, "Docker": 7}
+        expected = self.expected(weights)
+
+        ranked = matrix.rank(weights)
+        self.assertEqual(len(ranked), len(DESCRIPTIONS))
+        for job in ranked:
+            result = expected[job['linkedin_job_id']]
+            self.assertAlmostEqual(job['weighted_score'], result.weighted_score)
+            self.assertEqual(job['total_matches'], result.total_matches)
+            self.assertAlmostEqual(job['match_percentage'], result.match_percentage)
+            self.assertEqual(job['matched_keywords'], result.matched_keywords)
+
+        scores = [job['weighted_score'] for job in ranked]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual([job['weighted_score'] for job in matrix.rank(weights, top_n=2)], scores[:2])
+
+    def test_saved_matrix_is_memory_mapped_and_refreshed(self):
+        """refresh reuses saved rows, adds new jobs and rebuilds on keyword changes"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            TermMatrix.refresh(self.storage, self.config, root=self.root)
+        loaded = TermMatrix.load(self.root)
+        self.assertIsInstance(loaded.counts, np.memmap)
+        self.assertEqual(len(loaded), len(DESCRIPTIONS))
+
+        self.save_job(3900000099, "Java Java Java Docker")
+        with contextlib.redirect_stdout(io.StringIO()):
+            refreshed = TermMatrix.refresh(self.storage, self.config, root=self.root)
+        self.assertEqual(len(refreshed), len(DESCRIPTIONS) + 1)
+        self.assertEqual(refreshed.rank(self.config.weights, top_n=1)[0]['linkedin_job_id'], "3900000099")
+
+        # A re-scraped description replaces the job's row instead of adding one
+        self.storage.update_job_post_details({"3900000004": {'description': "Docker Docker Python"}})
+        with contextlib.redirect_stdout(io.StringIO()):
+            updated = TermMatrix.refresh(self.storage, self.config, root=self.root)
+        self.assertEqual(len(updated), len(DESCRIPTIONS) + 1)
+        row = next(job for job in updated.rank({}) if job['linkedin_job_id'] == "3900000004")
+        self.assertEqual((row['total_matches'], row['matched_keywords']), (3, ["Docker", "Python"]))
+        self.assertEqual(TermMatrix.load(self.root).counts_seq, updated.counts_seq)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            other = TermMatrix.refresh(self.storage, KeywordConfig(["Docker"]), root=self.root)
+        self.assertEqual(other.columns, ["Docker"])
+        self.assertEqual(TermMatrix.load(self.root).columns, ["Docker"])
+
+
+if __name__ == '__main__':
+    unittest.main()
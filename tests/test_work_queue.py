@@ -0,0 +1,154 @@
+"""Tests for the durable detail work queue"""
+
+import contextlib
+import io
+import sqlite3
+import unittest
+from pathlib import Path
+
+import requests
+
+from scraper.core.detail_scraper import DetailScraper
+from scraper.core.keyword_matcher import KeywordMatcher
+from scraper.core.retry_policy import RetryPolicy
+from scraper.models.keyword_config import KeywordConfig
+from utils.work_queue import DetailWorkQueue
+from tests.storage_case import StorageTestCase
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+JOBS = [
+    {'linkedin_job_id': str(3900000000 + i), 'title': f"Developer {i}", 'company': "Acme"}
+    for i in range(5)
+]
+
+
+class ScriptedClient:
+    """Answers each job ID with its scripted statuses in turn, then 200 with the fixture page"""
+
+    route_count = 1
+
+    def __init__(self, script):
+        self.script = {job_id: list(statuses) for job_id, statuses in script.items()}
+        self.calls = []
+        self.page = (FIXTURES / "detail_page.html").read_bytes()
+
+    def get(self, url, profile=None):
+        job_id = url.rstrip('/').rsplit('/', 1)[-1]
+        self.calls.append(job_id)
+        statuses = self.script.get(job_id)
+        status = statuses.pop(0) if statuses else 200
+        response = requests.Response()
+        response.status_code = status
+        response._content = self.page if status == 200 else b""
+        return response
+
+
+class TestDetailWorkQueue(StorageTestCase):
+    """Test cases for claims, acks, retries and lease expiry"""
+
+    def test_claims_are_disjoint_and_enqueue_is_idempotent(self):
+        """Two workers never lease the same job; re-enqueueing adds nothing"""
+        queue = DetailWorkQueue(self.storage)
+        self.assertEqual(queue.enqueue(JOBS), 5)
+        self.assertEqual(queue.enqueue(JOBS), 0)
+
+        first = queue.claim("a", batch_size=3)
+        second = queue.claim("b", batch_size=3)
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 2)
+        ids = {job['linkedin_job_id'] for job in first + second}
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(queue.claim("c"), [])
+
+    def test_ack_and_nack(self):
+        """Acked jobs are done; nacked jobs retry until out of attempts"""
+        queue = DetailWorkQueue(self.storage, max_attempts=2, retry_delay=0)
+        queue.enqueue(JOBS[:2])
+
+        done, flaky = queue.claim("a")
+        self.assertTrue(queue.ack("a", done['linkedin_job_id']))
+        self.assertTrue(queue.nack("a", flaky['linkedin_job_id'], "timeout"))
+
+        retried = queue.claim("a")
+        self.assertEqual([job['linkedin_job_id'] for job in retried], [flaky['linkedin_job_id']])
+        self.assertEqual(retried[0]['attempts'], 2)
+        self.assertIs(queue.nack("a", flaky['linkedin_job_id'], "timeout"), False)
+
+        self.assertEqual(queue.get_stats(), {'pending': 0, 'leased': 0, 'done': 1, 'failed': 1})
+
+    def test_expired_lease_is_reclaimed(self):
+        """A crashed worker's jobs go to the next claimer, and its late ack is refused"""
+        crashed = DetailWorkQueue(self.storage, lease_seconds=-1)
+        crashed.enqueue(JOBS[:1])
+        job = crashed.claim("crashed")[0]
+
+        queue = DetailWorkQueue(self.storage)
+        reclaimed = queue.claim("b")
+
+        self.assertEqual(reclaimed[0]['linkedin_job_id'], job['linkedin_job_id'])
+        self.assertFalse(queue.ack("crashed", job['linkedin_job_id']))
+        self.assertTrue(queue.ack("b", job['linkedin_job_id']))
+
+
+class TestDrainQueue(StorageTestCase):
+    """KeywordMatcher.drain_queue against a scripted HTTP client"""
+
+    def test_acks_retries_and_records_final_failure(self):
+        """Fetched jobs are acked, failed ones nacked, and the last failed attempt is saved"""
+        ok, flaky, broken = (job['linkedin_job_id'] for job in JOBS[:3])
+        client = ScriptedClient({flaky: [503], broken: [503, 503]})
+        scraper = DetailScraper(http_client=client, archive=False, requests_per_second=1000,
+                                retry_policy=RetryPolicy(max_retries=0, breaker_threshold=100))
+        matcher = KeywordMatcher(self.storage, KeywordConfig(["Java"]), detail_scraper=scraper)
+        queue = DetailWorkQueue(self.storage, max_attempts=2, retry_delay=0)
+        queue.enqueue(JOBS[:3])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            processed = matcher.drain_queue(queue, "worker-1")
+
+        self.assertEqual(processed, 3)
+        self.assertEqual(queue.get_stats(), {'pending': 0, 'leased': 0, 'done': 2, 'failed': 1})
+        self.assertEqual(sorted(client.calls), sorted([ok, flaky, flaky, broken, broken]))
+        conn = sqlite3.connect(self.storage.db_file)
+        described = dict(conn.execute(
+            "SELECT linkedin_job_id, description IS NOT NULL FROM job_posts"
+        ).fetchall())
+        conn.close()
+        # The job out of attempts is saved as a failed analysis, so it is not picked up again
+        self.assertEqual(described, {ok: 1, flaky: 1, broken: 0})
+
+    def test_lost_lease_is_left_to_its_new_owner(self):
+        """A failed fetch whose lease another worker took over saves nothing and keeps that lease"""
+        slow = DetailWorkQueue(self.storage, lease_seconds=-1)
+        slow.enqueue(JOBS[:1])
+        job_id = JOBS[0]['linkedin_job_id']
+        other = DetailWorkQueue(self.storage)
+
+        class ReclaimedDetailScraper:
+            """Lets another owner reclaim each expired lease before reporting the fetch as failed"""
+
+            def scrape_stream(self, jobs, on_result):
+                for job in jobs:
+                    other.claim("worker-2")
+                    on_result(job, None)
+
+        matcher = KeywordMatcher(self.storage, KeywordConfig(["Java"]), detail_scraper=ReclaimedDetailScraper())
+        with contextlib.redirect_stdout(io.StringIO()):
+            processed = matcher.drain_queue(slow, "worker-1")
+
+        self.assertEqual(processed, 0)
+        self.assertIsNone(slow.nack("worker-1", job_id))
+        conn = sqlite3.connect(self.storage.db_file)
+        posts = conn.execute("SELECT COUNT(*) FROM job_posts").fetchone()[0]
+        lease = conn.execute("SELECT state, lease_owner FROM detail_queue WHERE linkedin_job_id = ?",
+                             (job_id,)).fetchone()
+        conn.close()
+        self.assertEqual(posts, 0)
+        self.assertEqual(lease, ('leased', "worker-2"))
+        self.assertTrue(other.ack("worker-2", job_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
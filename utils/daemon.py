@@ -0,0 +1,158 @@
+"""In-process scheduler loop with graceful shutdown and a health/status endpoint."""
+import json
+import logging
+import signal
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class ScraperDaemon:
+    """Runs a cycle function every `interval` seconds until SIGTERM/SIGINT.
+
+    A signal lets the running cycle finish its current step (the cycle
+    function can poll `stopping`) and then exits instead of killing the
+    process mid-write. GET /health answers 200 while the loop is alive and
+    the last cycle succeeded, 503 otherwise; GET /status returns the loop
+    state as JSON.
+    """
+
+    def __init__(self, cycle, interval, status_host='127.0.0.1', status_port=None,
+                 status_extra=None):
+        """
+        Initialize the daemon.
+
+        Args:
+            cycle: Callable run once per cycle; its return value (a dict) is
+                reported as the last cycle's summary
+            interval: Seconds between cycle starts
+            status_host: Interface for the status server
+            status_port: Port for the status server (None or 0 disables it)
+            status_extra: Callable returning extra fields for /status
+        """
+        self.cycle = cycle
+        self.interval = interval
+        self.status_extra = status_extra
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.status = {
+            'state': 'starting',
+            'started_at': _now(),
+            'cycles': 0,
+            'failures': 0,
+            'last_cycle_started': None,
+            'last_cycle_finished': None,
+            'last_cycle_elapsed': None,
+            'last_cycle_summary': None,
+            'last_error': None,
+            'next_cycle_at': None,
+        }
+        self._httpd = None
+        if status_port:
+            # Binding also keeps a second daemon from running against the same port
+            self._httpd = ThreadingHTTPServer((status_host, status_port), self._make_handler())
+            self._httpd.daemon_threads = True
+
+    @property
+    def stopping(self):
+        return self._stop.is_set()
+
+    def stop(self, *_):
+        """Ask the loop to exit after the current step."""
+        if not self._stop.is_set():
+            logging.getLogger().info("Shutdown requested, finishing current step...")
+        self._stop.set()
+        self._set(state='stopping')
+
+    def _set(self, **fields):
+        with self._lock:
+            self.status.update(fields)
+
+    def snapshot(self):
+        """Current status (plus status_extra fields)."""
+        with self._lock:
+            status = dict(self.status)
+        if self.status_extra:
+            status.update(self.status_extra())
+        return status
+
+    def healthy(self):
+        """True if the loop is running and the last cycle did not fail."""
+        status = self.snapshot()
+        return status['state'] in ('idle', 'running') and status['last_error'] is None
+
+    def run_forever(self):
+        """Install signal handlers, serve status and run cycles until stopped."""
+        logger = logging.getLogger()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        if self._httpd:
+            threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+            host, port = self._httpd.server_address[:2]
+            logger.info(f"Status server on http://{host}:{port}/status")
+
+        try:
+            while not self._stop.is_set():
+                started = time.monotonic()
+                self._run_cycle()
+                if self._stop.is_set():
+                    break
+                wait = max(0.0, self.interval - (time.monotonic() - started))
+                next_cycle = datetime.now(timezone.utc) + timedelta(seconds=wait)
+                self._set(state='idle', next_cycle_at=next_cycle.strftime('%Y-%m-%dT%H:%M:%SZ'))
+                self._stop.wait(wait)
+        finally:
+            if self._httpd:
+                self._httpd.shutdown()
+                self._httpd.server_close()
+            self._set(state='stopped')
+            logger.info("Daemon stopped")
+
+    def _run_cycle(self):
+        logger = logging.getLogger()
+        start = time.perf_counter()
+        self._set(state='running', last_cycle_started=_now(), next_cycle_at=None)
+        try:
+            summary = self.cycle()
+            self._set(last_error=None, last_cycle_summary=summary)
+        except Exception as e:
+            logger.exception("Daemon cycle failed")
+            with self._lock:
+                self.status['failures'] += 1
+                self.status['last_error'] = str(e)
+        with self._lock:
+            self.status['cycles'] += 1
+            self.status['last_cycle_finished'] = _now()
+            self.status['last_cycle_elapsed'] = round(time.perf_counter() - start, 2)
+
+    def _make_handler(self):
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/health':
+                    ok = daemon.healthy()
+                    status, body = (200 if ok else 503), {'ok': ok}
+                elif self.path == '/status':
+                    status, body = 200, daemon.snapshot()
+                else:
+                    status, body = 404, {'error': 'not found'}
+
+                payload = json.dumps(body, default=str).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
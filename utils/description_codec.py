@@ -0,0 +1,110 @@
+"""Compression of job descriptions with zlib and a dictionary trained on stored ones."""
+import re
+import struct
+import zlib
+from collections import Counter
+
+# Stored value: MAGIC + dict_id (uint32, 0 = no dictionary) + raw deflate stream
+MAGIC = b'\x00JDZ'
+_HEADER = struct.Struct('>I')
+# zlib only looks back 32 KiB, so a larger dictionary would never be referenced
+MAX_DICT_SIZE = 32 * 1024
+
+_PHRASE_SPLIT = re.compile(r'[.!?;:\n•·]+')
+
+
+def is_compressed(value):
+    """True if a stored description value is a compressed BLOB."""
+    return isinstance(value, (bytes, bytearray, memoryview)) and bytes(value[:len(MAGIC)]) == MAGIC
+
+
+def train_dictionary(samples, size=MAX_DICT_SIZE):
+    """
+    Build a zlib preset dictionary from sample descriptions.
+
+    Phrases and words that occur in more than one sample (boilerplate such as
+    benefits and equal-opportunity paragraphs, and the common vocabulary) are
+    scored by document frequency x length and packed best last, since zlib
+    encodes nearer matches more cheaply.
+
+    Args:
+        samples: Iterable of description strings
+        size: Dictionary size limit in bytes (at most 32 KiB)
+
+    Returns:
+        bytes (empty if the samples share nothing)
+    """
+    size = min(size, MAX_DICT_SIZE)
+    phrases = Counter()
+    words = Counter()
+    for text in samples:
+        if not text:
+            continue
+        phrases.update({phrase.strip() for phrase in _PHRASE_SPLIT.split(text) if len(phrase.strip()) > 12})
+        words.update(set(text.split()))
+
+    candidates = [(count * len(phrase), phrase) for phrase, count in phrases.items() if count > 1]
+    candidates += [(count * len(word), word) for word, count in words.items() if count > 1 and len(word) > 3]
+    candidates.sort(reverse=True)
+
+    chosen, used = [], 0
+    for _, text in candidates:
+        encoded = text.encode('utf-8') + b' '
+        if used + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        used += len(encoded)
+    return b''.join(reversed(chosen))
+
+
+class DescriptionCodec:
+    """Encodes descriptions with the newest dictionary and decodes any stored value.
+
+    Plain text values (rows written before compression) pass through
+    decode unchanged, so compressed and uncompressed rows can coexist.
+    """
+
+    def __init__(self, dictionaries=None, level=9):
+        """
+        Initialize the codec.
+
+        Args:
+            dictionaries: {dict_id: zdict bytes}; the highest id is used for encoding
+            level: zlib compression level
+        """
+        self.dictionaries = dict(dictionaries or {})
+        self.current_id = max(self.dictionaries, default=0)
+        self.level = level
+
+    def encode(self, text):
+        """
+        Compress a description.
+
+        Returns:
+            bytes, or the value unchanged if it is None or empty
+        """
+        if not text:
+            return text
+        zdict = self.dictionaries.get(self.current_id)
+        compressor = (zlib.compressobj(self.level, zlib.DEFLATED, -15, zdict=zdict) if zdict
+                      else zlib.compressobj(self.level, zlib.DEFLATED, -15))
+        data = compressor.compress(text.encode('utf-8')) + compressor.flush()
+        return MAGIC + _HEADER.pack(self.current_id if zdict else 0) + data
+
+    def decode(self, value):
+        """
+        Return the text of a stored description value.
+
+        Raises:
+            KeyError: If the value was compressed with a dictionary this codec doesn't have
+        """
+        if not is_compressed(value):
+            return value
+        value = bytes(value)
+        dict_id, = _HEADER.unpack_from(value, len(MAGIC))
+        payload = value[len(MAGIC) + _HEADER.size:]
+        if dict_id:
+            decompressor = zlib.decompressobj(-15, zdict=self.dictionaries[dict_id])
+        else:
+            decompressor = zlib.decompressobj(-15)
+        return (decompressor.decompress(payload) + decompressor.flush()).decode('utf-8')
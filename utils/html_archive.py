@@ -0,0 +1,151 @@
+"""Content-addressed, compressed archive of raw fetched pages."""
+import hashlib
+import os
+import sqlite3
+import zlib
+from pathlib import Path
+from datetime import datetime, timezone
+
+
+class HtmlArchive:
+    """Stores raw responses once per distinct body, indexed by URL and fetch time.
+
+    Bodies live under objects/<sha[:2]>/<sha>.z (zlib-compressed); the index
+    is a small SQLite database next to them so the archive can be copied or
+    deleted independently of jobs_master.db.
+    """
+
+    def __init__(self, root=None, compression_level=6):
+        if root is None:
+            project_root = Path(__file__).resolve().parent.parent
+            root = project_root / 'data' / 'archive'
+
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.root / 'index.db'
+        self.compression_level = compression_level
+        self._ensure_index_exists()
+
+    def _ensure_index_exists(self):
+        """Create the index database if it doesn't exist."""
+        conn = sqlite3.connect(self.index_file)
+        cursor = conn.cursor()
+
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS fetches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            fetched_at TIMESTAMP NOT NULL,
+            sha256 TEXT NOT NULL,
+            size INTEGER,
+            compressed_size INTEGER
+        )
+        """)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_fetches_url_time
+        ON fetches(url, fetched_at DESC)
+        """)
+
+        conn.commit()
+        conn.close()
+
+    def _object_path(self, sha256):
+        return self.objects_dir / sha256[:2] / f"{sha256}.z"
+
+    def store(self, kind, url, content, fetched_at=None):
+        """
+        Archive one raw response.
+
+        Args:
+            kind: 'search' or 'detail'
+            url: URL the content was fetched from
+            content: Raw response body (bytes)
+            fetched_at: ISO timestamp (default: now, UTC)
+
+        Returns:
+            str: sha256 of the content
+        """
+        sha256 = hashlib.sha256(content).hexdigest()
+        path = self._object_path(sha256)
+        compressed_size = None
+
+        if not path.exists():
+            compressed = zlib.compress(content, self.compression_level)
+            compressed_size = len(compressed)
+            path.parent.mkdir(exist_ok=True)
+            # Write-then-rename so concurrent writers never expose a partial blob
+            tmp_path = path.with_suffix(f".{os.getpid()}.{id(content)}.tmp")
+            tmp_path.write_bytes(compressed)
+            os.replace(tmp_path, path)
+
+        if fetched_at is None:
+            fetched_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        conn = sqlite3.connect(self.index_file, timeout=30)
+        conn.execute(
+            "INSERT INTO fetches (url, kind, fetched_at, sha256, size, compressed_size) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (url, kind, fetched_at, sha256, len(content), compressed_size)
+        )
+        conn.commit()
+        conn.close()
+        return sha256
+
+    def load(self, sha256):
+        """Return the raw content for a sha256."""
+        return zlib.decompress(self._object_path(sha256).read_bytes())
+
+    def get_latest_fetches(self, kind=None):
+        """
+        Get the most recent fetch of every archived URL.
+
+        Args:
+            kind: Only return fetches of this kind ('search' or 'detail')
+
+        Returns:
+            list[dict]: {url, kind, fetched_at, sha256}
+        """
+        conn = sqlite3.connect(self.index_file)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        query = """
+            SELECT url, kind, MAX(fetched_at) AS fetched_at, sha256
+            FROM fetches
+        """
+        params = []
+        if kind:
+            query += " WHERE kind = ?"
+            params.append(kind)
+        query += " GROUP BY url ORDER BY fetched_at ASC"
+
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+    def get_stats(self):
+        """Get fetch counts and on-disk size of the archive."""
+        conn = sqlite3.connect(self.index_file)
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT COUNT(*), COUNT(DISTINCT sha256), COALESCE(SUM(compressed_size), 0)
+            FROM fetches
+        """)
+        fetches, blobs, stored_bytes = cursor.fetchone()
+        cursor.execute("""
+            SELECT COALESCE(SUM(size), 0) FROM (
+                SELECT size FROM fetches GROUP BY sha256
+            )
+        """)
+        raw_bytes = cursor.fetchone()[0]
+        conn.close()
+
+        return {
+            'fetches': fetches,
+            'blobs': blobs,
+            'raw_bytes': raw_bytes,
+            'stored_bytes': stored_bytes,
+        }
@@ -1,13 +1,29 @@
 """SQLite storage for job search results with duplicate prevention."""
+import json
 import sqlite3
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
 
+from config.settings import DESCRIPTION_COMPRESSION, DESCRIPTION_DICT_SIZE, DESCRIPTION_DICT_SAMPLE
+from utils.description_codec import DescriptionCodec, is_compressed, train_dictionary
+
 LINKEDIN_JOB_BASE_URL = "https://www.linkedin.com/jobs/view/"
 
 
 class SQLiteStorage:
-    def __init__(self, db_file=None):
+    # Next value of job_posts.counts_seq, the change watermark of stored keyword counts
+    _NEXT_COUNTS_SEQ = "(SELECT COALESCE(MAX(counts_seq), 0) + 1 FROM job_posts)"
+
+    def __init__(self, db_file=None, persistent=False):
+        """
+        Open the database, creating tables if needed.
+
+        Args:
+            db_file: SQLite database path (default: data/database/jobs_master.db)
+            persistent: Keep one open connection per thread instead of
+                connecting in every call (for long-running processes)
+        """
         if db_file is None:
             project_root = Path(__file__).resolve().parent.parent
             data_folder = project_root / 'data' / 'database'
@@ -15,12 +31,44 @@ class SQLiteStorage:
             db_file = data_folder / 'jobs_master.db'
 
         self.db_file = Path(db_file)
+        self.persistent = persistent
+        self._local = threading.local()
         self._ensure_db_exists()
+        self._load_codec()
+
+    def _connect(self):
+        """Get a connection (the calling thread's open one when persistent)."""
+        if not self.persistent:
+            return sqlite3.connect(self.db_file)
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file)
+            self._local.conn = conn
+        elif conn.in_transaction:
+            # A previous call failed before committing
+            conn.rollback()
+        conn.row_factory = None
+        return conn
+
+    def _release(self, conn):
+        """Close a connection from _connect (persistent ones stay open)."""
+        if not self.persistent:
+            conn.close()
+
+    def close(self):
+        """Close the calling thread's persistent connection, if any."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
     def _ensure_db_exists(self):
         """Create SQLite database and tables if they don't exist."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
+        # One transaction, so processes starting together don't race on the view rebuilds
+        cursor.execute("BEGIN IMMEDIATE")
 
         # Table 1: Search results (linkedin_job_id is NOT unique)
         cursor.execute("""
@@ -65,6 +113,118 @@ class SQLiteStorage:
         )
         """)
 
+        # Table 4: Per-search watermark of the newest posting seen (incremental sync)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS search_watermarks (
+            search_key TEXT PRIMARY KEY,
+            search_keywords TEXT,
+            search_location TEXT,
+            newest_job_id INTEGER,
+            newest_posted_date TEXT,
+            updated_at TIMESTAMP
+        )
+        """)
+
+        # Table 5: Adaptive polling state per distinct search query
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS search_schedule (
+            schedule_key TEXT PRIMARY KEY,
+            template_names TEXT,
+            interval_minutes REAL,
+            last_run_at TIMESTAMP,
+            next_run_at TIMESTAMP,
+            last_new_jobs INTEGER,
+            runs INTEGER DEFAULT 0,
+            total_new_jobs INTEGER DEFAULT 0
+        )
+        """)
+
+        # Table 6: New-job yield of every scheduled search run
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS search_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            schedule_key TEXT NOT NULL,
+            template_names TEXT,
+            run_at TIMESTAMP,
+            new_jobs INTEGER,
+            elapsed REAL,
+            error TEXT,
+            interval_minutes REAL
+        )
+        """)
+
+        # Table 7: Keyword/weight configurations scores were computed for
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS keyword_profiles (
+            profile_hash TEXT PRIMARY KEY,
+            keywords_hash TEXT NOT NULL,
+            weights_hash TEXT NOT NULL,
+            keywords TEXT NOT NULL,
+            weights TEXT NOT NULL,
+            case_sensitive INTEGER NOT NULL,
+            created_at TIMESTAMP
+        )
+        """)
+
+        # Table 8: Non-zero keyword counts per job (a term is a lowercased keyword unless case-sensitive)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS job_keyword_counts (
+            linkedin_job_id TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            case_sensitive INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (linkedin_job_id, keyword, case_sensitive)
+        ) WITHOUT ROWID
+        """)
+
+        # Table 9: Description fingerprints and repost clusters (near-duplicate detection)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS job_fingerprints (
+            linkedin_job_id TEXT PRIMARY KEY,
+            title_key TEXT,
+            minhash BLOB,
+            cluster_id TEXT NOT NULL,
+            inherited_from TEXT
+        )
+        """)
+
+        # Table 10: Trained zlib dictionaries for compressed descriptions (never deleted)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS compression_dicts (
+            dict_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            zdict BLOB NOT NULL,
+            sample_size INTEGER,
+            created_at TIMESTAMP
+        )
+        """)
+
+        # Jobs the prefetch filter dropped, so each drop is reported once
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS prefetch_drops (
+            linkedin_job_id TEXT PRIMARY KEY,
+            reason TEXT,
+            dropped_at TIMESTAMP
+        )
+        """)
+
+        # Columns added after the initial schema
+        self._ensure_column(cursor, 'job_searches', 'posted_date', 'TEXT')
+        if self._ensure_column(cursor, 'job_searches', 'searched_at', 'TIMESTAMP'):
+            # Rows from before searched_at existed count as first seen now, so fetch priority aging still reaches them
+            cursor.execute(
+                "UPDATE job_searches SET searched_at = ? WHERE searched_at IS NULL",
+                (datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),)
+            )
+        # Terms counted in job_keyword_counts / profile the stored scores were computed for
+        self._ensure_column(cursor, 'job_posts', 'keywords_hash', 'TEXT')
+        self._ensure_column(cursor, 'job_posts', 'profile_hash', 'TEXT')
+        # Bumped whenever a job's keyword counts are (re)written: the term matrix refresh watermark
+        if self._ensure_column(cursor, 'job_posts', 'counts_seq', 'INTEGER'):
+            cursor.execute("UPDATE job_posts SET counts_seq = rowid WHERE counts_seq IS NULL")
+        # Bumped on every fingerprint write, so work processes load only the ones added since
+        if self._ensure_column(cursor, 'job_fingerprints', 'seq', 'INTEGER'):
+            cursor.execute("UPDATE job_fingerprints SET seq = rowid WHERE seq IS NULL")
+
         # Indexes
         cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_job_searches_linkedin_id
@@ -78,6 +238,14 @@ class SQLiteStorage:
         CREATE INDEX IF NOT EXISTS idx_job_posts_datetime
         ON job_posts(date_time DESC)
         """)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_job_posts_counts_seq
+        ON job_posts(counts_seq)
+        """)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_job_fingerprints_cluster
+        ON job_fingerprints(cluster_id)
+        """)
 
         # View: combined job data for display
         cursor.execute("DROP VIEW IF EXISTS job_summary")
@@ -100,7 +268,7 @@ class SQLiteStorage:
         ORDER BY jp.weighted_score DESC
         """)
 
-        # Deduplicated view: max 2 per (title, company)
+        # Deduplicated view: one posting per repost cluster, max 2 per (title, company)
         cursor.execute("DROP VIEW IF EXISTS job_summary_unique")
         cursor.execute("""
         CREATE VIEW job_summary_unique AS
@@ -115,32 +283,80 @@ class SQLiteStorage:
                         CASE WHEN applicant_count IS NULL THEN 1 ELSE 0 END,
                         applicant_count ASC
                 ) as row_num
-            FROM job_summary
+            FROM (
+                SELECT s.*,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY COALESCE(fp.cluster_id, s.linkedin_job_id)
+                        ORDER BY
+                            CASE WHEN s.applicant_count IS NULL THEN 1 ELSE 0 END,
+                            s.applicant_count ASC
+                    ) as cluster_row
+                FROM job_summary s
+                LEFT JOIN job_fingerprints fp ON fp.linkedin_job_id = s.linkedin_job_id
+            )
+            WHERE cluster_row = 1
         )
         WHERE row_num <= 2
         ORDER BY weighted_score DESC
         """)
 
         conn.commit()
-        conn.close()
+        self._release(conn)
         print(f"✅ SQLite database ready at: {self.db_file}")
 
+    def _load_codec(self):
+        """(Re)load the description codec with every stored dictionary."""
+        conn = self._connect()
+        rows = conn.execute("SELECT dict_id, zdict FROM compression_dicts").fetchall()
+        self._release(conn)
+        self.codec = DescriptionCodec(dict(rows))
+
+    def _encode_description(self, description):
+        """Stored form of a description (compressed if DESCRIPTION_COMPRESSION)."""
+        return self.codec.encode(description) if DESCRIPTION_COMPRESSION else description
+
+    def _decode_description(self, value):
+        """Text of a stored description, compressed or not."""
+        try:
+            return self.codec.decode(value)
+        except KeyError:
+            # Compressed with a dictionary another process trained since we loaded ours
+            self._load_codec()
+            return self.codec.decode(value)
+
+    @staticmethod
+    def _ensure_column(cursor, table, column, declaration):
+        """
+        Add a column to an existing table if it is missing.
+
+        Returns:
+            bool: True if the column was added (backfills of existing rows run only then)
+        """
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column in {row[1] for row in cursor.fetchall()}:
+            return False
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+        return True
+
     def append_jobs(self, jobs, search_config):
         """Insert search results into job_searches table."""
         if not jobs:
             print("No jobs to append to SQLite database")
             return
 
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
 
+        searched_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
         added = 0
         for job in jobs:
             cursor.execute("""
             INSERT INTO job_searches (
                 linkedin_job_id, title, company, location, company_url,
-                search_keywords, search_location, search_experience, search_remote
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                search_keywords, search_location, search_experience, search_remote,
+                posted_date, searched_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 job.linkedin_job_id,
                 job.title,
@@ -150,29 +366,178 @@ class SQLiteStorage:
                 search_config.keywords,
                 search_config.location,
                 ','.join(map(str, search_config.experience_levels)) if search_config.experience_levels else '',
-                'Yes' if search_config.remote else 'No'
+                'Yes' if search_config.remote else 'No',
+                getattr(job, 'posted_date', None),
+                searched_at,
             ))
             added += 1
 
         conn.commit()
-        conn.close()
+        self._release(conn)
 
         print(f"✅ Added {added} search results to SQLite database")
 
+    def get_search_watermark(self, search_key):
+        """
+        Get the newest posting seen by a search.
+
+        Returns:
+            dict with newest_job_id and newest_posted_date, or None if never synced
+        """
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT * FROM search_watermarks WHERE search_key = ?",
+            (search_key,)
+        )
+        row = cursor.fetchone()
+        self._release(conn)
+        return dict(row) if row else None
+
+    def update_search_watermark(self, search_key, search_config, newest_job_id, newest_posted_date):
+        """Move a search's watermark forward (it never moves backwards)."""
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            INSERT INTO search_watermarks (
+                search_key, search_keywords, search_location,
+                newest_job_id, newest_posted_date, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(search_key) DO UPDATE SET
+                newest_job_id = MAX(COALESCE(newest_job_id, 0), COALESCE(excluded.newest_job_id, 0)),
+                newest_posted_date = NULLIF(MAX(COALESCE(newest_posted_date, ''), COALESCE(excluded.newest_posted_date, '')), ''),
+                updated_at = excluded.updated_at
+        """, (
+            search_key,
+            search_config.keywords,
+            search_config.location,
+            newest_job_id,
+            newest_posted_date,
+            datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        ))
+
+        conn.commit()
+        self._release(conn)
+
+    def get_search_schedule(self):
+        """
+        Get the polling state of every scheduled search.
+
+        Returns:
+            dict {schedule_key: row dict}
+        """
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM search_schedule")
+        schedule = {row['schedule_key']: dict(row) for row in cursor.fetchall()}
+        self._release(conn)
+        return schedule
+
+    def record_search_run(self, schedule_key, template_names, run_at, new_jobs, elapsed,
+                          error, interval_minutes, next_run_at):
+        """Log a search run's yield and store the search's next polling interval."""
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            INSERT INTO search_runs (
+                schedule_key, template_names, run_at, new_jobs, elapsed, error, interval_minutes
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (schedule_key, template_names, run_at, new_jobs, elapsed, error, interval_minutes))
+
+        cursor.execute("""
+            INSERT INTO search_schedule (
+                schedule_key, template_names, interval_minutes, last_run_at, next_run_at,
+                last_new_jobs, runs, total_new_jobs
+            ) VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+            ON CONFLICT(schedule_key) DO UPDATE SET
+                template_names = excluded.template_names,
+                interval_minutes = excluded.interval_minutes,
+                last_run_at = excluded.last_run_at,
+                next_run_at = excluded.next_run_at,
+                last_new_jobs = excluded.last_new_jobs,
+                runs = runs + 1,
+                total_new_jobs = total_new_jobs + excluded.total_new_jobs
+        """, (
+            schedule_key, template_names, interval_minutes, run_at, next_run_at,
+            new_jobs, new_jobs,
+        ))
+
+        conn.commit()
+        self._release(conn)
+
+    def get_known_job_ids(self):
+        """Get every distinct numeric linkedin_job_id in job_searches (as ints)."""
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT DISTINCT CAST(linkedin_job_id AS INTEGER)
+            FROM job_searches
+            WHERE linkedin_job_id GLOB '[0-9]*'
+        """)
+        job_ids = [row[0] for row in cursor.fetchall()]
+        self._release(conn)
+        return job_ids
+
+    def get_analyzed_job_ids(self):
+        """Get every numeric linkedin_job_id in job_posts (as ints)."""
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT CAST(linkedin_job_id AS INTEGER)
+            FROM job_posts
+            WHERE linkedin_job_id GLOB '[0-9]*'
+        """)
+        job_ids = [row[0] for row in cursor.fetchall()]
+        self._release(conn)
+        return job_ids
+
+    def get_job_cards(self, job_ids):
+        """
+        Get title, company and applicant count of analyzed jobs.
+
+        Args:
+            job_ids: Iterable of linkedin_job_ids
+
+        Returns:
+            dict: {linkedin_job_id (str): dict}
+        """
+        job_ids = [str(job_id) for job_id in job_ids]
+        if not job_ids:
+            return {}
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        placeholders = ','.join('?' * len(job_ids))
+        cursor.execute(f"""
+            SELECT jp.linkedin_job_id, js.title, js.company, jp.applicant_count
+            FROM job_posts jp
+            LEFT JOIN job_searches js ON js.linkedin_job_id = jp.linkedin_job_id
+            WHERE jp.linkedin_job_id IN ({placeholders})
+            GROUP BY jp.linkedin_job_id
+        """, job_ids)
+        cards = {row['linkedin_job_id']: dict(row) for row in cursor.fetchall()}
+        self._release(conn)
+        return cards
+
     def get_total_jobs(self):
         """Get total number of unique linkedin_job_ids in searches."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute("SELECT COUNT(DISTINCT linkedin_job_id) FROM job_searches")
         total = cursor.fetchone()[0]
 
-        conn.close()
+        self._release(conn)
         return total
 
     def get_stats(self):
         """Get statistics about stored jobs."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute("SELECT COUNT(DISTINCT linkedin_job_id) FROM job_searches")
@@ -184,7 +549,7 @@ class SQLiteStorage:
         cursor.execute("SELECT COUNT(DISTINCT location) FROM job_searches")
         unique_locations = cursor.fetchone()[0]
 
-        conn.close()
+        self._release(conn)
         return {
             'total_jobs': total_jobs,
             'unique_companies': unique_companies,
@@ -197,13 +562,28 @@ class SQLiteStorage:
         Get distinct linkedin_job_ids that haven't been analyzed yet.
         Returns max 2 per (title, company) pair to avoid analyzing excessive duplicates.
         """
-        conn = sqlite3.connect(self.db_file)
+        return self.get_jobs_for_analysis(include_analyzed=False)
+
+    def get_jobs_for_analysis(self, include_analyzed=False):
+        """
+        Get distinct linkedin_job_ids to analyze, max 2 per (title, company) pair.
+
+        Args:
+            include_analyzed: Also return jobs already in job_posts (re-analysis)
+
+        Returns:
+            list[dict] with linkedin_job_id, title, company, location,
+            searched_at (first time the job was seen) and blacklisted
+            (company is in blacklisted_companies), ordered by job ID
+        """
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
-        cursor.execute("""
+        cursor.execute(f"""
             WITH unique_jobs AS (
-                SELECT linkedin_job_id, title, company,
+                SELECT linkedin_job_id, title, company, location,
+                    MIN(searched_at) AS searched_at,
                     ROW_NUMBER() OVER (
                         PARTITION BY title, company
                         ORDER BY id ASC
@@ -211,34 +591,49 @@ class SQLiteStorage:
                 FROM job_searches
                 GROUP BY linkedin_job_id
             )
-            SELECT uj.linkedin_job_id, uj.title, uj.company
+            SELECT uj.linkedin_job_id, uj.title, uj.company, uj.location, uj.searched_at,
+                bc.company IS NOT NULL AS blacklisted
             FROM unique_jobs uj
             LEFT JOIN job_posts jp ON uj.linkedin_job_id = jp.linkedin_job_id
+            LEFT JOIN blacklisted_companies bc ON bc.company = uj.company
             WHERE uj.row_num <= 2
-              AND jp.linkedin_job_id IS NULL
+              {"" if include_analyzed else "AND jp.linkedin_job_id IS NULL"}
             ORDER BY uj.linkedin_job_id ASC
         """)
 
         rows = cursor.fetchall()
-        conn.close()
+        self._release(conn)
         return [dict(row) for row in rows]
 
-    def save_job_analysis(self, match_result):
-        """Save or update job post analysis results."""
-        conn = sqlite3.connect(self.db_file)
+    def save_job_analysis(self, match_result, keyword_config=None):
+        """
+        Save or update job post analysis results.
+
+        Args:
+            match_result: Analyzed MatchResult
+            keyword_config: KeywordConfig the result was computed with; when
+                given, its keyword counts are stored too, so later keyword or
+                weight changes can be applied without re-scanning the description
+        """
+        conn = self._connect()
         cursor = conn.cursor()
 
         matched_keywords_str = ','.join(match_result.matched_keywords)
+        keywords_hash = profile_hash = None
+        if keyword_config is not None:
+            keywords_hash = keyword_config.keywords_hash
+            profile_hash = keyword_config.profile_hash
 
-        cursor.execute("""
+        cursor.execute(f"""
             INSERT OR REPLACE INTO job_posts (
                 linkedin_job_id, description, applicant_count, date_time,
                 total_matches, weighted_score, matched_keywords, match_percentage,
-                employment_type, job_function, seniority_level, industries
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                employment_type, job_function, seniority_level, industries,
+                keywords_hash, profile_hash, counts_seq
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {self._NEXT_COUNTS_SEQ})
         """, (
             match_result.linkedin_job_id,
-            match_result.description,
+            self._encode_description(match_result.description),
             match_result.applicant_count,
             match_result.date_time,
             match_result.total_matches,
@@ -249,22 +644,562 @@ class SQLiteStorage:
             match_result.job_function,
             match_result.seniority_level,
             match_result.industries,
+            keywords_hash,
+            profile_hash,
         ))
 
+        cursor.execute(
+            "DELETE FROM job_keyword_counts WHERE linkedin_job_id = ?",
+            (match_result.linkedin_job_id,)
+        )
+        if keyword_config is not None:
+            counts = {}
+            for keyword, count in match_result.keyword_matches.items():
+                counts[keyword_config.term(keyword)] = count
+            self._insert_keyword_counts(cursor, match_result.linkedin_job_id, counts,
+                                        keyword_config.case_sensitive)
+
+        conn.commit()
+        self._release(conn)
+
+    @staticmethod
+    def _insert_keyword_counts(cursor, job_id, counts, case_sensitive):
+        cursor.executemany("""
+            INSERT OR REPLACE INTO job_keyword_counts (linkedin_job_id, keyword, case_sensitive, count)
+            VALUES (?, ?, ?, ?)
+        """, [
+            (job_id, term, int(case_sensitive), count)
+            for term, count in counts.items() if count
+        ])
+
+    def save_keyword_profile(self, keyword_config):
+        """Record a keyword/weight configuration in keyword_profiles (once)."""
+        conn = self._connect()
+        conn.execute("""
+            INSERT OR IGNORE INTO keyword_profiles (
+                profile_hash, keywords_hash, weights_hash, keywords, weights, case_sensitive, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            keyword_config.profile_hash,
+            keyword_config.keywords_hash,
+            keyword_config.weights_hash,
+            json.dumps(keyword_config.keywords, ensure_ascii=False),
+            json.dumps({kw: keyword_config.weights[kw] for kw in keyword_config.keywords}, ensure_ascii=False),
+            int(keyword_config.case_sensitive),
+            datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        ))
         conn.commit()
-        conn.close()
+        self._release(conn)
+
+    def get_keyword_profile_terms(self):
+        """
+        Match terms covered by each recorded keywords_hash.
+
+        Returns:
+            dict: {keywords_hash: (set of terms, case_sensitive)}
+        """
+        conn = self._connect()
+        rows = conn.execute("SELECT keywords_hash, keywords, case_sensitive FROM keyword_profiles").fetchall()
+        self._release(conn)
+        terms = {}
+        for keywords_hash, keywords, case_sensitive in rows:
+            keywords = json.loads(keywords)
+            terms[keywords_hash] = (
+                {kw if case_sensitive else kw.lower() for kw in keywords},
+                bool(case_sensitive),
+            )
+        return terms
+
+    def count_stale_job_posts(self, keyword_config):
+        """
+        Count job posts whose counts or scores lag behind a keyword config.
+
+        Returns:
+            tuple: (jobs missing counts for some keyword, jobs with outdated scores)
+        """
+        conn = self._connect()
+        row = conn.execute("""
+            SELECT
+                SUM(keywords_hash IS NOT ?),
+                SUM(profile_hash IS NOT ?)
+            FROM job_posts
+        """, (keyword_config.keywords_hash, keyword_config.profile_hash)).fetchone()
+        self._release(conn)
+        return row[0] or 0, row[1] or 0
+
+    def iter_jobs_missing_counts(self, keywords_hash, batch_size=500):
+        """
+        Stream job posts whose keyword counts do not cover keywords_hash.
+
+        Yields:
+            list[tuple[str, str or None, str or None]]: (linkedin_job_id, description,
+            keywords_hash the stored counts cover)
+        """
+        last_id = ''
+        while True:
+            conn = self._connect()
+            rows = conn.execute("""
+                SELECT linkedin_job_id, description, keywords_hash
+                FROM job_posts
+                WHERE linkedin_job_id > ? AND keywords_hash IS NOT ?
+                ORDER BY linkedin_job_id
+                LIMIT ?
+            """, (last_id, keywords_hash, batch_size)).fetchall()
+            self._release(conn)
+            if not rows:
+                return
+            yield [(job_id, self._decode_description(description), job_hash)
+                   for job_id, description, job_hash in rows]
+            last_id = rows[-1][0]
+
+    def save_keyword_counts(self, counted, case_sensitive, keywords_hash):
+        """
+        Store newly counted terms of job posts in one transaction.
+
+        Args:
+            counted: Iterable of (linkedin_job_id, terms counted, {term: count})
+            case_sensitive: Whether the counts are case-sensitive
+            keywords_hash: Term set the jobs' counts now cover
+
+        Returns:
+            int: Number of job posts updated
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        jobs = 0
+        for job_id, terms, counts in counted:
+            cursor.executemany(
+                "DELETE FROM job_keyword_counts WHERE linkedin_job_id = ? AND keyword = ? AND case_sensitive = ?",
+                [(job_id, term, int(case_sensitive)) for term in terms]
+            )
+            self._insert_keyword_counts(cursor, job_id, counts, case_sensitive)
+            cursor.execute(f"""
+                UPDATE job_posts SET keywords_hash = ?, counts_seq = {self._NEXT_COUNTS_SEQ}
+                WHERE linkedin_job_id = ?
+            """, (keywords_hash, job_id))
+            jobs += 1
+
+        conn.commit()
+        self._release(conn)
+        return jobs
+
+    def iter_job_keyword_counts(self, keyword_config, batch_size=500):
+        """
+        Stream stored counts of job posts whose scores are outdated for keyword_config.
+
+        Only jobs whose counts cover the config's terms are returned.
+
+        Yields:
+            list[tuple[str, dict]]: (linkedin_job_id, {term: count}) with every term present
+        """
+        terms = keyword_config.terms()
+        case_sensitive = int(keyword_config.case_sensitive)
+        last_id = ''
+        while True:
+            conn = self._connect()
+            job_ids = [row[0] for row in conn.execute("""
+                SELECT linkedin_job_id FROM job_posts
+                WHERE linkedin_job_id > ? AND keywords_hash = ? AND profile_hash IS NOT ?
+                ORDER BY linkedin_job_id
+                LIMIT ?
+            """, (last_id, keyword_config.keywords_hash, keyword_config.profile_hash, batch_size))]
+            if not job_ids:
+                self._release(conn)
+                return
+
+            counts = self._load_term_counts(conn, job_ids, terms, case_sensitive)
+            self._release(conn)
+
+            yield list(counts.items())
+            last_id = job_ids[-1]
+
+    @staticmethod
+    def _load_term_counts(conn, job_ids, terms, case_sensitive):
+        """Stored counts of terms for job_ids, as {job_id: {term: count}} with every term present."""
+        counts = {job_id: dict.fromkeys(terms, 0) for job_id in job_ids}
+        placeholders = ','.join('?' * len(job_ids))
+        rows = conn.execute(f"""
+            SELECT linkedin_job_id, keyword, count FROM job_keyword_counts
+            WHERE linkedin_job_id IN ({placeholders}) AND case_sensitive = ?
+        """, (*job_ids, case_sensitive)).fetchall()
+        for job_id, term, count in rows:
+            if term in counts[job_id]:
+                counts[job_id][term] = count
+        return counts
+
+    def iter_changed_keyword_counts(self, keyword_config, after_seq=0, batch_size=500):
+        """
+        Stream stored counts of numeric job posts whose counts changed after a watermark.
+
+        Only jobs whose counts cover the config's terms are returned, in
+        counts_seq order, so the last seq of a batch is a valid watermark.
+
+        Args:
+            keyword_config: KeywordConfig whose terms to return
+            after_seq: counts_seq already seen (0 = everything)
+            batch_size: Jobs per batch
+
+        Yields:
+            tuple[list[tuple[int, dict]], int]: ((job_id, {term: count}) pairs, highest counts_seq in the batch)
+        """
+        terms = keyword_config.terms()
+        case_sensitive = int(keyword_config.case_sensitive)
+        last_seq = after_seq
+        while True:
+            conn = self._connect()
+            rows = conn.execute("""
+                SELECT linkedin_job_id, counts_seq FROM job_posts
+                WHERE counts_seq > ? AND keywords_hash = ? AND linkedin_job_id GLOB '[0-9]*'
+                ORDER BY counts_seq
+                LIMIT ?
+            """, (last_seq, keyword_config.keywords_hash, batch_size)).fetchall()
+            if not rows:
+                self._release(conn)
+                return
+
+            job_ids = [job_id for job_id, _ in rows]
+            counts = self._load_term_counts(conn, job_ids, terms, case_sensitive)
+            self._release(conn)
+
+            last_seq = rows[-1][1]
+            yield [(int(job_id), term_counts) for job_id, term_counts in counts.items()], last_seq
+
+    def reset_keyword_counts(self):
+        """Forget all stored keyword counts (the next rescore recounts everything)."""
+        conn = self._connect()
+        conn.execute("DELETE FROM job_keyword_counts")
+        conn.execute("UPDATE job_posts SET keywords_hash = NULL, profile_hash = NULL")
+        conn.commit()
+        self._release(conn)
+
+    def get_fingerprints(self, after_seq=0):
+        """
+        Get stored description fingerprints, in the order they were written.
+
+        Args:
+            after_seq: Only return fingerprints written after this seq (0 = all)
+
+        Returns:
+            list[tuple]: (seq, linkedin_job_id, title_key, minhash bytes or None, cluster_id)
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT seq, linkedin_job_id, title_key, minhash, cluster_id
+            FROM job_fingerprints
+            WHERE seq > ?
+            ORDER BY seq
+        """, (after_seq,))
+        rows = cursor.fetchall()
+        self._release(conn)
+        return rows
+
+    def get_unfingerprinted_posts(self):
+        """
+        Get analyzed job posts without a fingerprint, oldest job ID first.
+
+        Returns:
+            list[tuple]: (linkedin_job_id, title, company, description)
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT jp.linkedin_job_id, js.title, js.company, jp.description
+            FROM job_posts jp
+            LEFT JOIN job_fingerprints fp ON fp.linkedin_job_id = jp.linkedin_job_id
+            LEFT JOIN job_searches js ON js.linkedin_job_id = jp.linkedin_job_id
+            WHERE fp.linkedin_job_id IS NULL
+            GROUP BY jp.linkedin_job_id
+            ORDER BY CAST(jp.linkedin_job_id AS INTEGER)
+        """)
+        rows = [
+            (job_id, title, company, self._decode_description(description))
+            for job_id, title, company, description in cursor.fetchall()
+        ]
+        self._release(conn)
+        return rows
+
+    def save_fingerprint(self, job_id, title_key, minhash, cluster_id, inherited_from=None):
+        """
+        Save or replace the fingerprint of a job post.
+
+        Args:
+            job_id: linkedin_job_id
+            title_key: Normalized "title|company" key
+            minhash: MinHash signature bytes (None for jobs without a description)
+            cluster_id: linkedin_job_id of the first posting of the job's cluster
+            inherited_from: Job whose analysis was copied instead of fetching this one
+        """
+        conn = self._connect()
+        conn.execute("""
+            INSERT OR REPLACE INTO job_fingerprints
+                (linkedin_job_id, title_key, minhash, cluster_id, inherited_from, seq)
+            VALUES (?, ?, ?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM job_fingerprints))
+        """, (str(job_id), title_key, minhash, str(cluster_id), inherited_from))
+        conn.commit()
+        self._release(conn)
+
+    def copy_job_analysis(self, source_id, target_id):
+        """
+        Give a job post the stored analysis and keyword counts of another one.
+
+        Used for reposts: the copy gets the source's description, job criteria,
+        scores and keywords/profile hashes, so later re-scoring treats it like
+        the source. applicant_count and date_time belong to the posting itself
+        and are left empty.
+
+        Returns:
+            bool: False if source_id has no analysis
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            INSERT OR REPLACE INTO job_posts (
+                linkedin_job_id, description, applicant_count, date_time,
+                total_matches, weighted_score, matched_keywords, match_percentage,
+                employment_type, job_function, seniority_level, industries,
+                keywords_hash, profile_hash, counts_seq
+            )
+            SELECT ?, description, NULL, NULL,
+                total_matches, weighted_score, matched_keywords, match_percentage,
+                employment_type, job_function, seniority_level, industries,
+                keywords_hash, profile_hash, {self._NEXT_COUNTS_SEQ}
+            FROM job_posts WHERE linkedin_job_id = ?
+        """, (str(target_id), str(source_id)))
+        copied = cursor.rowcount > 0
+        if copied:
+            cursor.execute("DELETE FROM job_keyword_counts WHERE linkedin_job_id = ?", (str(target_id),))
+            cursor.execute("""
+                INSERT INTO job_keyword_counts (linkedin_job_id, keyword, case_sensitive, count)
+                SELECT ?, keyword, case_sensitive, count
+                FROM job_keyword_counts WHERE linkedin_job_id = ?
+            """, (str(target_id), str(source_id)))
+        conn.commit()
+        self._release(conn)
+        return copied
+
+    def train_description_dictionary(self, sample_size=None, dict_size=None):
+        """
+        Train a zlib dictionary on a random sample of stored descriptions.
+
+        The dictionary is stored in compression_dicts and used for every
+        description written from then on (older ones keep their own).
+
+        Args:
+            sample_size: Descriptions to sample (default from config)
+            dict_size: Dictionary size in bytes (default from config)
+
+        Returns:
+            int: dict_id of the new dictionary, or None if there is nothing to train on
+        """
+        conn = self._connect()
+        rows = conn.execute("""
+            SELECT description FROM job_posts
+            WHERE description IS NOT NULL
+            ORDER BY RANDOM()
+            LIMIT ?
+        """, (sample_size or DESCRIPTION_DICT_SAMPLE,)).fetchall()
+        samples = [self._decode_description(row[0]) for row in rows]
+        zdict = train_dictionary(samples, dict_size or DESCRIPTION_DICT_SIZE)
+        if not zdict:
+            self._release(conn)
+            return None
+        cursor = conn.execute(
+            "INSERT INTO compression_dicts (zdict, sample_size, created_at) VALUES (?, ?, ?)",
+            (zdict, len(samples), datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'))
+        )
+        dict_id = cursor.lastrowid
+        conn.commit()
+        self._release(conn)
+        self._load_codec()
+        return dict_id
+
+    def compress_descriptions(self, batch_size=500, train=True, vacuum=True):
+        """
+        Rewrite every stored description with the newest dictionary.
+
+        Args:
+            batch_size: Rows per write transaction
+            train: Train a new dictionary on the stored descriptions first
+            vacuum: VACUUM afterwards so the file actually shrinks
+
+        Returns:
+            dict: rows, text_bytes (UTF-8), stored_before and stored_after
+            (bytes in the description column), dict_id, file_before, file_after
+        """
+        report = {
+            'rows': 0, 'text_bytes': 0, 'stored_before': 0, 'stored_after': 0,
+            'dict_id': None, 'file_before': self.db_file.stat().st_size, 'file_after': None,
+        }
+        if train:
+            report['dict_id'] = self.train_description_dictionary()
+        report['dict_id'] = report['dict_id'] or self.codec.current_id or None
+
+        last_id = ''
+        while True:
+            conn = self._connect()
+            rows = conn.execute("""
+                SELECT linkedin_job_id, description
+                FROM job_posts
+                WHERE linkedin_job_id > ? AND description IS NOT NULL
+                ORDER BY linkedin_job_id
+                LIMIT ?
+            """, (last_id, batch_size)).fetchall()
+            if not rows:
+                self._release(conn)
+                break
+            updates = []
+            for job_id, stored in rows:
+                text = self._decode_description(stored)
+                encoded = self.codec.encode(text)
+                report['rows'] += 1
+                report['text_bytes'] += len(text.encode('utf-8'))
+                report['stored_before'] += len(stored) if is_compressed(stored) else len(stored.encode('utf-8'))
+                report['stored_after'] += len(encoded) if encoded else 0
+                updates.append((encoded, job_id))
+            conn.executemany("UPDATE job_posts SET description = ? WHERE linkedin_job_id = ?", updates)
+            conn.commit()
+            self._release(conn)
+            last_id = rows[-1][0]
+
+        if vacuum:
+            conn = self._connect()
+            conn.execute("VACUUM")
+            self._release(conn)
+        report['file_after'] = self.db_file.stat().st_size
+        return report
+
+    def get_description_size_stats(self):
+        """
+        Storage used by job_posts.description.
+
+        Returns:
+            dict: rows, compressed_rows, stored_bytes, dictionaries, file_bytes
+        """
+        conn = self._connect()
+        rows, compressed, stored = conn.execute("""
+            SELECT COUNT(description),
+                   SUM(typeof(description) = 'blob'),
+                   SUM(LENGTH(CAST(description AS BLOB)))
+            FROM job_posts
+        """).fetchone()
+        dictionaries = conn.execute("SELECT COUNT(*) FROM compression_dicts").fetchone()[0]
+        self._release(conn)
+        return {
+            'rows': rows,
+            'compressed_rows': compressed or 0,
+            'stored_bytes': stored or 0,
+            'dictionaries': dictionaries,
+            'file_bytes': self.db_file.stat().st_size,
+        }
+
+    def update_job_scores(self, scores, profile_hash=None):
+        """
+        Overwrite keyword scores of existing job posts in one transaction.
+
+        Args:
+            scores: Iterable of (linkedin_job_id, total_matches, weighted_score,
+                matched_keywords list, match_percentage)
+            profile_hash: Keyword profile the scores were computed for
+
+        Returns:
+            int: Number of job_posts rows updated
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.executemany("""
+            UPDATE job_posts SET
+                total_matches = ?, weighted_score = ?, matched_keywords = ?, match_percentage = ?,
+                profile_hash = ?
+            WHERE linkedin_job_id = ?
+        """, [
+            (total, score, ','.join(matched), percentage, profile_hash, job_id)
+            for job_id, total, score, matched, percentage in scores
+        ])
+        updated = cursor.rowcount
+
+        conn.commit()
+        self._release(conn)
+        return updated
+
+    def update_job_post_details(self, details_by_id):
+        """
+        Overwrite scraped detail fields of existing job posts.
+
+        Args:
+            details_by_id: dict {linkedin_job_id: details dict from DetailScraper}
+
+        Returns:
+            int: Number of job_posts rows updated
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.executemany("""
+            UPDATE job_posts SET
+                description = ?, applicant_count = ?, employment_type = ?,
+                job_function = ?, seniority_level = ?, industries = ?,
+                keywords_hash = NULL, profile_hash = NULL
+            WHERE linkedin_job_id = ?
+        """, [
+            (
+                self._encode_description(d.get('description')), d.get('applicant_count'), d.get('employment_type'),
+                d.get('job_function'), d.get('seniority_level'), d.get('industries'),
+                job_id,
+            )
+            for job_id, d in details_by_id.items()
+        ])
+        updated = cursor.rowcount
+
+        conn.commit()
+        self._release(conn)
+        return updated
+
+    def update_search_listings(self, jobs):
+        """
+        Overwrite listing fields of stored search results from freshly extracted jobs.
+
+        Args:
+            jobs: Iterable of Job objects (rows are matched on linkedin_job_id)
+
+        Returns:
+            int: Number of job_searches rows updated
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.executemany("""
+            UPDATE job_searches SET
+                title = ?, company = ?, location = ?,
+                company_url = COALESCE(?, company_url)
+            WHERE linkedin_job_id = ?
+        """, [
+            (job.title, job.company, job.location, job.company_url, job.linkedin_job_id)
+            for job in jobs if job.linkedin_job_id
+        ])
+        updated = cursor.rowcount
+
+        conn.commit()
+        self._release(conn)
+        return updated
 
     def get_analyzed_jobs(self, min_score=0, min_keywords=0,
-                          order_by='weighted_score DESC', limit=None):
-        """Get analyzed jobs with optional filtering."""
-        conn = sqlite3.connect(self.db_file)
+                          order_by='weighted_score DESC', limit=None, include_description=True):
+        """
+        Get analyzed jobs with optional filtering.
+
+        Args:
+            include_description: Also read and decompress each description
+        """
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
-        query = """
+        query = f"""
             SELECT
                 jp.linkedin_job_id, js.title, js.company, js.location,
-                jp.description, jp.applicant_count, jp.date_time,
+                {"jp.description," if include_description else ""} jp.applicant_count, jp.date_time,
                 jp.employment_type, jp.job_function, jp.seniority_level,
                 jp.industries, jp.total_matches, jp.weighted_score,
                 jp.matched_keywords, jp.match_percentage
@@ -286,11 +1221,13 @@ class SQLiteStorage:
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
+        self._release(conn)
 
         results = []
         for row in rows:
             result = dict(row)
+            if include_description:
+                result['description'] = self._decode_description(result['description'])
             if result.get('matched_keywords'):
                 result['matched_keywords'] = result['matched_keywords'].split(',')
             results.append(result)
@@ -299,7 +1236,7 @@ class SQLiteStorage:
 
     def get_analysis_stats(self):
         """Get statistics about analyzed jobs."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -312,7 +1249,7 @@ class SQLiteStorage:
         """)
 
         row = cursor.fetchone()
-        conn.close()
+        self._release(conn)
 
         return {
             'total_analyzed': row[0],
@@ -323,7 +1260,7 @@ class SQLiteStorage:
 
     def get_job_summary(self, min_score=0, limit=None, unique=False, days=7):
         """Get job summary from the combined view."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -342,7 +1279,7 @@ class SQLiteStorage:
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
+        self._release(conn)
 
         return [dict(row) for row in rows]
 
@@ -377,33 +1314,60 @@ class SQLiteStorage:
 
     def add_blacklisted_company(self, company):
         """Add a company to the blacklist (idempotent)."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute(
             "INSERT OR IGNORE INTO blacklisted_companies (company) VALUES (?)",
             (company,)
         )
         conn.commit()
-        conn.close()
+        self._release(conn)
+
+    def record_prefetch_drops(self, drops):
+        """
+        Remember jobs the prefetch filter dropped.
+
+        Args:
+            drops: Iterable of (linkedin_job_id, reason)
+
+        Returns:
+            set: IDs of the jobs not recorded before
+        """
+        drops = list(drops)
+        if not drops:
+            return set()
+        dropped_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        conn = self._connect()
+        new_ids = set()
+        for job_id, reason in drops:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO prefetch_drops (linkedin_job_id, reason, dropped_at) VALUES (?, ?, ?)",
+                (job_id, reason, dropped_at)
+            )
+            if cursor.rowcount:
+                new_ids.add(job_id)
+        conn.commit()
+        self._release(conn)
+        return new_ids
 
     def remove_blacklisted_company(self, company):
         """Remove a company from the blacklist."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute(
             "DELETE FROM blacklisted_companies WHERE company = ?",
             (company,)
         )
         conn.commit()
-        conn.close()
+        self._release(conn)
 
     def get_blacklisted_companies(self):
         """Return a sorted list of blacklisted company names."""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute(
             "SELECT company FROM blacklisted_companies ORDER BY company ASC"
         )
         rows = cursor.fetchall()
-        conn.close()
+        self._release(conn)
         return [r[0] for r in rows]
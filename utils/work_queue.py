@@ -0,0 +1,248 @@
+"""Durable SQLite work queue of job detail pages to fetch and analyze."""
+import os
+import socket
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from config.keyword_settings import (
+    FETCH_PRIORITY_AGING_PER_HOUR,
+    DETAIL_QUEUE_BATCH_SIZE,
+    DETAIL_QUEUE_LEASE_SECONDS,
+    DETAIL_QUEUE_MAX_ATTEMPTS,
+    DETAIL_QUEUE_RETRY_DELAY,
+)
+
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def _timestamp(offset_seconds=0):
+    moment = datetime.now(timezone.utc) + timedelta(seconds=offset_seconds)
+    return moment.strftime(TIMESTAMP_FORMAT)
+
+
+def default_owner():
+    """Lease owner name for this process (host:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class DetailWorkQueue:
+    """Queue table (detail_queue) in the jobs database with leased claims.
+
+    States: pending -> leased -> done, or back to pending (with a growing
+    retry delay) on nack, or failed after max_attempts. A worker that dies
+    holding a lease loses it when the lease expires, so its jobs are
+    claimed again by the next worker. Claims run in an IMMEDIATE
+    transaction, so any number of processes (or hosts sharing the file)
+    can drain the queue without handing out a job twice.
+
+    Jobs are claimed highest priority first, where priority is the score
+    predicted at enqueue time plus aging_per_hour for every hour queued.
+    """
+
+    def __init__(self, storage, lease_seconds=None, max_attempts=None, retry_delay=None,
+                 aging_per_hour=None):
+        """
+        Initialize the queue.
+
+        Args:
+            storage: SQLiteStorage whose database holds the queue
+            lease_seconds: Seconds a claim is held before it expires (default from config)
+            max_attempts: Claims per job before it is marked failed (default from config)
+            retry_delay: Seconds before the first retry, doubled per attempt (default from config)
+            aging_per_hour: Priority a queued job gains per hour of waiting (default from config)
+        """
+        self.storage = storage
+        self.db_file = storage.db_file
+        self.lease_seconds = lease_seconds or DETAIL_QUEUE_LEASE_SECONDS
+        self.max_attempts = max_attempts or DETAIL_QUEUE_MAX_ATTEMPTS
+        self.retry_delay = DETAIL_QUEUE_RETRY_DELAY if retry_delay is None else retry_delay
+        self.aging_per_hour = FETCH_PRIORITY_AGING_PER_HOUR if aging_per_hour is None else aging_per_hour
+        self._ensure_table()
+
+    def _connect(self):
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+        return sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+
+    def _ensure_table(self):
+        conn = self._connect()
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS detail_queue (
+            linkedin_job_id TEXT PRIMARY KEY,
+            title TEXT,
+            company TEXT,
+            state TEXT NOT NULL DEFAULT 'pending',
+            lease_owner TEXT,
+            lease_expires_at TIMESTAMP,
+            available_at TIMESTAMP,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            enqueued_at TIMESTAMP,
+            updated_at TIMESTAMP,
+            priority REAL NOT NULL DEFAULT 0
+        )
+        """)
+        # Queues created before fetch priorities
+        if 'priority' not in {row[1] for row in conn.execute("PRAGMA table_info(detail_queue)")}:
+            conn.execute("ALTER TABLE detail_queue ADD COLUMN priority REAL NOT NULL DEFAULT 0")
+        conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_detail_queue_state
+        ON detail_queue(state, available_at)
+        """)
+        conn.close()
+
+    def enqueue(self, jobs, priority=None):
+        """
+        Add jobs to the queue (jobs already queued are left as they are).
+
+        Args:
+            jobs: Iterable of dicts with linkedin_job_id, title and company
+            priority: Optional FetchPriority predicting each job's score
+
+        Returns:
+            int: Number of jobs added
+        """
+        now = _timestamp()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        before = conn.total_changes
+        conn.executemany("""
+            INSERT INTO detail_queue (
+                linkedin_job_id, title, company, available_at, enqueued_at, updated_at, priority
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(linkedin_job_id) DO NOTHING
+        """, [
+            (
+                job['linkedin_job_id'], job.get('title'), job.get('company'), now, now, now,
+                priority.predict(job) if priority is not None else 0,
+            )
+            for job in jobs
+        ])
+        added = conn.total_changes - before
+        conn.execute("COMMIT")
+        conn.close()
+        return added
+
+    def enqueue_backlog(self, priority=None, prefetch_filter=None):
+        """
+        Queue every job still waiting for analysis (see get_jobs_without_analysis).
+
+        Args:
+            priority: Optional FetchPriority predicting each job's score
+            prefetch_filter: Optional PrefetchFilter; jobs it drops are not queued
+
+        Returns:
+            int: Number of jobs added
+        """
+        jobs = self.storage.get_jobs_without_analysis()
+        if prefetch_filter is not None:
+            jobs = prefetch_filter.apply(jobs, self.storage)
+        return self.enqueue(jobs, priority=priority)
+
+    def claim(self, owner, batch_size=None):
+        """
+        Atomically lease a batch of available jobs.
+
+        Pending jobs whose retry delay has passed and leased jobs whose lease
+        expired are both claimable, highest aged priority first. Each claim
+        counts as an attempt.
+
+        Args:
+            owner: Lease owner name (see default_owner)
+            batch_size: Maximum jobs to claim (default from config)
+
+        Returns:
+            list[dict] with linkedin_job_id, title, company and attempts
+        """
+        now = _timestamp()
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        conn.execute("BEGIN IMMEDIATE")
+        rows = conn.execute("""
+            SELECT linkedin_job_id, title, company, attempts
+            FROM detail_queue
+            WHERE (state = 'pending' AND available_at <= ?)
+               OR (state = 'leased' AND lease_expires_at <= ?)
+            ORDER BY priority + ? * (julianday(?) - julianday(enqueued_at)) * 24 DESC, linkedin_job_id
+            LIMIT ?
+        """, (now, now, self.aging_per_hour, now, batch_size or DETAIL_QUEUE_BATCH_SIZE)).fetchall()
+
+        jobs = [dict(row, attempts=row['attempts'] + 1) for row in rows]
+        conn.executemany("""
+            UPDATE detail_queue
+            SET state = 'leased', lease_owner = ?, lease_expires_at = ?,
+                attempts = attempts + 1, updated_at = ?
+            WHERE linkedin_job_id = ?
+        """, [
+            (owner, _timestamp(self.lease_seconds), now, job['linkedin_job_id'])
+            for job in jobs
+        ])
+        conn.execute("COMMIT")
+        conn.close()
+        return jobs
+
+    def ack(self, owner, job_id):
+        """
+        Mark a leased job done.
+
+        Returns:
+            bool: False if the lease had expired and was taken by another owner
+        """
+        conn = self._connect()
+        cursor = conn.execute("""
+            UPDATE detail_queue
+            SET state = 'done', lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+            WHERE linkedin_job_id = ? AND lease_owner = ? AND state = 'leased'
+        """, (_timestamp(), job_id, owner))
+        conn.close()
+        return cursor.rowcount == 1
+
+    def nack(self, owner, job_id, error=None):
+        """
+        Give a leased job back after a failed attempt.
+
+        The job becomes claimable again after retry_delay * 2^(attempts - 1)
+        seconds, or is marked failed once it used max_attempts.
+
+        Returns:
+            bool or None: True if the job will be retried, False if it is now
+            failed, None if the lease had expired and was taken by another owner
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT attempts FROM detail_queue WHERE linkedin_job_id = ? AND lease_owner = ? AND state = 'leased'",
+            (job_id, owner)
+        ).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            conn.close()
+            return None
+        attempts = row[0]
+        retry = attempts < self.max_attempts
+
+        conn.execute("""
+            UPDATE detail_queue
+            SET state = ?, lease_owner = NULL, lease_expires_at = NULL,
+                available_at = ?, last_error = ?, updated_at = ?
+            WHERE linkedin_job_id = ? AND lease_owner = ? AND state = 'leased'
+        """, (
+            'pending' if retry else 'failed',
+            _timestamp(self.retry_delay * 2 ** (attempts - 1)),
+            error,
+            _timestamp(),
+            job_id,
+            owner,
+        ))
+        conn.execute("COMMIT")
+        conn.close()
+        return retry
+
+    def get_stats(self):
+        """Count jobs per state."""
+        conn = self._connect()
+        rows = conn.execute("SELECT state, COUNT(*) FROM detail_queue GROUP BY state").fetchall()
+        conn.close()
+        stats = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        stats.update(dict(rows))
+        return stats